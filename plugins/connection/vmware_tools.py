@@ -15,8 +15,13 @@ DOCUMENTATION = r'''
       - Use VMware tools to run tasks in, or put/fetch files to guest operating systems running in VMware infrastructure.
       - In case of Windows VMs, set C(ansible_shell_type) to C(powershell).
       - Does not work with C(become).
+      - With pipelining, the module payload is staged in the temporary directory of the command and fed to the interpreter on its
+        standard input, instead of creating a remote temporary directory and copying the module with separate commands.
+        Pipelining is not supported for Windows guests.
     requirements:
       - requests (Python library)
+    extends_documentation_fragment:
+      - connection_pipelining
     options:
       vmware_host:
         description:
@@ -109,7 +114,8 @@ DOCUMENTATION = r'''
         required: true
       exec_command_sleep_interval:
         description:
-          - Time in seconds to sleep between execution of command.
+          - Maximum time in seconds to sleep between two checks whether a command has finished.
+          - The first checks are made after 0.1 seconds, the interval then doubles up to this value.
         vars:
           - name: ansible_vmware_tools_exec_command_sleep_interval
         default: 0.5
@@ -134,6 +140,25 @@ DOCUMENTATION = r'''
         vars:
             - name: ansible_executable
             - name: ansible_vmware_tools_executable
+      reuse_session:
+        description:
+          - Keep the vCenter session open at the end of a task and resume it in the next tasks, and the next runs,
+            for the same O(vmware_host), O(vmware_port), O(vmware_user) and O(vmware_password) instead of logging in for every task.
+          - The session cookie is stored in a file only readable by the current user in O(session_cache_dir).
+          - "The session is logged out by a C(meta: reset_connection) task, otherwise it ends when it times out on the server."
+        vars:
+          - name: ansible_vmware_tools_reuse_session
+        default: false
+        type: bool
+        version_added: '6.3.0'
+      session_cache_dir:
+        description:
+          - Directory where the sessions are stored with O(reuse_session=true).
+        vars:
+          - name: ansible_vmware_tools_session_cache_dir
+        default: ~/.ansible/vmware_tools
+        type: path
+        version_added: '6.3.0'
 '''
 
 example = r'''
@@ -205,10 +230,15 @@ ansible_shell_type: powershell
         state: absent
 '''
 
+import hashlib
+import json
+import os
 import re
+import tempfile
 from os.path import exists, getsize
 from socket import gaierror
 from ssl import SSLError
+from threading import Thread
 from time import sleep
 import traceback
 
@@ -235,21 +265,25 @@ from ansible.errors import AnsibleError, AnsibleFileNotFound, AnsibleConnectionF
 from ansible.module_utils.common.text.converters import to_bytes, to_native
 from ansible.plugins.connection import ConnectionBase
 from ansible.module_utils.basic import missing_required_lib
+from ansible.utils.display import Display
 
 try:
-    from pyVim.connect import Disconnect, SmartConnect
-    from pyVmomi import vim, vmodl
+    from pyVim.connect import Disconnect, SmartConnect, getSslContext
+    from pyVmomi import vim, vmodl, SoapStubAdapter
 
     HAS_PYVMOMI = True
 except ImportError:
     HAS_PYVMOMI = False
     PYVMOMI_IMP_ERR = traceback.format_exc()
 
+display = Display()
+
 
 class Connection(ConnectionBase):
     """VMware Tools Connection."""
 
     transport = 'community.vmware.vmware_tools'
+    has_pipelining = True
 
     @property
     def vmware_host(self):
@@ -279,7 +313,9 @@ class Connection(ConnectionBase):
     @property
     def windowsGuest(self):
         """Return if VM guest family is windows."""
-        return self.vm.guest.guestFamily == "windowsGuest"
+        if self._windows_guest is None:
+            self._windows_guest = self.vm.guest.guestFamily == "windowsGuest"
+        return self._windows_guest
 
     def __init__(self, *args, **kwargs):
         """init."""
@@ -291,8 +327,70 @@ class Connection(ConnectionBase):
             self.has_pipelining = False
             self.allow_extras = True
         self._si = None
+        self._windows_guest = None
+        self._cleanup_threads = []
+        self._http_session = None
+
+    @property
+    def http_session(self):
+        """HTTP session shared by the file transfers, reusing the connections to the ESXi host."""
+        if self._http_session is None:
+            self._http_session = requests.Session()
+            self._http_session.verify = self.validate_certs
+        return self._http_session
+
+    @property
+    def _session_file(self):
+        # a session logged in with other credentials must not be resumed
+        password_hash = hashlib.sha256(to_bytes(self.get_option("vmware_password"))).hexdigest()
+        key = "%s:%s:%s:%s" % (self.vmware_host, self.get_option("vmware_port"), self.get_option("vmware_user"), password_hash)
+        return os.path.join(self.get_option("session_cache_dir"), hashlib.sha256(to_bytes(key)).hexdigest())
+
+    def _resume_session(self):
+        """Resume the session stored by a previous task, returns None if there is no valid one."""
+        try:
+            with open(self._session_file) as fd:
+                session = json.load(fd)
+            if not self.validate_certs and HAS_URLLIB3:
+                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            # the same SSL context as SmartConnect() builds for a new session
+            stub = SoapStubAdapter(host=self.vmware_host, port=self.get_option("vmware_port"), version=session["version"],
+                                   sslContext=getSslContext(self.vmware_host, None, not self.validate_certs))
+            stub.cookie = session["cookie"]
+            service_instance = vim.ServiceInstance("ServiceInstance", stub)
+            if service_instance.content.sessionManager.currentSession is None:
+                return None
+        except Exception:
+            return None
+        return service_instance
+
+    def _save_session(self):
+        session_dir = os.path.dirname(self._session_file)
+        try:
+            if not os.path.isdir(session_dir):
+                os.makedirs(session_dir, mode=0o700)
+            # mkstemp creates the file readable by the current user only
+            fd, tmp_path = tempfile.mkstemp(dir=session_dir)
+            with os.fdopen(fd, "w") as session_file:
+                json.dump(dict(cookie=self._si._stub.cookie, version=self._si._stub.version), session_file)
+            os.rename(tmp_path, self._session_file)
+        except (IOError, OSError) as e:
+            display.vvv("Unable to store the vCenter session in %s: %s" % (session_dir, to_native(e)))
+
+    def _forget_session(self):
+        try:
+            os.remove(self._session_file)
+        except OSError:
+            pass
+        if self._si is not None:
+            Disconnect(self._si)
 
     def _establish_connection(self):
+        if self.get_option("reuse_session"):
+            self._si = self._resume_session()
+            if self._si is not None:
+                return
+
         connection_kwargs = {
             "host": self.vmware_host,
             "user": self.get_option("vmware_user"),
@@ -314,6 +412,9 @@ class Connection(ConnectionBase):
         except vim.fault.InvalidLogin as e:
             raise AnsibleError("Connection Login Error: %s" % to_native(e.msg))
 
+        if self.get_option("reuse_session"):
+            self._save_session()
+
     def _establish_vm(self, check_vm_credentials=True):
         searchIndex = self._si.content.searchIndex
         self.vm = None
@@ -373,14 +474,26 @@ class Connection(ConnectionBase):
         """Close connection."""
         super(Connection, self).close()
 
-        Disconnect(self._si)
+        for thread in self._cleanup_threads:
+            thread.join()
+        self._cleanup_threads = []
+
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
+
+        # with reuse_session the session is kept open for the next tasks
+        if not self.get_option("reuse_session"):
+            Disconnect(self._si)
         self._connected = False
 
     def reset(self):
         """Reset the connection to vcenter."""
         # TODO: Fix persistent connection implementation currently ansible creates new connections to vcenter for each task
         # therefore we're currently closing a non existing connection here and establish a connection just for being thrown away
-        # right afterwards.
+        # right afterwards. With reuse_session, tasks resume a stored session instead, which is logged out here.
+        if self.get_option("reuse_session"):
+            self._forget_session()
         self.close()
         self._connect(check_vm_credentials=False)
 
@@ -402,6 +515,27 @@ class Connection(ConnectionBase):
         except vim.fault.GuestOperationsUnavailable:
             raise AnsibleConnectionFailure("Cannot connect to guest. Native error: GuestOperationsUnavailable")
 
+    def create_temporary_directory_in_guest(self, prefix="", suffix=""):
+        """Create a temporary directory in the VM."""
+        try:
+            return self.fileManager.CreateTemporaryDirectoryInGuest(vm=self.vm, auth=self.vm_auth, prefix=prefix, suffix=suffix)
+        except vim.fault.NoPermission as e:
+            raise AnsibleError("No Permission Error: %s %s" % (to_native(e.msg), to_native(e.privilegeId)))
+        except vmodl.fault.SystemError as e:
+            if e.reason == 'vix error codes = (3016, 0).\n':
+                raise AnsibleConnectionFailure(
+                    "Connection failed, is the vm currently rebooting? Reason: %s" % (
+                        to_native(e.reason)
+                    )
+                )
+            else:
+                raise AnsibleConnectionFailure("Connection failed. Reason %s" % (to_native(e.reason)))
+        except vim.fault.GuestOperationsUnavailable:
+            raise AnsibleConnectionFailure("Cannot connect to guest. Native error: GuestOperationsUnavailable")
+
+    def _get_guest_path(self, directory, name):
+        return "%s%s%s" % (directory, "\\" if self.windowsGuest else "/", name)
+
     def _get_program_spec_program_path_and_arguments(self, cmd):
         if self.windowsGuest:
             '''
@@ -417,11 +551,13 @@ class Connection(ConnectionBase):
 
         return program_path, arguments
 
-    def _get_guest_program_spec(self, cmd, stdout, stderr):
+    def _get_guest_program_spec(self, cmd, stdout, stderr, stdin=None):
         guest_program_spec = vim.GuestProgramSpec()
 
         program_path, arguments = self._get_program_spec_program_path_and_arguments(cmd)
 
+        if stdin:
+            arguments += " < %s" % stdin
         arguments += " 1> %s 2> %s" % (stdout, stderr)
 
         guest_program_spec.programPath = program_path
@@ -483,7 +619,7 @@ class Connection(ConnectionBase):
             raise AnsibleConnectionFailure("Cannot connect to guest. Native error: GuestOperationsUnavailable")
 
         url = self._fix_url_for_hosts(fileTransferInformation.url)
-        response = requests.get(url, verify=self.validate_certs, stream=True)
+        response = self.http_session.get(url, stream=True)
 
         if response.status_code != 200:
             raise AnsibleError("Failed to fetch file")
@@ -508,14 +644,39 @@ class Connection(ConnectionBase):
         except vim.fault.GuestOperationsUnavailable:
             raise AnsibleConnectionFailure("Cannot connect to guest. Native error: GuestOperationsUnavailable")
 
+    def _delete_directory_in_guest(self, directoryPath):
+        """Delete a temporary directory from VM, failures are only logged as nothing waits for the cleanup."""
+        try:
+            self.fileManager.DeleteDirectoryInGuest(vm=self.vm, auth=self.vm_auth, directoryPath=directoryPath, recursive=True)
+        except Exception as e:
+            display.vvv("Unable to delete %s in guest: %s" % (directoryPath, to_native(e)))
+
+    def _wait_for_process(self, pid):
+        """Poll the process until it ends, backing off up to exec_command_sleep_interval between checks."""
+        max_interval = self.get_option("exec_command_sleep_interval")
+        interval = min(0.1, max_interval)
+        pid_info = self._get_pid_info(pid)
+        while pid_info.endTime is None:
+            sleep(interval)
+            interval = min(interval * 2, max_interval)
+            pid_info = self._get_pid_info(pid)
+        return pid_info
+
     def exec_command(self, cmd, in_data=None, sudoable=True):
         """Execute command."""
         super(Connection, self).exec_command(cmd, in_data=in_data, sudoable=sudoable)
 
-        stdout = self.create_temporary_file_in_guest(suffix=".stdout")
-        stderr = self.create_temporary_file_in_guest(suffix=".stderr")
+        output_dir = self.create_temporary_directory_in_guest(prefix="ansible-vmware-tools-")
+        stdout = self._get_guest_path(output_dir, "stdout")
+        stderr = self._get_guest_path(output_dir, "stderr")
+
+        stdin = None
+        if in_data is not None:
+            # pipelining, stage the module payload next to the output of the command
+            stdin = self._get_guest_path(output_dir, "stdin")
+            self._put_data_to_vm(in_data, stdin, len(in_data))
 
-        guest_program_spec = self._get_guest_program_spec(cmd, stdout, stderr)
+        guest_program_spec = self._get_guest_program_spec(cmd, stdout, stderr, stdin)
 
         try:
             pid = self.processManager.StartProgramInGuest(vm=self.vm, auth=self.vm_auth, spec=guest_program_spec)
@@ -535,19 +696,17 @@ class Connection(ConnectionBase):
         except vim.fault.GuestOperationsUnavailable:
             raise AnsibleConnectionFailure("Cannot connect to guest. Native error: GuestOperationsUnavailable")
 
-        pid_info = self._get_pid_info(pid)
-
-        while pid_info.endTime is None:
-            sleep(self.get_option("exec_command_sleep_interval"))
-            pid_info = self._get_pid_info(pid)
+        pid_info = self._wait_for_process(pid)
 
-        stdout_response = self._fetch_file_from_vm(stdout)
-        self.delete_file_in_guest(stdout)
+        stdout_text = self._fetch_file_from_vm(stdout).text
+        stderr_text = self._fetch_file_from_vm(stderr).text
 
-        stderr_response = self._fetch_file_from_vm(stderr)
-        self.delete_file_in_guest(stderr)
+        # the output is not needed any more, remove it while the next command runs
+        cleanup = Thread(target=self._delete_directory_in_guest, args=(output_dir,))
+        cleanup.start()
+        self._cleanup_threads.append(cleanup)
 
-        return pid_info.exitCode, stdout_response.text, stderr_response.text
+        return pid_info.exitCode, stdout_text, stderr_text
 
     def fetch_file(self, in_path, out_path):
         """Fetch file."""
@@ -566,9 +725,14 @@ class Connection(ConnectionBase):
         if not exists(to_bytes(in_path, errors="surrogate_or_strict")):
             raise AnsibleFileNotFound("file or module does not exist: '%s'" % to_native(in_path))
 
+        # file size of 'in_path' must be greater than 0
+        with open(in_path, "rb") as fd:
+            self._put_data_to_vm(fd, out_path, getsize(in_path))
+
+    def _put_data_to_vm(self, data, guestFilePath, fileSize):
         try:
             put_url = self.fileManager.InitiateFileTransferToGuest(
-                vm=self.vm, auth=self.vm_auth, guestFilePath=out_path, fileAttributes=vim.GuestFileAttributes(), fileSize=getsize(in_path), overwrite=True
+                vm=self.vm, auth=self.vm_auth, guestFilePath=guestFilePath, fileAttributes=vim.GuestFileAttributes(), fileSize=fileSize, overwrite=True
             )
         except vim.fault.NoPermission as e:
             raise AnsibleError("No Permission Error: %s %s" % (to_native(e.msg), to_native(e.privilegeId)))
@@ -586,9 +750,7 @@ class Connection(ConnectionBase):
 
         url = self._fix_url_for_hosts(put_url)
 
-        # file size of 'in_path' must be greater than 0
-        with open(in_path, "rb") as fd:
-            response = requests.put(url, verify=self.validate_certs, data=fd)
+        response = self.http_session.put(url, data=data)
 
         if response.status_code != 200:
             raise AnsibleError("File transfer failed")
@@ -133,6 +133,24 @@ DOCUMENTATION = r"""
                 - Also, transforms property name to snake case.
             type: bool
             default: false
+        max_workers:
+            description:
+            - Maximum number of threads used to look up the containers given in O(resources) and to retrieve
+              the ESXi hosts of these containers concurrently, one retrieval per container.
+            - The requests share the session of the plugin, V(1) looks up one container at a time.
+            - With more than one container and a value above V(1), all pages of a container are held in memory
+              until they are processed.
+            type: int
+            default: 1
+            version_added: '6.3.0'
+        page_size:
+            description:
+            - Maximum number of ESXi hosts retrieved from the vCenter in one page.
+            - Each page is processed and released before the next one is retrieved, which bounds the memory used
+              by the plugin on large environments, especially with O(properties=[all]).
+            type: int
+            default: 1000
+            version_added: '6.3.0'
         proxy_host:
           description:
           - Address of a proxy that will receive all HTTPS requests and relay them.
@@ -189,12 +207,6 @@ EXAMPLES = r"""
         ansible_connection: "'ssh'"
 """
 
-try:
-    from com.vmware.vapi.std_client import DynamicID
-except ImportError:
-    # Already handled in module_utils/inventory.py
-    pass
-
 try:
     from pyVmomi import vim
 except ImportError:
@@ -207,8 +219,10 @@ from ansible.module_utils.common.dict_transformations import camel_dict_to_snake
 from ansible_collections.community.vmware.plugins.plugin_utils.inventory import (
     to_nested_dict,
     to_flatten_dict,
+    TagResolver,
 )
 from ansible_collections.community.vmware.plugins.inventory.vmware_vm_inventory import BaseVMwareInventory
+from ansible_collections.community.vmware.plugins.module_utils.vmware import InventoryPathIndex
 from ansible.plugins.inventory import BaseInventoryPlugin, Constructable, Cacheable
 from ansible.parsing.yaml.objects import AnsibleVaultEncryptedUnicode
 
@@ -274,7 +288,8 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             with_tags=self.get_option("with_tags"),
             validate_certs=self.get_option("validate_certs"),
             http_proxy_host=self.get_option("proxy_host"),
-            http_proxy_port=self.get_option("proxy_port")
+            http_proxy_port=self.get_option("proxy_port"),
+            max_workers=self.get_option("max_workers"),
         )
 
         self.pyv.do_login()
@@ -328,102 +343,103 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
                 host_properties.append("runtime.connectionState")
             query_props = [x for x in host_properties if x != "customValue"]
 
-        objects = self.pyv.get_managed_objects_properties(
+        # Paths are built from the parent of every host and an index of all inventory containers
+        path_index = None
+        hide_parent = False
+        if self.get_option("with_path"):
+            path_index = InventoryPathIndex(self.pyv.content)
+            if query_props is not None and "parent" not in query_props:
+                query_props.append("parent")
+                hide_parent = True
+
+        pages = self.pyv.iter_managed_objects_properties(
             vim_type=vim.HostSystem,
             properties=query_props,
             resources=self.get_option("resources"),
             strict=strict,
+            page_size=self.get_option("page_size"),
         )
 
-        tags_info = dict()
+        tag_resolver = None
         if self.pyv.with_tags:
-            tag_svc = self.pyv.rest_content.tagging.Tag
-            cat_svc = self.pyv.rest_content.tagging.Category
-
-            tags = tag_svc.list()
-            for tag in tags:
-                tag_obj = tag_svc.get(tag)
-                tags_info[tag_obj.id] = (
-                    tag_obj.name,
-                    cat_svc.get(tag_obj.category_id).name,
-                )
+            tag_resolver = TagResolver(self.pyv.rest_content)
 
         hostnames = self.get_option("hostnames")
 
-        for host_obj in objects:
-            properties = dict()
-            for host_obj_property in host_obj.propSet:
-                properties[host_obj_property.name] = host_obj_property.val
-
-            if (
-                properties.get("runtime.connectionState")
-                or properties["runtime"].connectionState
-            ) in ("disconnected", "notResponding"):
-                continue
-
-            # Custom values
-            if "customValue" in host_properties:
-                field_mgr = []
-                if self.pyv.content.customFieldsManager:  # not an ESXi
-                    field_mgr = self.pyv.content.customFieldsManager.field
-                for cust_value in host_obj.obj.customValue:
-                    properties[
-                        [y.name for y in field_mgr if y.key == cust_value.key][0]
-                    ] = cust_value.value
-
-            # Tags
-            if self.pyv.with_tags:
-                properties["tags"] = []
-                properties["categories"] = []
-                properties["tag_category"] = {}
-
-            if tags_info:
-                # Add virtual machine to appropriate tag group
-                host_mo_id = host_obj.obj._GetMoId()  # pylint: disable=protected-access
-                host_dynamic_id = DynamicID(type="HostSystem", id=host_mo_id)
-                tag_association = self.pyv.rest_content.tagging.TagAssociation
-                for tag_id in tag_association.list_attached_tags(host_dynamic_id):
-                    if tag_id not in tags_info:
-                        # Ghost Tags
-                        continue
-                    # Add tags related to VM
-                    properties["tags"].append(tags_info[tag_id][0])
-                    # Add categories related to VM
-                    properties["categories"].append(tags_info[tag_id][1])
-                    # Add tag and categories related to VM
-                    if tags_info[tag_id][1] not in properties["tag_category"]:
-                        properties["tag_category"][tags_info[tag_id][1]] = []
-                    properties["tag_category"][tags_info[tag_id][1]].append(
-                        tags_info[tag_id][0]
-                    )
-
-            # Path
-            with_path = self.get_option("with_path")
-            if with_path:
-                path = []
-                parent = host_obj.obj.parent
-                while parent:
-                    path.append(parent.name)
-                    parent = parent.parent
-                path.reverse()
-                properties["path"] = "/".join(path)
-
-            host_properties = to_nested_dict(properties)
-
-            # Check if we can add host as per filters
-            host_filters = self.get_option("filters")
-            if not self._can_add_host(host_filters, host_properties, strict=strict):
-                continue
-
-            host = self._get_hostname(host_properties, hostnames, strict=strict)
-
-            if host not in hostvars:
-                hostvars[host] = host_properties
-                self._populate_host_properties(host_properties, host)
-                self.inventory.set_variable(
-                    host, "ansible_host", self.get_management_ip(host_obj.obj)
+        for objects in pages:
+            attached_tags = dict()
+            if tag_resolver:
+                attached_tags = tag_resolver.get_attached_tags(
+                    "HostSystem",
+                    [host_obj.obj._GetMoId() for host_obj in objects],  # pylint: disable=protected-access
                 )
 
+            for host_obj in objects:
+                properties = dict()
+                host_parent = None
+                for host_obj_property in host_obj.propSet:
+                    if host_obj_property.name == "parent":
+                        host_parent = host_obj_property.val
+                        if hide_parent:
+                            continue
+                    properties[host_obj_property.name] = host_obj_property.val
+
+                if (
+                    properties.get("runtime.connectionState")
+                    or properties["runtime"].connectionState
+                ) in ("disconnected", "notResponding"):
+                    continue
+
+                # Custom values
+                if "customValue" in host_properties:
+                    field_mgr = []
+                    if self.pyv.content.customFieldsManager:  # not an ESXi
+                        field_mgr = self.pyv.content.customFieldsManager.field
+                    for cust_value in host_obj.obj.customValue:
+                        properties[
+                            [y.name for y in field_mgr if y.key == cust_value.key][0]
+                        ] = cust_value.value
+
+                # Tags
+                if self.pyv.with_tags:
+                    properties["tags"] = []
+                    properties["categories"] = []
+                    properties["tag_category"] = {}
+
+                if attached_tags:
+                    # Add virtual machine to appropriate tag group
+                    host_mo_id = host_obj.obj._GetMoId()  # pylint: disable=protected-access
+                    for tag_name, category_name in attached_tags[host_mo_id]:
+                        # Add tags related to VM
+                        properties["tags"].append(tag_name)
+                        # Add categories related to VM
+                        properties["categories"].append(category_name)
+                        # Add tag and categories related to VM
+                        if category_name not in properties["tag_category"]:
+                            properties["tag_category"][category_name] = []
+                        properties["tag_category"][category_name].append(tag_name)
+
+                # Path
+                if path_index:
+                    path = path_index.lineage(host_parent) if host_parent else ()
+                    properties["path"] = "/".join(path_index.name(item) for item in path)
+
+                host_properties = to_nested_dict(properties)
+
+                # Check if we can add host as per filters
+                host_filters = self.get_option("filters")
+                if not self._can_add_host(host_filters, host_properties, strict=strict):
+                    continue
+
+                host = self._get_hostname(host_properties, hostnames, strict=strict)
+
+                if host not in hostvars:
+                    hostvars[host] = host_properties
+                    self._populate_host_properties(host_properties, host)
+                    self.inventory.set_variable(
+                        host, "ansible_host", self.get_management_ip(host_obj.obj)
+                    )
+
         return hostvars
 
     def _get_hostname(self, properties, hostnames, strict=False):
@@ -156,12 +156,45 @@ DOCUMENTATION = r'''
             - Set this option to a string value to replace root name from I('Datacenters').
             default: false
             type: bool
+        incremental_refresh:
+            description:
+            - When the inventory cache is enabled, keep the vCenter session of the plugin alive and store the version
+              of a PropertyCollector watching the virtual machines along with the cached data.
+            - On the next run with a valid cache, only the virtual machines which changed since that version are
+              fetched again and merged into the cached data. If the session or the PropertyCollector are gone, for
+              example after the idle session timeout of the vCenter, all virtual machines are fetched again.
+            - The session cookie is stored in the inventory cache, so the cache must be protected accordingly.
+            - Changes which do not modify the requested virtual machine properties, such as tag assignments or
+              renamed folders used by O(with_path), are only picked up by a full refresh of the cache.
+            - Not used when connecting through O(proxy_host).
+            type: bool
+            default: false
+            version_added: '6.3.0'
         with_sanitized_property_name:
             description:
                 - This option allows property name sanitization to create safe property names for use in Ansible.
                 - Also, transforms property name to snake case.
             type: bool
             default: false
+        max_workers:
+            description:
+            - Maximum number of threads used to look up the containers given in O(resources) and to retrieve
+              the virtual machines of these containers concurrently, one retrieval per container.
+            - The requests share the session of the plugin, V(1) looks up one container at a time.
+            - With more than one container and a value above V(1), all pages of a container are held in memory
+              until they are processed.
+            type: int
+            default: 1
+            version_added: '6.3.0'
+        page_size:
+            description:
+            - Maximum number of virtual machines retrieved from the vCenter in one page.
+            - Each page is processed and released before the next one is retrieved, which bounds the memory used
+              by the plugin on large environments, especially with O(properties=[all]).
+            - Lower values use less memory at the cost of more round trips.
+            type: int
+            default: 1000
+            version_added: '6.3.0'
         proxy_host:
           description:
           - Address of a proxy that will receive all HTTPS requests and relay them.
@@ -429,6 +462,8 @@ EXAMPLES = r'''
       fast_storage: "'SSD' in config.datastoreUrl[0].name"
 '''
 
+from collections import OrderedDict
+
 from ansible.errors import AnsibleError, AnsibleParserError
 from ansible.module_utils.common.text.converters import to_text, to_native
 from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
@@ -437,7 +472,15 @@ from ansible.utils.display import Display
 from ansible_collections.community.vmware.plugins.plugin_utils.inventory import (
     to_nested_dict,
     to_flatten_dict,
-    parse_vim_property
+    parse_vim_property,
+    concurrent_map,
+    split_filter_spec,
+    TagResolver,
+)
+from ansible_collections.community.vmware.plugins.module_utils.vmware import (
+    InventoryPathIndex,
+    get_ssl_context,
+    retrieve_properties_paged,
 )
 
 display = Display()
@@ -450,13 +493,12 @@ except ImportError:
     HAS_REQUESTS = False
 
 try:
-    from pyVmomi import vim, vmodl
+    from pyVmomi import vim, vmodl, SoapStubAdapter
     HAS_PYVMOMI = True
 except ImportError:
     HAS_PYVMOMI = False
 
 try:
-    from com.vmware.vapi.std_client import DynamicID
     from vmware.vapi.vsphere.client import create_vsphere_client
     HAS_VSPHERE = True
 except ImportError:
@@ -468,8 +510,18 @@ from ansible.parsing.yaml.objects import AnsibleVaultEncryptedUnicode
 from ansible_collections.vmware.vmware.plugins.module_utils.clients.pyvmomi import PyvmomiClient
 
 
+class PersistentPyvmomiClient(PyvmomiClient):
+    """
+    PyvmomiClient whose session is not logged out at exit, so that it
+    can be resumed by the next run of the inventory plugin.
+    """
+    def connect_to_api(self, password, disconnect_atexit=True, return_si=False):
+        return super(PersistentPyvmomiClient, self).connect_to_api(password, disconnect_atexit=False, return_si=return_si)
+
+
 class BaseVMwareInventory:
-    def __init__(self, hostname, username, password, port, validate_certs, with_tags, http_proxy_host, http_proxy_port):
+    def __init__(self, hostname, username, password, port, validate_certs, with_tags, http_proxy_host, http_proxy_port,
+                 keep_session=False, max_workers=1):
         self.hostname = hostname
         self.username = username
         self.password = password
@@ -480,13 +532,25 @@ class BaseVMwareInventory:
         self.rest_content = None
         self.proxy_host = http_proxy_host
         self.proxy_port = http_proxy_port
+        self.keep_session = keep_session
+        self.max_workers = max_workers or 1
+        self.resumed = False
 
-    def do_login(self):
+    def do_login(self, session=None):
         """
         Check requirements and do login
+        :param session: Session returned by get_session() in a previous run to resume instead of logging in
         """
         self.check_requirements()
-        self.si, self.content = self._login()
+        self.si = self._resume_session(session) if session else None
+        self.resumed = self.si is not None
+        if self.resumed:
+            self.content = self.si.RetrieveContent()
+        else:
+            self.si, self.content = self._login()
+            if session:
+                # the server keeps the replaced session and its collectors until it expires
+                self._logout_session(session)
         if self.with_tags:
             self.rest_content = self._login_vapi()
 
@@ -522,13 +586,63 @@ class BaseVMwareInventory:
             raise AnsibleError(msg)
         return client
 
+    def get_session(self):
+        """
+        Get the session of the current connection
+        Returns: dict with session cookie and API version
+
+        """
+        return dict(cookie=self.si._stub.cookie, version=self.si._stub.version)
+
+    def _resume_session(self, session):
+        """
+        Resume a session returned by get_session()
+        Returns: service instance, None if the session is no longer valid
+
+        """
+        try:
+            service_instance = self._session_service_instance(session)
+            if service_instance.content.sessionManager.currentSession is None:
+                return None
+        except Exception:  # pylint: disable=broad-except
+            return None
+        return service_instance
+
+    def _logout_session(self, session):
+        """
+        Logout a session returned by get_session() which could not be resumed, if it is still valid
+
+        """
+        try:
+            self._session_service_instance(session).content.sessionManager.Logout()
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+    def _session_service_instance(self, session):
+        stub = SoapStubAdapter(host=self.hostname, port=self.port, version=session['version'],
+                               sslContext=get_ssl_context(self.validate_certs))
+        stub.cookie = session['cookie']
+        return vim.ServiceInstance('ServiceInstance', stub)
+
+    def destroy_collector(self, collector_id):
+        """
+        Destroy a PropertyCollector of the current session created by watch_managed_objects_properties()
+        in a previous run, the server keeps it until the session ends otherwise
+        :param collector_id: Managed object id of the collector
+        """
+        try:
+            vmodl.query.PropertyCollector(collector_id, self.si._stub).Destroy()
+        except vmodl.fault.ManagedObjectNotFound:
+            pass
+
     def _login(self):
         """
         Login to vCenter or ESXi server
         Returns: connection object
 
         """
-        pyvmomi_client = PyvmomiClient(
+        client_class = PersistentPyvmomiClient if self.keep_session else PyvmomiClient
+        pyvmomi_client = client_class(
             hostname=self.hostname,
             username=self.username,
             password=self.password,
@@ -579,6 +693,157 @@ class BaseVMwareInventory:
         :param strict: Dictates if plugin raises error or just warns
         :return: local content object
         """
+        objects = []
+        for page in self.iter_managed_objects_properties(vim_type, properties=properties, resources=resources, strict=strict):
+            objects.extend(page)
+        return objects
+
+    def iter_managed_objects_properties(self, vim_type, properties=None, resources=None, strict=False, page_size=None):
+        """
+        Look up Managed Object References in vCenter / ESXi Environment page by page
+        :param vim_type: Type of vim object e.g, for datacenter - vim.Datacenter
+        :param properties: List of properties related to vim object e.g. Name
+        :param resources: List of resources to limit search scope
+        :param strict: Dictates if plugin raises error or just warns
+        :param page_size: Maximum number of objects per page, None lets the server decide
+        :return: generator of lists of object contents
+        """
+        filter_spec = self._get_filter_spec(vim_type, properties, resources, strict)
+        if filter_spec is None:
+            return
+
+        filter_specs = [filter_spec]
+        if self.max_workers > 1:
+            filter_specs = split_filter_spec(filter_spec)
+
+        def retrieve(spec):
+            pages = retrieve_properties_paged(self.content.propertyCollector, spec, page_size)
+            # a worker retrieves all pages of its container, which are kept until processed
+            return list(pages) if len(filter_specs) > 1 else pages
+
+        try:
+            for pages in self._map(retrieve, filter_specs):
+                for page in pages:
+                    yield page
+        except vmodl.query.InvalidProperty as err:
+            self._handle_error("Invalid property name: %s" % err.name, strict)
+        except Exception as err:  # pylint: disable=broad-except
+            self._handle_error("Couldn't retrieve contents from host: %s" % to_native(err), strict)
+
+    def watch_managed_objects_properties(self, vim_type, properties=None, resources=None, strict=False, page_size=None):
+        """
+        Look up the same objects as iter_managed_objects_properties() through a new PropertyCollector,
+        whose version can be used with get_updates() later on to get the changed objects only
+        :param vim_type: Type of vim object e.g, for datacenter - vim.Datacenter
+        :param properties: List of properties related to vim object e.g. Name
+        :param resources: List of resources to limit search scope
+        :param strict: Dictates if plugin raises error or just warns
+        :param page_size: Maximum number of objects per page, None lets the server decide
+        :return: generator of lists of object contents with the PropertyCollector and its version,
+                 the version given with the last page is the one to use with get_updates()
+        """
+        filter_spec = self._get_filter_spec(vim_type, properties, resources, strict)
+        if filter_spec is None:
+            return
+
+        collector = self.content.propertyCollector.CreatePropertyCollector()
+        succeeded = False
+        try:
+            collector.CreateFilter(filter_spec, partialUpdates=False)
+            version = ''
+            object_contents = None
+            while True:
+                update_set = collector.WaitForUpdatesEx(
+                    version, vmodl.query.PropertyCollector.WaitOptions(maxWaitSeconds=0, maxObjectUpdates=page_size))
+                if update_set is None:
+                    break
+                version = update_set.version
+                object_contents = []
+                for filter_update in update_set.filterSet or []:
+                    for object_update in filter_update.objectSet or []:
+                        object_contents.append(vmodl.query.PropertyCollector.ObjectContent(
+                            obj=object_update.obj,
+                            propSet=[vmodl.DynamicProperty(name=change.name, val=change.val)
+                                     for change in object_update.changeSet or [] if change.op == 'assign'],
+                        ))
+                yield object_contents, collector, version
+                if not update_set.truncated:
+                    break
+            if object_contents is None:
+                # no object to report, the collector is still kept to watch for new ones
+                yield [], collector, version
+            succeeded = True
+        except vmodl.query.InvalidProperty as err:
+            self._handle_error("Invalid property name: %s" % err.name, strict)
+        finally:
+            # the server keeps the collector until the session ends unless it is destroyed
+            if not succeeded:
+                collector.Destroy()
+
+    def get_updates(self, collector, version):
+        """
+        Get the objects which changed since the given version of a PropertyCollector
+        :param collector: PropertyCollector created by watch_managed_objects_properties()
+        :param version: Version of the collector to get the changes since
+        :return: list of entered or modified objects, list of objects which left and the new version
+        """
+        changed = OrderedDict()
+        left = []
+        while True:
+            update_set = collector.WaitForUpdatesEx(version, vmodl.query.PropertyCollector.WaitOptions(maxWaitSeconds=0))
+            if update_set is None:
+                break
+            version = update_set.version
+            for filter_update in update_set.filterSet or []:
+                for object_update in filter_update.objectSet or []:
+                    if object_update.kind == 'leave':
+                        left.append(object_update.obj)
+                    else:
+                        changed[object_update.obj] = True
+            if not update_set.truncated:
+                break
+        for obj in left:
+            changed.pop(obj, None)
+        return list(changed), left, version
+
+    def retrieve_managed_objects_properties(self, vim_type, objects, properties=None):
+        """
+        Look up the properties of the given Managed Objects, objects which do not exist anymore are left out
+        :param vim_type: Type of vim object e.g, for datacenter - vim.Datacenter
+        :param objects: List of managed objects
+        :param properties: List of properties related to vim object e.g. Name
+        :return: list of object contents
+        """
+        if not objects:
+            return []
+
+        filter_spec = vmodl.query.PropertyCollector.FilterSpec(
+            objectSet=[vmodl.query.PropertyCollector.ObjectSpec(obj=obj) for obj in objects],
+            propSet=[vmodl.query.PropertyCollector.PropertySpec(type=vim_type, all=not properties, pathSet=properties)],
+            reportMissingObjectsInResults=True,
+        )
+        return [object_content for object_content in self.content.propertyCollector.RetrieveContents([filter_spec]) or []
+                if not object_content.missingSet]
+
+    def _map(self, func, items):
+        """
+        Apply func to all items, concurrently with up to max_workers threads sharing the session
+        :return: iterator of results in the order of items
+        """
+        return concurrent_map(func, items, self.max_workers)
+
+    @staticmethod
+    def _handle_error(message, strict):
+        if strict:
+            raise AnsibleError(message)
+        else:
+            display.warning(message)
+
+    def _get_filter_spec(self, vim_type, properties=None, resources=None, strict=False):
+        """
+        Build the PropertyCollector filter for get_managed_objects_properties()
+        :return: FilterSpec, None if no container matches the resources
+        """
         TraversalSpec = vmodl.query.PropertyCollector.TraversalSpec
         FilterSpec = vmodl.query.PropertyCollector.FilterSpec
         ObjectSpec = vmodl.query.PropertyCollector.ObjectSpec
@@ -588,25 +853,25 @@ class BaseVMwareInventory:
         type_to_name_map = {}
 
         def _handle_error(message):
-            if strict:
-                raise AnsibleError(message)
-            else:
-                display.warning(message)
+            self._handle_error(message, strict)
 
         def get_contents(container, vim_types):
-            return self.content.propertyCollector.RetrieveContents([
-                FilterSpec(
-                    objectSet=[
-                        ObjectSpec(
-                            obj=self.content.viewManager.CreateContainerView(
-                                container, vim_types, True),
-                            skip=False,
-                            selectSet=[TraversalSpec(
-                                type=vim.view.ContainerView, path='view', skip=False)]
-                        )],
-                    propSet=[PropertySpec(type=t, all=False, pathSet=['name']) for t in vim_types],
-                )
-            ])
+            view = self.content.viewManager.CreateContainerView(container, vim_types, True)
+            try:
+                return self.content.propertyCollector.RetrieveContents([
+                    FilterSpec(
+                        objectSet=[
+                            ObjectSpec(
+                                obj=view,
+                                skip=False,
+                                selectSet=[TraversalSpec(
+                                    type=vim.view.ContainerView, path='view', skip=False)]
+                            )],
+                        propSet=[PropertySpec(type=t, all=False, pathSet=['name']) for t in vim_types],
+                    )
+                ])
+            finally:
+                view.Destroy()
 
         def filter_containers(containers, typ, filter_list):
             if len(filter_list) > 0:
@@ -614,8 +879,8 @@ class BaseVMwareInventory:
                 results = []
                 found_filters = {}
 
-                for container in containers:
-                    results.extend(get_contents(container, [typ]))
+                for contents in self._map(lambda container: get_contents(container, [typ]), containers):
+                    results.extend(contents)
 
                 for res in results:
                     if res.propSet[0].val in filter_list:
@@ -634,7 +899,7 @@ class BaseVMwareInventory:
             if vim_type:
                 containers = filter_containers(containers, vim_type, names)
 
-            new_containers = []
+            filter_args = []
             for fil in filters:
                 new_filters = None
                 for k, v in fil.items():
@@ -644,8 +909,12 @@ class BaseVMwareInventory:
                         vim_type = getattr(vim, _snake_to_camel(k, True))
                         names = v
                         type_to_name_map[vim_type] = k.replace("_", " ")
+                filter_args.append((vim_type, names, new_filters))
 
-                new_containers.extend(build_containers(containers, vim_type, names, new_filters))
+            # sibling filters are looked up concurrently
+            new_containers = []
+            for filter_containers_list in self._map(lambda args: build_containers(containers, *args), filter_args):
+                new_containers.extend(filter_containers_list)
 
             if len(filters) > 0:
                 return new_containers
@@ -653,11 +922,12 @@ class BaseVMwareInventory:
 
         containers = build_containers([self.content.rootFolder], None, None, resource_filters)
         if len(containers) == 0:
-            return []
+            return None
 
+        views = self._map(lambda r: self.content.viewManager.CreateContainerView(r, [vim_type], True), containers)
         objs_list = [ObjectSpec(
-            obj=self.content.viewManager.CreateContainerView(r, [vim_type], True),
-            selectSet=[TraversalSpec(path='view', skip=False, type=vim.view.ContainerView)]) for r in containers]
+            obj=view,
+            selectSet=[TraversalSpec(path='view', skip=False, type=vim.view.ContainerView)]) for view in views]
 
         is_all = False if properties else True
 
@@ -669,25 +939,21 @@ class BaseVMwareInventory:
         )
 
         # Create Filter Spec
-        filter_spec = FilterSpec(
+        return FilterSpec(
             objectSet=objs_list,
             propSet=[property_spec],
             reportMissingObjectsInResults=False
         )
 
-        try:
-            return self.content.propertyCollector.RetrieveContents([filter_spec])
-        except vmodl.query.InvalidProperty as err:
-            _handle_error("Invalid property name: %s" % err.name)
-        except Exception as err:  # pylint: disable=broad-except
-            _handle_error("Couldn't retrieve contents from host: %s" % to_native(err))
-        return []
-
 
 class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
     NAME = 'community.vmware.vmware_vm_inventory'
 
+    # Shared by all pages of objects processed in one run
+    _path_index = None
+    _tag_resolver = None
+
     def verify_file(self, path):
         """
         Verify plugin configuration file and mark this plugin active
@@ -730,6 +996,17 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         elif isinstance(username, AnsibleVaultEncryptedUnicode):
             username = username.data
 
+        # Incremental refresh keeps the session alive between runs, it is not used through a proxy
+        incremental = bool(self.get_option('cache') and self.get_option('incremental_refresh') and not self.get_option('proxy_host'))
+        incremental_key = cache_key + '_incremental'
+        incremental_state = None
+        if incremental:
+            # the session is resumed even when the cached hostvars are not used
+            try:
+                incremental_state = self._cache[incremental_key]
+            except KeyError:
+                pass
+
         self.pyv = BaseVMwareInventory(
             hostname=self.get_option('hostname'),
             username=username,
@@ -738,9 +1015,11 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             with_tags=self.get_option('with_tags'),
             validate_certs=self.get_option('validate_certs'),
             http_proxy_host=self.get_option('proxy_host'),
-            http_proxy_port=self.get_option('proxy_port')
+            http_proxy_port=self.get_option('proxy_port'),
+            keep_session=incremental,
+            max_workers=self.get_option('max_workers'),
         )
-        self.pyv.do_login()
+        self.pyv.do_login(session=incremental_state.get('session') if incremental_state else None)
 
         if cache:
             cache = self.get_option('cache')
@@ -752,13 +1031,35 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             except KeyError:
                 update_cache = True
 
-        if cache and not update_cache:
+        if cache and not update_cache and incremental:
+            update_cache = True
+            cacheable_results, incremental_state = self._refresh_from_updates(cacheable_results, incremental_state)
+        elif cache and not update_cache:
             self._populate_from_cache(cacheable_results)
         else:
-            cacheable_results = self._populate_from_source()
+            if incremental_state and self.pyv.resumed:
+                # the collector of the cached hostvars is replaced by a new one
+                self.pyv.destroy_collector(incremental_state['collector'])
+            cacheable_results, incremental_state = self._populate_from_source(incremental=incremental)
 
         if update_cache or (not cache and self.get_option('cache')):
             self._cache[cache_key] = cacheable_results
+            if incremental_state:
+                self._cache[incremental_key] = incremental_state
+
+    def _refresh_from_updates(self, cache_data, incremental_state):
+        """
+        Merge the changes since the cached version into the cached data,
+        falls back to populating from the source if the collector cannot be resumed
+
+        """
+        if incremental_state and self.pyv.resumed:
+            try:
+                return self._populate_from_updates(cache_data, incremental_state)
+            except (vmodl.fault.ManagedObjectNotFound, vmodl.query.InvalidCollectorVersion) as err:
+                display.vvv("Incremental refresh of the inventory is not possible, fetching all virtual machines: %s" % to_native(err))
+                self.pyv.destroy_collector(incremental_state['collector'])
+        return self._populate_from_source(incremental=True)
 
     def _populate_from_cache(self, cache_data):
         """
@@ -768,15 +1069,95 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         for host, host_properties in cache_data.items():
             self._populate_host_properties(host_properties, host)
 
-    def _populate_from_source(self):
+    def _populate_from_source(self, incremental=False):
         """
         Populate inventory data from direct source
 
+        Returns: hostvars and, when incremental is set, the state needed to refresh them incrementally
         """
+        self._path_index = None
+        self._tag_resolver = None
+        strict = self.get_option('strict')
+        vm_properties, vm_subproperties, query_props, hide_parent = self._get_query_properties()
+
+        incremental_state = None
+        if incremental:
+            pages = self.pyv.watch_managed_objects_properties(
+                vim_type=vim.VirtualMachine,
+                properties=query_props,
+                resources=self.get_option('resources'),
+                strict=strict,
+                page_size=self.get_option('page_size'),
+            )
+        else:
+            pages = ((objects, None, None) for objects in self.pyv.iter_managed_objects_properties(
+                vim_type=vim.VirtualMachine,
+                properties=query_props,
+                resources=self.get_option('resources'),
+                strict=strict,
+                page_size=self.get_option('page_size'),
+            ))
+
         hostvars = {}
+        host_ids = {}
+        collector = version = None
+        for objects, collector, version in pages:
+            page_hostvars, page_host_ids = self._get_hostvars(objects, vm_properties, vm_subproperties, hide_parent, strict)
+            for mo_id, host in page_host_ids.items():
+                if host not in hostvars:
+                    hostvars[host] = page_hostvars[host]
+                    host_ids[mo_id] = host
+                    self._populate_host_properties(hostvars[host], host)
+
+        if collector is not None:
+            incremental_state = dict(
+                session=self.pyv.get_session(),
+                collector=collector._moId,
+                version=version,
+                hosts=host_ids,
+            )
+        return hostvars, incremental_state
+
+    def _populate_from_updates(self, hostvars, incremental_state):
+        """
+        Populate inventory data from the cached hostvars, fetching again only
+        the virtual machines which changed since the cached collector version
+
+        Returns: merged hostvars and the new incremental state
+        """
+        self._path_index = None
+        self._tag_resolver = None
         strict = self.get_option('strict')
+        vm_properties, vm_subproperties, query_props, hide_parent = self._get_query_properties()
+
+        collector = vmodl.query.PropertyCollector(incremental_state['collector'], self.pyv.si._stub)
+        changed, left, version = self.pyv.get_updates(collector, incremental_state['version'])
+
+        host_ids = dict(incremental_state['hosts'])
+        for obj in list(changed) + left:
+            host = host_ids.pop(obj._moId, None)
+            if host is not None:
+                hostvars.pop(host, None)
+
+        objects = self.pyv.retrieve_managed_objects_properties(vim.VirtualMachine, changed, query_props)
+        new_hostvars, new_host_ids = self._get_hostvars(objects, vm_properties, vm_subproperties, hide_parent, strict)
+        for mo_id, host in new_host_ids.items():
+            if host not in hostvars:
+                hostvars[host] = new_hostvars[host]
+                host_ids[mo_id] = host
+
+        for host, host_properties in hostvars.items():
+            self._populate_host_properties(host_properties, host)
 
-        vm_properties = self.get_option('properties')
+        return hostvars, dict(incremental_state, version=version, hosts=host_ids)
+
+    def _get_query_properties(self):
+        """
+        Get the virtual machine properties to query
+        Returns: requested properties, subproperties, property paths to query (None for all) and
+                 whether the parent is only queried for the path and must not be added to hostvars
+        """
+        vm_properties = list(self.get_option('properties'))
         vm_subproperties = {e['property']: e['subelements'] for e in self.get_option('subproperties')}
         vm_properties.extend(vm_subproperties.keys())
 
@@ -794,28 +1175,49 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
                 vm_properties.append('runtime.connectionState')
             query_props = [x for x in vm_properties if x != "customValue"]
 
-        objects = self.pyv.get_managed_objects_properties(
-            vim_type=vim.VirtualMachine,
-            properties=query_props,
-            resources=self.get_option('resources'),
-            strict=strict,
-        )
+        # Paths are built from the parent of every VM and an index of all inventory containers
+        hide_parent = False
+        if self.get_option('with_path') and query_props is not None and 'parent' not in query_props:
+            query_props.append('parent')
+            hide_parent = True
 
-        tags_info = dict()
-        if self.pyv.with_tags:
-            tag_svc = self.pyv.rest_content.tagging.Tag
-            cat_svc = self.pyv.rest_content.tagging.Category
+        return vm_properties, vm_subproperties, query_props, hide_parent
+
+    def _get_hostvars(self, objects, vm_properties, vm_subproperties, hide_parent, strict=False):
+        """
+        Compute the host properties of the given virtual machines
+        Returns: dict of host name to host properties and dict of managed object ID to host name
+        """
+        hostvars = {}
+        host_ids = {}
 
-            tags = tag_svc.list()
-            for tag in tags:
-                tag_obj = tag_svc.get(tag)
-                tags_info[tag_obj.id] = (tag_obj.name, cat_svc.get(tag_obj.category_id).name)
+        path_index = None
+        if self.get_option('with_path'):
+            if self._path_index is None:
+                self._path_index = InventoryPathIndex(self.pyv.content)
+            path_index = self._path_index
+
+        attached_tags = dict()
+        tag_resolver = None
+        if self.pyv.with_tags:
+            if self._tag_resolver is None:
+                self._tag_resolver = TagResolver(self.pyv.rest_content)
+            tag_resolver = self._tag_resolver
+            attached_tags = tag_resolver.get_attached_tags(
+                'VirtualMachine',
+                [vm_obj.obj._GetMoId() for vm_obj in objects],  # pylint: disable=protected-access
+            )
 
         hostnames = self.get_option('hostnames')
 
         for vm_obj in objects:
             properties = dict()
+            vm_parent = None
             for vm_obj_property in vm_obj.propSet:
+                if vm_obj_property.name == 'parent':
+                    vm_parent = vm_obj_property.val
+                    if hide_parent:
+                        continue
                 if vm_obj_property.name in vm_subproperties:
                     for subproperty in vm_subproperties[vm_obj_property.name]:
                         subproperty_parts = subproperty.split('.')
@@ -841,37 +1243,26 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
                     properties[[y.name for y in field_mgr if y.key == cust_value.key][0]] = cust_value.value
 
             # Tags
-            if tags_info:
+            if tag_resolver and tag_resolver.tag_ids:
                 # Add virtual machine to appropriate tag group
                 vm_mo_id = vm_obj.obj._GetMoId()  # pylint: disable=protected-access
-                vm_dynamic_id = DynamicID(type='VirtualMachine', id=vm_mo_id)
-                tag_association = self.pyv.rest_content.tagging.TagAssociation
                 properties['tags'] = []
                 properties['categories'] = []
                 properties['tag_category'] = {}
-                for tag_id in tag_association.list_attached_tags(vm_dynamic_id):
-                    if tag_id not in tags_info:
-                        # Ghost Tags - community.vmware#681
-                        continue
+                for tag_name, category_name in attached_tags[vm_mo_id]:
                     # Add tags related to VM
-                    properties['tags'].append(tags_info[tag_id][0])
+                    properties['tags'].append(tag_name)
                     # Add categories related to VM
-                    properties['categories'].append(tags_info[tag_id][1])
+                    properties['categories'].append(category_name)
                     # Add tag and categories related to VM
-                    if tags_info[tag_id][1] not in properties['tag_category']:
-                        properties['tag_category'][tags_info[tag_id][1]] = []
-                    properties['tag_category'][tags_info[tag_id][1]].append(tags_info[tag_id][0])
+                    if category_name not in properties['tag_category']:
+                        properties['tag_category'][category_name] = []
+                    properties['tag_category'][category_name].append(tag_name)
 
             # Path
-            with_path = self.get_option('with_path')
-            if with_path:
-                path = []
-                parent = vm_obj.obj.parent
-                while parent:
-                    path.append(parent.name)
-                    parent = parent.parent
-                path.reverse()
-                properties['path'] = "/".join(path)
+            if path_index:
+                path = path_index.lineage(vm_parent) if vm_parent else ()
+                properties['path'] = "/".join(path_index.name(item) for item in path)
 
             host_properties = to_nested_dict(properties)
 
@@ -884,9 +1275,9 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
             if host not in hostvars:
                 hostvars[host] = host_properties
-                self._populate_host_properties(host_properties, host)
+                host_ids[vm_obj.obj._GetMoId()] = host  # pylint: disable=protected-access
 
-        return hostvars
+        return hostvars, host_ids
 
     def _get_hostname(self, properties, hostnames, strict=False):
         hostname = None
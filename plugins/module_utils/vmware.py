@@ -16,6 +16,7 @@ import re
 import socket
 import ssl
 import hashlib
+import threading
 import time
 import traceback
 import datetime
@@ -25,6 +26,12 @@ from ansible_collections.vmware.vmware.plugins.module_utils.clients.errors impor
 from ansible_collections.vmware.vmware.plugins.module_utils.clients.pyvmomi import PyvmomiClient
 from random import randint
 
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
 
 REQUESTS_IMP_ERR = None
 try:
@@ -38,7 +45,7 @@ except ImportError:
 PYVMOMI_IMP_ERR = None
 try:
     from pyVim import connect
-    from pyVmomi import vim, vmodl, VmomiSupport, VmomiJSONEncoder
+    from pyVmomi import vim, vmodl, VmomiSupport, VmomiJSONEncoder, SoapStubAdapter
     HAS_PYVMOMI = True
 except ImportError:
     PYVMOMI_IMP_ERR = traceback.format_exc()
@@ -115,6 +122,120 @@ def answer_question(vm, responses):
 
 
 def wait_for_task(task, max_backoff=64, timeout=3600, vm=None, answers=None):
+    """Wait for given task to complete.
+
+    The task is watched with a PropertyCollector filter, so the function returns as
+    soon as the task ends instead of polling its state with exponential back-off.
+
+    Args:
+        task: VMware task object
+        max_backoff: Maximum amount of time in seconds to wait for a single update
+        timeout: Timeout for the given task in seconds
+        vm: Virtual machine to answer pending questions for
+        answers: Answer contents for questions of the virtual machine
+
+    Returns: Tuple with True and result for successful task
+    Raises: TaskError on failure
+    """
+    if not isinstance(task, vim.Task) or task._stub is None:
+        return poll_for_task(task, max_backoff=max_backoff, timeout=timeout, vm=vm, answers=answers)
+
+    task_info = wait_for_tasks([task], max_wait=max_backoff, timeout=timeout, vm=vm, answers=answers)[0]
+    return get_task_result(task_info)
+
+
+def get_task_result(task_info):
+    """Turn the final vim.TaskInfo of a task into the return value of wait_for_task.
+
+    Args:
+        task_info: vim.TaskInfo of a task that has ended
+
+    Returns: Tuple with True and result for successful task
+    Raises: TaskError on failure
+    """
+    if task_info.state == vim.TaskInfo.State.error:
+        error_msg = task_info.error
+        host_thumbprint = None
+        try:
+            error_msg = error_msg.msg
+            if hasattr(task_info.error, 'thumbprint'):
+                host_thumbprint = task_info.error.thumbprint
+        except AttributeError:
+            pass
+        finally:
+            raise TaskError(error_msg, host_thumbprint) from task_info.error
+    return True, task_info.result
+
+
+def wait_for_tasks(tasks, max_wait=64, timeout=3600, vm=None, answers=None):
+    """Wait for all given tasks to complete using WaitForUpdatesEx.
+
+    A dedicated PropertyCollector with a filter on the info of every task
+    (and on the pending question of the virtual machine, if any) is created,
+    so each update is delivered as soon as it happens and no polling is done.
+
+    Args:
+        tasks: List of VMware task objects sharing one connection
+        max_wait: Maximum amount of time in seconds to wait for a single update
+        timeout: Timeout for all given tasks in seconds, None to wait forever
+        vm: Virtual machine to answer pending questions for
+        answers: Answer contents for questions of the virtual machine
+
+    Returns: List of final vim.TaskInfo objects, in the order of tasks
+    Raises: TaskError on timeout or if a question cannot be answered
+    """
+    if not tasks:
+        return []
+
+    start_time = time.time()
+    pending = set(tasks)
+    task_infos = {}
+
+    collector = vmodl.query.PropertyCollector('propertyCollector', tasks[0]._stub).CreatePropertyCollector()
+    try:
+        object_specs = [vmodl.query.PropertyCollector.ObjectSpec(obj=task) for task in tasks]
+        property_specs = [vmodl.query.PropertyCollector.PropertySpec(type=vim.Task, pathSet=['info'])]
+        if vm is not None:
+            object_specs.append(vmodl.query.PropertyCollector.ObjectSpec(obj=vm))
+            property_specs.append(vmodl.query.PropertyCollector.PropertySpec(type=vim.VirtualMachine, pathSet=['runtime.question']))
+        collector.CreateFilter(vmodl.query.PropertyCollector.FilterSpec(objectSet=object_specs, propSet=property_specs),
+                               partialUpdates=False)
+
+        version = ''
+        while pending:
+            wait_seconds = max_wait
+            if timeout is not None:
+                remaining = timeout - (time.time() - start_time)
+                if remaining <= 0:
+                    raise TaskError("Timeout")
+                wait_seconds = max(1, int(min(max_wait, remaining)))
+
+            update_set = collector.WaitForUpdatesEx(version, vmodl.query.PropertyCollector.WaitOptions(maxWaitSeconds=wait_seconds))
+            if update_set is None:
+                continue
+            version = update_set.version
+
+            for filter_update in update_set.filterSet:
+                for object_update in filter_update.objectSet:
+                    for change in object_update.changeSet:
+                        if change.name == 'runtime.question':
+                            if change.val:
+                                if answers:
+                                    responses = make_answer_response(vm, answers)
+                                    answer_question(vm, responses)
+                                else:
+                                    raise TaskError("%s" % to_text(change.val.text))
+                        elif change.name == 'info' and change.val is not None:
+                            if change.val.state in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
+                                task_infos[object_update.obj] = change.val
+                                pending.discard(object_update.obj)
+    finally:
+        collector.Destroy()
+
+    return [task_infos[task] for task in tasks]
+
+
+def poll_for_task(task, max_backoff=64, timeout=3600, vm=None, answers=None):
     """Wait for given task using exponential back-off algorithm.
 
     Args:
@@ -137,19 +258,8 @@ def wait_for_task(task, max_backoff=64, timeout=3600, vm=None, answers=None):
                 raise TaskError("%s" % to_text(vm.runtime.question.text))
         if time.time() - start_time >= timeout:
             raise TaskError("Timeout")
-        if task.info.state == vim.TaskInfo.State.success:
-            return True, task.info.result
-        if task.info.state == vim.TaskInfo.State.error:
-            error_msg = task.info.error
-            host_thumbprint = None
-            try:
-                error_msg = error_msg.msg
-                if hasattr(task.info.error, 'thumbprint'):
-                    host_thumbprint = task.info.error.thumbprint
-            except AttributeError:
-                pass
-            finally:
-                raise TaskError(error_msg, host_thumbprint) from task.info.error
+        if task.info.state in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
+            return get_task_result(task.info)
         if task.info.state in [vim.TaskInfo.State.running, vim.TaskInfo.State.queued]:
             sleep_time = min(2 ** failure_counter + randint(1, 1000) / 1000, max_backoff)
             time.sleep(sleep_time)
@@ -170,11 +280,355 @@ def wait_for_vm_ip(content, vm, timeout=300):
     return facts
 
 
+def _container_filter_spec(container, vimtype, properties):
+    """ Build a filter spec selecting the given properties of all objects of a container view """
+    traversal_spec = vmodl.query.PropertyCollector.TraversalSpec(
+        name='traverseView',
+        path='view',
+        skip=False,
+        type=vim.view.ContainerView
+    )
+    object_spec = vmodl.query.PropertyCollector.ObjectSpec(
+        obj=container,
+        skip=True,
+        selectSet=[traversal_spec]
+    )
+    property_specs = [
+        vmodl.query.PropertyCollector.PropertySpec(type=obj_type, all=False, pathSet=properties)
+        for obj_type in vimtype
+    ]
+    return vmodl.query.PropertyCollector.FilterSpec(
+        objectSet=[object_spec],
+        propSet=property_specs,
+        reportMissingObjectsInResults=False
+    )
+
+
+def get_objects_properties(content, vimtype, properties, folder=None, recurse=True):
+    """Retrieve properties of all objects of the given types with a single PropertyCollector call.
+
+    Args:
+        content: VMware content object
+        vimtype: List of vim object types e.g. [vim.VirtualMachine]
+        properties: List of property paths to retrieve e.g. ['name', 'parent']
+        folder: Managed object to start the search from, defaults to the root folder
+        recurse: Search the whole subtree under folder if True
+
+    Returns: List of vmodl.query.PropertyCollector.ObjectContent
+    """
+    if not folder:
+        folder = content.rootFolder
+
+    container = content.viewManager.CreateContainerView(folder, vimtype, recurse)
+    try:
+        return content.propertyCollector.RetrieveContents([_container_filter_spec(container, vimtype, properties)]) or []
+    finally:
+        container.Destroy()
+
+
+def iter_objects_properties(content, vimtype, properties, folder=None, recurse=True, page_size=None):
+    """Retrieve properties of all objects of the given types page by page.
+
+    Same as get_objects_properties, but the results are fetched with
+    RetrievePropertiesEx and ContinueRetrievePropertiesEx, so only one page
+    is held in memory at a time on large inventories.
+
+    Args:
+        content: VMware content object
+        vimtype: List of vim object types e.g. [vim.VirtualMachine]
+        properties: List of property paths to retrieve e.g. ['name', 'parent']
+        folder: Managed object to start the search from, defaults to the root folder
+        recurse: Search the whole subtree under folder if True
+        page_size: Maximum number of objects per page, None lets the server decide
+
+    Returns: Generator of vmodl.query.PropertyCollector.ObjectContent
+    """
+    if not folder:
+        folder = content.rootFolder
+
+    container = content.viewManager.CreateContainerView(folder, vimtype, recurse)
+    pages = retrieve_properties_paged(content.propertyCollector, _container_filter_spec(container, vimtype, properties), page_size)
+    try:
+        for page in pages:
+            for object_content in page:
+                yield object_content
+    finally:
+        pages.close()
+        container.Destroy()
+
+
+def retrieve_properties_paged(property_collector, filter_spec, page_size=None):
+    """Retrieve the objects and properties selected by a filter spec page by page.
+
+    Results are fetched with RetrievePropertiesEx and ContinueRetrievePropertiesEx,
+    so that only one page is held in memory at a time.
+
+    Args:
+        property_collector: PropertyCollector managed object
+        filter_spec: FilterSpec of the objects and properties to retrieve
+        page_size: Maximum number of objects per page, None lets the server decide
+
+    Returns: Generator of lists of vmodl.query.PropertyCollector.ObjectContent
+    """
+    token = None
+    try:
+        result = property_collector.RetrievePropertiesEx(
+            [filter_spec],
+            vmodl.query.PropertyCollector.RetrieveOptions(maxObjects=page_size)
+        )
+        while result is not None:
+            token = result.token
+            yield list(result.objects)
+            if not token:
+                break
+            # A failed Continue may have released the result set already, it is not cancelled then
+            next_token, token = token, None
+            result = property_collector.ContinueRetrievePropertiesEx(next_token)
+    finally:
+        # Release the server side result set if the caller stops early
+        if token:
+            property_collector.CancelRetrievePropertiesEx(token)
+
+
+def retrieve_objects_properties(content, objects, properties):
+    """Retrieve properties of the given managed objects with a single PropertyCollector call.
+
+    Args:
+        content: VMware content object
+        objects: List of managed objects
+        properties: List of property paths to retrieve for every object, or
+                    a dict of vim object type to list of property paths
+
+    Returns: Dict of managed object to dict of property path and value,
+             unset properties are left out
+    """
+    result = {}
+    if not objects:
+        return result
+
+    if not isinstance(properties, Mapping):
+        properties = dict((type(obj), properties) for obj in objects)
+
+    object_specs = [vmodl.query.PropertyCollector.ObjectSpec(obj=obj, skip=False) for obj in objects]
+    property_specs = [
+        vmodl.query.PropertyCollector.PropertySpec(type=obj_type, all=False, pathSet=path_set)
+        for obj_type, path_set in properties.items()
+    ]
+    filter_spec = vmodl.query.PropertyCollector.FilterSpec(objectSet=object_specs, propSet=property_specs)
+    for object_content in content.propertyCollector.RetrieveContents([filter_spec]) or []:
+        result[object_content.obj] = dict((prop.name, prop.val) for prop in object_content.propSet)
+    return result
+
+
+class ConnectionIndexes(object):
+    """
+    Indexes of one connection, see ObjectNameIndex and InventoryPathIndex.
+
+    They are stored on the stub of the connection, so they go away with the
+    connection and are never shared by two connections. Lookups hold the lock
+    as the indexes are shared by the threads of a module.
+    """
+
+    _create_lock = threading.Lock()
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.object_names = {}
+        self.inventory_paths = None
+
+    @classmethod
+    def of(cls, content):
+        """
+        Return the indexes of the connection of the given content, creating them on first use.
+        Args:
+            content: VMware content object
+
+        Returns: ConnectionIndexes
+        """
+        stub = content.propertyCollector._stub
+        with cls._create_lock:
+            indexes = vars(stub).get('_community_vmware_indexes')
+            if indexes is None:
+                indexes = cls()
+                stub._community_vmware_indexes = indexes
+        return indexes
+
+    def clear(self):
+        """ Drop all indexes, they are rebuilt on next use """
+        with self.lock:
+            self.object_names.clear()
+            self.inventory_paths = None
+
+
+class ObjectNameIndex(object):
+    """
+    Name to managed object index of one inventory scope.
+
+    The names and parents of all objects of the given types are fetched with
+    a single PropertyCollector call instead of one lazy ``obj.name`` read per
+    object. Indexes are kept per connection, use ObjectNameIndex.get() to
+    obtain one while holding the lock of ConnectionIndexes.of(content).
+    """
+
+    def __init__(self, content, vimtype, folder=None, recurse=True):
+        self.content = content
+        self.objects = OrderedDict()
+        self.parents = {}
+        self.by_name = {}
+        for object_content in get_objects_properties(content, vimtype, ['name', 'parent'], folder=folder, recurse=recurse):
+            props = dict((prop.name, prop.val) for prop in object_content.propSet)
+            if 'name' not in props:
+                continue
+            obj = object_content.obj
+            self.objects[obj] = props['name']
+            self.parents[obj] = props.get('parent')
+            self.by_name.setdefault(unquote(props['name']), []).append(obj)
+        self.fresh = True
+
+    @classmethod
+    def get(cls, content, vimtype, folder=None, recurse=True, refresh=False):
+        """
+        Return the index for the given scope, building it on first use.
+        Args:
+            content: VMware content object
+            vimtype: List of vim object types
+            folder: Managed object to start the search from
+            recurse: Search the whole subtree under folder if True
+            refresh: Rebuild the index even if it is already known
+
+        Returns: ObjectNameIndex
+        """
+        indexes = ConnectionIndexes.of(content).object_names
+        key = (
+            tuple(obj_type._wsdlName for obj_type in vimtype),
+            getattr(folder, '_moId', folder),
+            recurse,
+        )
+        index = indexes.get(key)
+        if index is None or refresh:
+            index = cls(content, vimtype, folder=folder, recurse=recurse)
+            indexes[key] = index
+        return index
+
+    def find(self, name):
+        """ Return all managed objects with the given (unquoted) name """
+        return list(self.by_name.get(name, []))
+
+    def is_stale(self, obj, name):
+        """
+        Check if a lookup result may be outdated because the inventory changed since the index was built.
+        A fresh index is trusted, otherwise misses are retried and hits are checked with a single name read.
+        """
+        if self.fresh:
+            self.fresh = False
+            return False
+        if obj is None:
+            return True
+        try:
+            return unquote(obj.name) != name
+        except vmodl.fault.ManagedObjectNotFound:
+            return True
+
+
+class InventoryPathIndex(object):
+    """
+    Name and parent map of the inventory containers, used to build inventory paths.
+
+    The names and parents of all folders, datacenters, compute resources,
+    resource pools and hosts are fetched with a single PropertyCollector call,
+    paths are then computed in memory instead of reading ``parent`` and
+    ``name`` lazily for every level. Indexes are kept per connection, use
+    InventoryPathIndex.get() to obtain one.
+    """
+
+    def __init__(self, content):
+        self.content = content
+        self.names = {}
+        self.parents = {}
+        self.lineages = {}
+        self.refreshed = False
+        self.lock = threading.RLock()
+        self._load()
+
+    @staticmethod
+    def container_types():
+        return [vim.Folder, vim.Datacenter, vim.ComputeResource, vim.ResourcePool, vim.HostSystem]
+
+    def _load(self):
+        self.parents = {self.content.rootFolder: None}
+        self.lineages = {}
+        for object_content in get_objects_properties(self.content, self.container_types(), ['name', 'parent']):
+            props = dict((prop.name, prop.val) for prop in object_content.propSet)
+            self.names[object_content.obj] = props.get('name')
+            self.parents[object_content.obj] = props.get('parent')
+
+    @classmethod
+    def get(cls, content):
+        """
+        Return the index for the given connection, building it on first use.
+        Every call allows one rebuild of the index on a lookup miss, so callers
+        which keep the connection see the containers created in the meantime.
+        Args:
+            content: VMware content object
+
+        Returns: InventoryPathIndex
+        """
+        indexes = ConnectionIndexes.of(content)
+        with indexes.lock:
+            if indexes.inventory_paths is None:
+                indexes.inventory_paths = cls(content)
+            else:
+                indexes.inventory_paths.refreshed = False
+            return indexes.inventory_paths
+
+    def name(self, obj):
+        with self.lock:
+            if obj not in self.names:
+                self.names[obj] = obj.name
+            return self.names[obj]
+
+    def parent(self, obj):
+        """
+        Return the parent of the given managed object.
+        Objects which are not containers (e.g. virtual machines) are not indexed and their parent is read directly,
+        containers created after the index was built trigger a single rebuild of the index.
+        """
+        with self.lock:
+            if obj in self.parents:
+                return self.parents[obj]
+            if not isinstance(obj, tuple(self.container_types())):
+                return obj.parent
+            if not self.refreshed:
+                self.refreshed = True
+                self._load()
+            if obj not in self.parents:
+                self.parents[obj] = obj.parent
+            return self.parents[obj]
+
+    def lineage(self, obj):
+        """ Return the containers from the top of the inventory down to the given container, memoised per container """
+        with self.lock:
+            chain = []
+            while obj is not None and obj not in self.lineages:
+                chain.append(obj)
+                obj = self.parent(obj)
+            lineage = self.lineages[obj] if obj is not None else ()
+            for item in reversed(chain):
+                lineage += (item,)
+                self.lineages[item] = lineage
+            return lineage
+
+    def path_names(self, obj):
+        """ Return the names of the given container and its ancestors below the root folder, top first """
+        return [self.name(item) for item in self.lineage(obj) if item != self.content.rootFolder]
+
+
 def find_obj(content, vimtype, name, first=True, folder=None):
-    container = content.viewManager.CreateContainerView(folder or content.rootFolder, recursive=True, type=vimtype)
     # Get all objects matching type (and name if given)
-    obj_list = [obj for obj in container.view if not name or to_text(unquote(obj.name)) == to_text(unquote(name))]
-    container.Destroy()
+    obj_list = [
+        object_content.obj for object_content in get_objects_properties(content, vimtype, ['name'], folder=folder)
+        if object_content.propSet and (not name or to_text(unquote(object_content.propSet[0].val)) == to_text(unquote(name)))
+    ]
 
     # Return first match or None
     if first:
@@ -203,15 +657,18 @@ def find_object_by_name(content, name, obj_type, folder=None, recurse=True):
 
     name = name.strip()
 
-    objects = get_all_objs(content, obj_type, folder=folder, recurse=recurse)
-    for obj in objects:
-        try:
-            if unquote(obj.name) == name:
-                return obj
-        except vmodl.fault.ManagedObjectNotFound:
-            pass
+    with ConnectionIndexes.of(content).lock:
+        index = ObjectNameIndex.get(content, obj_type, folder=folder, recurse=recurse)
+        objects = index.find(name)
+        obj = objects[0] if objects else None
+        if index.is_stale(obj, name):
+            index = ObjectNameIndex.get(content, obj_type, folder=folder, recurse=recurse, refresh=True)
+            # the rebuilt index served this lookup, the next one must not trust it
+            index.fresh = False
+            objects = index.find(name)
+            obj = objects[0] if objects else None
 
-    return None
+    return obj
 
 
 def find_all_objects_by_name(content, name, obj_type, folder=None, recurse=True):
@@ -219,16 +676,11 @@ def find_all_objects_by_name(content, name, obj_type, folder=None, recurse=True)
         obj_type = [obj_type]
 
     name = name.strip()
-    result = []
 
-    objects = get_all_objs(content, obj_type, folder=folder, recurse=recurse)
-    for obj in objects:
-        try:
-            if unquote(obj.name) == name:
-                result.append(obj)
-        except vmodl.fault.ManagedObjectNotFound:
-            pass
-    return result
+    with ConnectionIndexes.of(content).lock:
+        index = ObjectNameIndex.get(content, obj_type, folder=folder, recurse=recurse, refresh=True)
+        index.fresh = False
+        return index.find(name)
 
 
 def find_cluster_by_name(content, cluster_name, datacenter=None):
@@ -393,9 +845,20 @@ def find_host_portgroup_by_name(host, portgroup_name):
     return None
 
 
-def compile_folder_path_for_object(vobj):
+def compile_folder_path_for_object(vobj, content=None):
     """ make a /vm/foo/bar/baz like folder path for an object """
 
+    if content is not None:
+        index = InventoryPathIndex.get(content)
+        parent = index.parent(vobj)
+        paths = []
+        if parent is not None:
+            paths = [index.name(item) for item in index.lineage(parent)
+                     if isinstance(item, vim.Folder) and item != content.rootFolder]
+        if isinstance(vobj, vim.Folder):
+            paths.append(vobj.name)
+        return '/' + '/'.join(paths)
+
     paths = []
     if isinstance(vobj, vim.Folder):
         paths.append(vobj.name)
@@ -426,35 +889,115 @@ def _get_vm_prop(vm, attributes):
     return result
 
 
+# Facts gathered by gather_vm_facts which map directly to a virtual machine property path
+VM_FACTS_PROPERTY_MAP = OrderedDict([
+    ('hw_name', 'config.name'),
+    ('hw_power_status', 'summary.runtime.powerState'),
+    ('hw_guest_full_name', 'summary.guest.guestFullName'),
+    ('hw_guest_id', 'summary.guest.guestId'),
+    ('hw_product_uuid', 'config.uuid'),
+    ('hw_processor_count', 'config.hardware.numCPU'),
+    ('hw_cores_per_socket', 'config.hardware.numCoresPerSocket'),
+    ('hw_memtotal_mb', 'config.hardware.memoryMB'),
+    ('hw_is_template', 'config.template'),
+    ('hw_version', 'config.version'),
+    ('instance_uuid', 'config.instanceUuid'),
+    ('guest_tools_status', 'guest.toolsRunningStatus'),
+    ('guest_tools_version', 'guest.toolsVersion'),
+    ('guest_consolidation_needed', 'summary.runtime.consolidationNeeded'),
+    ('annotation', 'config.annotation'),
+])
+
+# Additional virtual machine property paths the remaining facts are computed from
+VM_FACTS_PROPERTIES = list(VM_FACTS_PROPERTY_MAP.values()) + [
+    'parent',
+    'summary.runtime.question',
+    'summary.runtime.host',
+    'summary.runtime.dasVmProtection',
+    'summary.customValue',
+    'summary.config',
+    'config.files',
+    'config.extraConfig',
+    'config.hardware.device',
+    'config.keyId',
+    'datastore',
+    'layout',
+    'guest.net',
+    'guest.ipAddress',
+    'snapshot',
+]
+
+
 def gather_vm_facts(content, vm):
     """ Gather facts from vim.VirtualMachine object. """
-    facts = {
-        'module_hw': True,
-        'hw_name': vm.config.name,
-        'hw_power_status': vm.summary.runtime.powerState,
-        'hw_guest_full_name': vm.summary.guest.guestFullName,
-        'hw_guest_id': vm.summary.guest.guestId,
-        'hw_product_uuid': vm.config.uuid,
-        'hw_processor_count': vm.config.hardware.numCPU,
-        'hw_cores_per_socket': vm.config.hardware.numCoresPerSocket,
-        'hw_memtotal_mb': vm.config.hardware.memoryMB,
+    return gather_multiple_vm_facts(content, [vm])[0]
+
+
+def gather_multiple_vm_facts(content, vms):
+    """
+    Gather facts for a list of vim.VirtualMachine objects.
+
+    The properties of all virtual machines are retrieved with one
+    PropertyCollector call, followed by one call for the related hosts
+    and datastores, instead of lazily reading each property per VM.
+
+    Args:
+        content: VMware content object
+        vms: List of virtual machine managed objects
+
+    Returns: List of facts dictionaries, in the order of vms
+    """
+    vm_props = retrieve_objects_properties(content, vms, VM_FACTS_PROPERTIES)
+
+    hosts = set()
+    datastores = set()
+    for props in vm_props.values():
+        if props.get('summary.runtime.host'):
+            hosts.add(props['summary.runtime.host'])
+        datastores.update(props.get('datastore') or [])
+
+    related_props = {}
+    try:
+        related_props = retrieve_objects_properties(content, list(hosts) + list(datastores), {
+            vim.HostSystem: ['summary.config.name', 'parent'],
+            vim.Datastore: ['info.name'],
+        })
+        clusters = set(props['parent'] for props in related_props.values()
+                       if isinstance(props.get('parent'), vim.ClusterComputeResource))
+        related_props.update(retrieve_objects_properties(content, list(clusters), ['name']))
+    except vim.fault.NoPermission:
+        # User does not have read permission for some related objects,
+        # fall back to reading them one by one so that only those are skipped.
+        related_props = {}
+
+    custom_fields = None
+    if any(props.get('summary.customValue') for props in vm_props.values()):
+        cfm = content.customFieldsManager
+        if cfm is not None:
+            custom_fields = cfm.field
+
+    return [
+        _build_vm_facts(content, vm, vm_props.get(vm, {}), related_props, custom_fields)
+        for vm in vms
+    ]
+
+
+def _build_vm_facts(content, vm, props, related_props, custom_fields):
+    """ Compute the facts of a virtual machine from its retrieved properties """
+    facts = {'module_hw': True}
+    for fact, path in VM_FACTS_PROPERTY_MAP.items():
+        facts[fact] = props.get(path)
+    facts.update({
         'hw_interfaces': [],
         'hw_datastores': [],
         'hw_files': [],
         'hw_esxi_host': None,
         'hw_guest_ha_state': None,
-        'hw_is_template': vm.config.template,
         'hw_folder': None,
-        'hw_version': vm.config.version,
-        'instance_uuid': vm.config.instanceUuid,
-        'guest_tools_status': _get_vm_prop(vm, ('guest', 'toolsRunningStatus')),
-        'guest_tools_version': _get_vm_prop(vm, ('guest', 'toolsVersion')),
-        'guest_question': json.loads(json.dumps(vm.summary.runtime.question, cls=VmomiJSONEncoder.VmomiJSONEncoder,
+        'guest_question': json.loads(json.dumps(props.get('summary.runtime.question'), cls=VmomiJSONEncoder.VmomiJSONEncoder,
                                                 sort_keys=True, strip_dynamic=True)),
-        'guest_consolidation_needed': vm.summary.runtime.consolidationNeeded,
         'ipv4': None,
         'ipv6': None,
-        'annotation': vm.config.annotation,
         'customvalues': {},
         'snapshots': [],
         'current_snapshot': None,
@@ -462,30 +1005,38 @@ def gather_vm_facts(content, vm):
         'moid': vm._moId,
         'vimref': "vim.VirtualMachine:%s" % vm._moId,
         'advanced_settings': {},
-    }
+    })
 
     # facts that may or may not exist
-    if vm.summary.runtime.host:
+    host = props.get('summary.runtime.host')
+    if host:
         try:
-            host = vm.summary.runtime.host
-            facts['hw_esxi_host'] = host.summary.config.name
-            facts['hw_cluster'] = host.parent.name if host.parent and isinstance(host.parent, vim.ClusterComputeResource) else None
+            if host in related_props:
+                host_props = related_props[host]
+                host_parent = host_props.get('parent')
+                facts['hw_esxi_host'] = host_props.get('summary.config.name')
+                facts['hw_cluster'] = related_props.get(host_parent, {}).get('name') if isinstance(host_parent, vim.ClusterComputeResource) else None
+            else:
+                facts['hw_esxi_host'] = host.summary.config.name
+                facts['hw_cluster'] = host.parent.name if host.parent and isinstance(host.parent, vim.ClusterComputeResource) else None
 
         except vim.fault.NoPermission:
             # User does not have read permission for the host system,
             # proceed without this value. This value does not contribute or hamper
             # provisioning or power management operations.
             pass
-    if vm.summary.runtime.dasVmProtection:
-        facts['hw_guest_ha_state'] = vm.summary.runtime.dasVmProtection.dasProtected
+    if props.get('summary.runtime.dasVmProtection'):
+        facts['hw_guest_ha_state'] = props['summary.runtime.dasVmProtection'].dasProtected
 
-    datastores = vm.datastore
-    for ds in datastores:
-        facts['hw_datastores'].append(ds.info.name)
+    for ds in props.get('datastore') or []:
+        if ds in related_props:
+            facts['hw_datastores'].append(related_props[ds].get('info.name'))
+        else:
+            facts['hw_datastores'].append(ds.info.name)
 
     try:
-        files = vm.config.files
-        layout = vm.layout
+        files = props.get('config.files')
+        layout = props.get('layout')
         if files:
             facts['hw_files'] = [files.vmPathName]
             for item in layout.snapshot:
@@ -494,22 +1045,23 @@ def gather_vm_facts(content, vm):
                         facts['hw_files'].append(snap)
             for item in layout.configFile:
                 facts['hw_files'].append(os.path.join(os.path.dirname(files.vmPathName), item))
-            for item in vm.layout.logFile:
+            for item in layout.logFile:
                 facts['hw_files'].append(os.path.join(files.logDirectory, item))
-            for item in vm.layout.disk:
+            for item in layout.disk:
                 for disk in item.diskFile:
                     facts['hw_files'].append(disk)
     except Exception:
         pass
 
-    facts['hw_folder'] = PyVmomi.get_vm_path(content, vm)
+    if props.get('parent'):
+        index = InventoryPathIndex.get(content)
+        facts['hw_folder'] = '/' + '/'.join(index.path_names(props['parent']))
 
-    cfm = content.customFieldsManager
     # Resolve custom values
-    for value_obj in vm.summary.customValue:
+    for value_obj in props.get('summary.customValue') or []:
         kn = value_obj.key
-        if cfm is not None and cfm.field:
-            for f in cfm.field:
+        if custom_fields:
+            for f in custom_fields:
                 if f.key == value_obj.key:
                     kn = f.name
                     # Exit the loop immediately, we found it
@@ -518,24 +1070,26 @@ def gather_vm_facts(content, vm):
         facts['customvalues'][kn] = value_obj.value
 
     # Resolve advanced settings
-    for advanced_setting in vm.config.extraConfig:
+    extra_config = props.get('config.extraConfig') or []
+    for advanced_setting in extra_config:
         facts['advanced_settings'][advanced_setting.key] = advanced_setting.value
 
     net_dict = {}
-    vmnet = _get_vm_prop(vm, ('guest', 'net'))
+    vmnet = props.get('guest.net')
     if vmnet:
         for device in vmnet:
             if device.deviceConfigId > 0:
                 net_dict[device.macAddress] = list(device.ipAddress)
 
-    if vm.guest.ipAddress:
-        if ':' in vm.guest.ipAddress:
-            facts['ipv6'] = vm.guest.ipAddress
+    ip_address = props.get('guest.ipAddress')
+    if ip_address:
+        if ':' in ip_address:
+            facts['ipv6'] = ip_address
         else:
-            facts['ipv4'] = vm.guest.ipAddress
+            facts['ipv4'] = ip_address
 
     ethernet_idx = 0
-    for entry in vm.config.hardware.device:
+    for entry in props.get('config.hardware.device') or []:
         if not hasattr(entry, 'macAddress'):
             continue
 
@@ -571,17 +1125,19 @@ def gather_vm_facts(content, vm):
         facts['hw_interfaces'].append('eth' + str(ethernet_idx))
         ethernet_idx += 1
 
-    snapshot_facts = list_snapshots(vm)
+    snapshot_facts = list_snapshots_from_info(props.get('snapshot'))
     if 'snapshots' in snapshot_facts:
         facts['snapshots'] = snapshot_facts['snapshots']
         facts['current_snapshot'] = snapshot_facts['current_snapshot']
 
-    facts['vnc'] = get_vnc_extraconfig(vm)
+    facts['vnc'] = get_vnc_from_extra_config(extra_config)
 
     # Gather vTPM information
+    summary_config = props.get('summary.config')
+    key_id = props.get('config.keyId')
     facts['tpm_info'] = {
-        'tpm_present': vm.summary.config.tpmPresent if hasattr(vm.summary.config, 'tpmPresent') else None,
-        'provider_id': vm.config.keyId.providerId.id if vm.config.keyId else None
+        'tpm_present': summary_config.tpmPresent if hasattr(summary_config, 'tpmPresent') else None,
+        'provider_id': key_id.providerId.id if key_id else None
     }
     return facts
 
@@ -643,16 +1199,18 @@ def get_current_snap_obj(snapshots, snapob):
 
 
 def list_snapshots(vm):
+    return list_snapshots_from_info(_get_vm_prop(vm, ('snapshot',)))
+
+
+def list_snapshots_from_info(snapshot):
+    """ Same as list_snapshots, for an already retrieved vim.vm.SnapshotInfo """
     result = {}
-    snapshot = _get_vm_prop(vm, ('snapshot',))
     if not snapshot:
         return result
-    if vm.snapshot is None:
-        return result
 
-    result['snapshots'] = list_snapshots_recursively(vm.snapshot.rootSnapshotList)
-    current_snapref = vm.snapshot.currentSnapshot
-    current_snap_obj = get_current_snap_obj(vm.snapshot.rootSnapshotList, current_snapref)
+    result['snapshots'] = list_snapshots_recursively(snapshot.rootSnapshotList)
+    current_snapref = snapshot.currentSnapshot
+    current_snap_obj = get_current_snap_obj(snapshot.rootSnapshotList, current_snapref)
     if current_snap_obj:
         result['current_snapshot'] = deserialize_snapshot_obj(current_snap_obj[0])
     else:
@@ -661,8 +1219,13 @@ def list_snapshots(vm):
 
 
 def get_vnc_extraconfig(vm):
+    return get_vnc_from_extra_config(vm.config.extraConfig)
+
+
+def get_vnc_from_extra_config(extra_config):
+    """ Same as get_vnc_extraconfig, for an already retrieved list of extraConfig options """
     result = {}
-    for opts in vm.config.extraConfig:
+    for opts in extra_config:
         for optkeyname in ['enabled', 'ip', 'port', 'password']:
             if opts.key.lower() == "remotedisplay.vnc." + optkeyname:
                 result[optkeyname] = opts.value
@@ -673,6 +1236,129 @@ def vmware_argument_spec():
     return base_argument_spec()
 
 
+def get_ssl_context(validate_certs):
+    """ Return the SSL context used to connect to vCenter or ESXi API """
+    if validate_certs:
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
+        ssl_context.verify_mode = ssl.CERT_REQUIRED
+        ssl_context.check_hostname = True
+        ssl_context.load_default_certs()
+    else:
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
+        ssl_context.verify_mode = ssl.CERT_NONE
+        ssl_context.check_hostname = False
+    return ssl_context
+
+
+class SessionCache(object):
+    """
+    On-disk cache of vCenter / ESXi API sessions, shared by module invocations.
+
+    The cache is opt-in, it is enabled by setting the VMWARE_SESSION_CACHE
+    environment variable to a directory. Session cookies are stored per
+    hostname, username, password and port, the file name being a hash of
+    them, with a time to live in seconds taken from
+    VMWARE_SESSION_CACHE_TTL (default 600). A cached session is checked for
+    liveness before it is reused, otherwise a fresh login is done.
+    Connections through an HTTP proxy are not cached.
+
+    Cached sessions are not logged out at exit, they expire on the server
+    after its idle session timeout.
+    """
+
+    DEFAULT_TTL = 600
+
+    def __init__(self, path, ttl=DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+
+    @classmethod
+    def from_env(cls):
+        """ Return the session cache configured in the environment, None if it is disabled """
+        path = os.environ.get('VMWARE_SESSION_CACHE')
+        if not path or not HAS_FCNTL:
+            return None
+        try:
+            ttl = int(os.environ.get('VMWARE_SESSION_CACHE_TTL', cls.DEFAULT_TTL))
+        except ValueError:
+            ttl = cls.DEFAULT_TTL
+        return cls(os.path.expanduser(path), ttl)
+
+    def _cache_file(self, hostname, username, password, port):
+        # a session logged in with other credentials must not be resumed
+        password_hash = hashlib.sha256(to_text(password).encode('utf-8')).hexdigest()
+        key = hashlib.sha256(to_text("%s|%s|%s|%s" % (hostname, username, port, password_hash)).encode('utf-8')).hexdigest()
+        return os.path.join(self.path, 'session-%s.json' % key)
+
+    def _read(self, cache_file):
+        try:
+            with open(cache_file) as f:
+                session = json.load(f)
+            if time.time() - session['last_used'] < self.ttl:
+                return session
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _write(self, cache_file, session):
+        session['last_used'] = time.time()
+        tmp_file = cache_file + '.tmp'
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(session, f)
+        os.rename(tmp_file, cache_file)
+
+    def _resume(self, session, hostname, port, ssl_context):
+        """ Return a service instance for a cached session, None if the session is no longer valid """
+        try:
+            stub = SoapStubAdapter(host=hostname, port=port, version=session['version'], sslContext=ssl_context)
+            stub.cookie = session['cookie']
+            service_instance = vim.ServiceInstance('ServiceInstance', stub)
+            if service_instance.content.sessionManager.currentSession is None:
+                return None
+        except Exception:
+            return None
+        return service_instance
+
+    def get_service_instance(self, hostname, username, password, port, login, ssl_context):
+        """
+        Reuse a cached session or log in and cache the new session.
+        Args:
+            hostname: vCenter or ESXi hostname
+            username: Username used to log in
+            password: Password used to log in
+            port: Port of the API
+            login: Callable doing a fresh login, returns a service instance
+            ssl_context: SSL context used for the connection
+
+        Returns: service instance
+        """
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path, 0o700)
+        cache_file = self._cache_file(hostname, username, password, port)
+
+        # Hold the lock while checking and refreshing the session, so
+        # concurrent invocations wait for a single login and then share it.
+        with open(cache_file + '.lock', 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                session = self._read(cache_file)
+                if session is not None:
+                    service_instance = self._resume(session, hostname, port, ssl_context)
+                    if service_instance is not None:
+                        self._write(cache_file, session)
+                        return service_instance
+
+                service_instance = login()
+                self._write(cache_file, dict(
+                    cookie=service_instance._stub.cookie,
+                    version=service_instance._stub.version,
+                ))
+                return service_instance
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
 def connect_to_api(module, disconnect_atexit=True, return_si=False, hostname=None, username=None, password=None, port=None, validate_certs=None,
                    httpProxyHost=None, httpProxyPort=None):
     if module:
@@ -714,20 +1400,11 @@ def connect_to_api(module, disconnect_atexit=True, return_si=False, hostname=Non
     if validate_certs and not hasattr(ssl, 'SSLContext'):
         _raise_or_fail(msg='pyVim does not support changing verification mode with python < 2.7.9. Either update '
                            'python or use validate_certs=false.')
-    elif validate_certs:
-        ssl_context = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
-        ssl_context.verify_mode = ssl.CERT_REQUIRED
-        ssl_context.check_hostname = True
-        ssl_context.load_default_certs()
     elif hasattr(ssl, 'SSLContext'):
-        ssl_context = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
-        ssl_context.verify_mode = ssl.CERT_NONE
-        ssl_context.check_hostname = False
+        ssl_context = get_ssl_context(validate_certs)
     else:  # Python < 2.7.9 or RHEL/Centos < 7.4
         ssl_context = None
 
-    service_instance = None
-
     connect_args = dict(
         host=hostname,
         port=port,
@@ -735,32 +1412,43 @@ def connect_to_api(module, disconnect_atexit=True, return_si=False, hostname=Non
     if ssl_context:
         connect_args.update(sslContext=ssl_context)
 
-    msg_suffix = ''
-    try:
-        if httpProxyHost:
-            msg_suffix = " [proxy: %s:%d]" % (httpProxyHost, httpProxyPort)
-            connect_args.update(httpProxyHost=httpProxyHost, httpProxyPort=httpProxyPort)
-            smart_stub = connect.SmartStubAdapter(**connect_args)
-            session_stub = connect.VimSessionOrientedStub(smart_stub, connect.VimSessionOrientedStub.makeUserLoginMethod(username, password))
-            service_instance = vim.ServiceInstance('ServiceInstance', session_stub)
-        else:
-            connect_args.update(user=username, pwd=password)
-            service_instance = connect.SmartConnect(**connect_args)
-    except vim.fault.InvalidLogin as invalid_login:
-        msg = "Unable to log on to vCenter or ESXi API at %s:%s " % (hostname, port)
-        _raise_or_fail(msg="%s as %s: %s" % (msg, username, invalid_login.msg) + msg_suffix)
-    except vim.fault.NoPermission as no_permission:
-        _raise_or_fail(msg="User %s does not have required permission"
-                           " to log on to vCenter or ESXi API at %s:%s : %s" % (username, hostname, port, no_permission.msg))
-    except (requests.ConnectionError, ssl.SSLError) as generic_req_exc:
-        _raise_or_fail(msg="Unable to connect to vCenter or ESXi API at %s on TCP/%s: %s" % (hostname, port, generic_req_exc))
-    except vmodl.fault.InvalidRequest as invalid_request:
-        # Request is malformed
-        msg = "Failed to get a response from server %s:%s " % (hostname, port)
-        _raise_or_fail(msg="%s as request is malformed: %s" % (msg, invalid_request.msg) + msg_suffix)
-    except Exception as generic_exc:
-        msg = "Unknown error while connecting to vCenter or ESXi API at %s:%s" % (hostname, port) + msg_suffix
-        _raise_or_fail(msg="%s : %s" % (msg, generic_exc))
+    msg_suffix = " [proxy: %s:%d]" % (httpProxyHost, httpProxyPort) if httpProxyHost else ''
+
+    def _login():
+        service_instance = None
+        try:
+            if httpProxyHost:
+                connect_args.update(httpProxyHost=httpProxyHost, httpProxyPort=httpProxyPort)
+                smart_stub = connect.SmartStubAdapter(**connect_args)
+                session_stub = connect.VimSessionOrientedStub(smart_stub, connect.VimSessionOrientedStub.makeUserLoginMethod(username, password))
+                service_instance = vim.ServiceInstance('ServiceInstance', session_stub)
+            else:
+                connect_args.update(user=username, pwd=password)
+                service_instance = connect.SmartConnect(**connect_args)
+        except vim.fault.InvalidLogin as invalid_login:
+            msg = "Unable to log on to vCenter or ESXi API at %s:%s " % (hostname, port)
+            _raise_or_fail(msg="%s as %s: %s" % (msg, username, invalid_login.msg) + msg_suffix)
+        except vim.fault.NoPermission as no_permission:
+            _raise_or_fail(msg="User %s does not have required permission"
+                               " to log on to vCenter or ESXi API at %s:%s : %s" % (username, hostname, port, no_permission.msg))
+        except (requests.ConnectionError, ssl.SSLError) as generic_req_exc:
+            _raise_or_fail(msg="Unable to connect to vCenter or ESXi API at %s on TCP/%s: %s" % (hostname, port, generic_req_exc))
+        except vmodl.fault.InvalidRequest as invalid_request:
+            # Request is malformed
+            msg = "Failed to get a response from server %s:%s " % (hostname, port)
+            _raise_or_fail(msg="%s as request is malformed: %s" % (msg, invalid_request.msg) + msg_suffix)
+        except Exception as generic_exc:
+            msg = "Unknown error while connecting to vCenter or ESXi API at %s:%s" % (hostname, port) + msg_suffix
+            _raise_or_fail(msg="%s : %s" % (msg, generic_exc))
+        return service_instance
+
+    session_cache = SessionCache.from_env()
+    if session_cache is not None and ssl_context is not None and not httpProxyHost:
+        service_instance = session_cache.get_service_instance(hostname, username, password, port, _login, ssl_context)
+        # Keep the cached session alive for the next invocation
+        disconnect_atexit = False
+    else:
+        service_instance = _login()
 
     if service_instance is None:
         msg = "Unknown error while connecting to vCenter or ESXi API at %s:%s" % (hostname, port)
@@ -777,17 +1465,8 @@ def connect_to_api(module, disconnect_atexit=True, return_si=False, hostname=Non
 
 
 def get_all_objs(content, vimtype, folder=None, recurse=True):
-    if not folder:
-        folder = content.rootFolder
-
-    obj = {}
-    container = content.viewManager.CreateContainerView(folder, vimtype, recurse)
-    for managed_object_ref in container.view:
-        try:
-            obj.update({managed_object_ref: managed_object_ref.name})
-        except vmodl.fault.ManagedObjectNotFound:
-            pass
-    return obj
+    with ConnectionIndexes.of(content).lock:
+        return dict(ObjectNameIndex.get(content, vimtype, folder=folder, recurse=recurse, refresh=True).objects)
 
 
 def serialize_spec(clonespec):
@@ -1060,6 +1739,24 @@ class PyVmomi(PyvmomiClient):
         if self.content.customFieldsManager:  # not an ESXi
             self.custom_field_mgr = self.content.customFieldsManager.field
 
+    def connect_to_api(self, password, disconnect_atexit=True, return_si=False):
+        """
+        Connect to the vCenter/ESXi API, reusing a cached session if the
+        session cache is enabled, see SessionCache.
+        """
+        session_cache = SessionCache.from_env()
+        if session_cache is None or self.proxy_host:
+            return super(PyVmomi, self).connect_to_api(password, disconnect_atexit=disconnect_atexit, return_si=return_si)
+
+        def login():
+            return super(PyVmomi, self).connect_to_api(password, disconnect_atexit=False, return_si=True)[0]
+
+        service_instance = session_cache.get_service_instance(self.hostname, self.username, password, self.port, login,
+                                                              get_ssl_context(self.validate_certs))
+        if return_si:
+            return service_instance, service_instance.RetrieveContent()
+        return service_instance.RetrieveContent()
+
     def is_vcenter(self):
         """
         Check if given hostname is vCenter or ESXi host
@@ -1213,7 +1910,7 @@ class PyVmomi(PyvmomiClient):
                 # User defined datacenter's object
                 datacenter_obj = find_datacenter_by_name(self.content, self.params['datacenter'])
                 # Get Path for Datacenter
-                dcpath = compile_folder_path_for_object(vobj=datacenter_obj)
+                dcpath = compile_folder_path_for_object(vobj=datacenter_obj, content=self.content)
 
                 # Nested folder does not return trailing /
                 if not dcpath.endswith('/'):
@@ -1286,20 +1983,11 @@ class PyVmomi(PyvmomiClient):
         Returns: Folder of virtual machine if exists, else None
 
         """
-        folder_name = None
-        folder = vm_name.parent
-        if folder:
-            folder_name = folder.name
-            fp = folder.parent
-            # climb back up the tree to find our path, stop before the root folder
-            while fp is not None and fp.name is not None and fp != content.rootFolder:
-                folder_name = fp.name + '/' + folder_name
-                try:
-                    fp = fp.parent
-                except Exception:
-                    break
-            folder_name = '/' + folder_name
-        return folder_name
+        index = InventoryPathIndex.get(content)
+        folder = index.parent(vm_name)
+        if not folder:
+            return None
+        return '/' + '/'.join(index.path_names(folder))
 
     def get_vm_or_template(self, template_name=None):
         """
@@ -1596,8 +2284,8 @@ class PyVmomi(PyvmomiClient):
             folder = self.content.rootFolder
 
         data_store_clusters = get_all_objs(self.content, [vim.StoragePod], folder=folder)
-        for dsc in data_store_clusters:
-            if dsc.name == datastore_cluster_name:
+        for dsc, dsc_name in data_store_clusters.items():
+            if dsc_name == datastore_cluster_name:
                 return dsc
         return None
 
@@ -1657,8 +2345,8 @@ class PyVmomi(PyvmomiClient):
             folder = self.content.rootFolder
 
         resource_pools = get_all_objs(self.content, [vim.ResourcePool], folder=folder)
-        for rp in resource_pools:
-            if rp.name == resource_pool_name:
+        for rp, rp_name in resource_pools.items():
+            if rp_name == resource_pool_name:
                 return rp
         return None
 
@@ -1871,14 +2559,58 @@ class PyVmomi(PyvmomiClient):
         """
         Convert an object from pyVmomi into JSON.
 
+        The conversion is done by VmomiJSONEncoder, but its result is walked
+        directly instead of being dumped to a string and parsed back.
+
         Args:
           - obj (object): vim object
 
         Return:
           dict
         """
-        return json.loads(json.dumps(obj, cls=VmomiJSONEncoder.VmomiJSONEncoder,
-                                     sort_keys=True, strip_dynamic=True))
+        return self._to_json_types(obj, VmomiJSONEncoder.VmomiJSONEncoder(strip_dynamic=True))
+
+    def _to_json_types(self, obj, encoder):
+        if obj is None or isinstance(obj, bool):
+            return obj
+        if isinstance(obj, str):
+            return str(obj)
+        if isinstance(obj, int):
+            return int(obj)
+        if isinstance(obj, float):
+            return float(obj)
+        if isinstance(obj, (list, tuple)):
+            return [self._to_json_types(item, encoder) for item in obj]
+        if isinstance(obj, Mapping):
+            return dict((key, self._to_json_types(obj[key], encoder)) for key in sorted(obj))
+        return self._to_json_types(encoder.default(obj), encoder)
+
+    def _split_property(self, obj, prop):
+        """
+        Split a dotted property into the path the property collector can
+        retrieve and the remainder to extract from the retrieved value.
+        Property collector paths can't go through arrays, managed object
+        references or properties only defined on a subtype of the declared type.
+
+        Args:
+          - obj (object): vim object
+          - prop (str): dotted property
+
+        Return:
+          tuple of the path and the remainder, both may be empty
+        """
+        parts = prop.split('.')
+        vim_type = type(obj)
+        depth = 0
+        for part in parts:
+            try:
+                vim_type = vim_type._GetPropertyInfo(part).type
+            except AttributeError:
+                break
+            depth += 1
+            if not issubclass(vim_type, VmomiSupport.DataObject):
+                break
+        return '.'.join(parts[:depth]), '.'.join(parts[depth:])
 
     def to_json(self, obj, properties=None):
         """
@@ -1887,6 +2619,9 @@ class PyVmomi(PyvmomiClient):
         provided then all properties are deeply converted.  The resulting
         JSON is sorted to improve human readability.
 
+        The requested properties are retrieved with a single property
+        collector call, so only the selected values are transferred.
+
         Args:
           - obj (object): vim object
           - properties (list, optional): list of properties following
@@ -1899,15 +2634,32 @@ class PyVmomi(PyvmomiClient):
         """
         result = dict()
         if properties:
+            split_properties = dict((prop, self._split_property(obj, prop)) for prop in properties)
+            path_set = sorted(set(path for path, remainder in split_properties.values() if path))
+            values = {}
+            if path_set:
+                try:
+                    values = retrieve_objects_properties(self.content, [obj], path_set).get(obj, {})
+                except vmodl.query.InvalidProperty:
+                    # Fall back to reading the properties from the object
+                    split_properties = dict((prop, ('', prop)) for prop in properties)
+
             for prop in properties:
+                path, remainder = split_properties[prop]
                 try:
-                    if '.' in prop:
-                        key, remainder = prop.split('.', 1)
-                        tmp = dict()
-                        tmp[key] = self._extract(self._jsonify(getattr(obj, key)), remainder)
-                        self._deepmerge(result, tmp)
+                    if path:
+                        keys = path.split('.')
+                        value = self._jsonify(values.get(path))
                     else:
-                        result[prop] = self._jsonify(getattr(obj, prop))
+                        key, dummy, remainder = remainder.partition('.')
+                        keys = [key]
+                        value = self._jsonify(getattr(obj, key))
+                    if remainder:
+                        value = self._extract(value, remainder)
+                    for key in reversed(keys):
+                        value = {key: value}
+                    self._deepmerge(result, value)
+                    if '.' not in prop:
                         # To match gather_vm_facts output
                         prop_name = prop
                         if prop.lower() == '_moid':
@@ -1915,20 +2667,17 @@ class PyVmomi(PyvmomiClient):
                         elif prop.lower() == '_vimref':
                             prop_name = 'vimref'
                         result[prop_name] = result[prop]
-                except (AttributeError, KeyError):
+                except (AttributeError, KeyError, TypeError):
                     self.module.fail_json(msg="Property '{0}' not found.".format(prop))
         else:
             result = self._jsonify(obj)
         return result
 
     def get_folder_path(self, cur):
-        full_path = '/' + cur.name
-        while hasattr(cur, 'parent') and cur.parent:
-            if cur.parent == self.content.rootFolder:
-                break
-            cur = cur.parent
-            full_path = '/' + cur.name + full_path
-        return full_path
+        index = InventoryPathIndex.get(self.content)
+        parent = cur.parent
+        names = index.path_names(parent) if parent else []
+        return '/' + '/'.join(names + [cur.name])
 
     def find_obj_by_moid(self, object_type, moid):
         """
@@ -8,6 +8,10 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import hashlib
+import json
+import os
+import time
 import traceback
 
 REQUESTS_IMP_ERR = None
@@ -31,7 +35,7 @@ VSPHERE_IMP_ERR = None
 try:
     from com.vmware.vapi.std_client import DynamicID
     from vmware.vapi.vsphere.client import create_vsphere_client
-    from com.vmware.vapi.std.errors_client import Unauthorized
+    from com.vmware.vapi.std.errors_client import NotFound, Unauthorized
     from com.vmware.content.library_client import Item
     from com.vmware.vcenter_client import (Folder,
                                            Datacenter,
@@ -55,10 +59,138 @@ except ImportError:
         HAS_URLLIB3 = False
 
 from ansible.module_utils.basic import missing_required_lib
-from ansible.module_utils.common.text.converters import to_native
+from ansible.module_utils.common.text.converters import to_native, to_text
 from ansible_collections.vmware.vmware.plugins.module_utils.argument_spec import rest_compatible_argument_spec
 
 
+class VmwareRestObjectIndex(object):
+    """
+    Id and name index of the tags, categories and content library items of one
+    vSphere Automation API connection.
+
+    Tags and categories are fetched at most once per connection, lookups by
+    name then use the names already known instead of getting every object.
+
+    The names of tags and categories can also be kept on disk and shared by
+    module invocations, this is enabled by setting the VMWARE_REST_INDEX_CACHE
+    environment variable to a directory. Names are kept per hostname, username
+    and port with a time to live in seconds taken from
+    VMWARE_REST_INDEX_CACHE_TTL (default 300). A cached name is always
+    confirmed against the object before it is returned, objects known under
+    another name are checked last so an object renamed by someone else is
+    still found.
+    """
+
+    DEFAULT_TTL = 300
+
+    def __init__(self, cache_file=None, ttl=DEFAULT_TTL):
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.objects = {}
+        self.names = {}
+        self.fetched_at = {}
+        self.library_items = {}
+        self._load()
+
+    @classmethod
+    def from_params(cls, params):
+        """ Return the index for the connection described by the module parameters """
+        path = os.environ.get('VMWARE_REST_INDEX_CACHE')
+        if not path:
+            return cls()
+        try:
+            ttl = int(os.environ.get('VMWARE_REST_INDEX_CACHE_TTL', cls.DEFAULT_TTL))
+        except ValueError:
+            ttl = cls.DEFAULT_TTL
+        key = hashlib.sha256(to_text("%s|%s|%s" % (params.get('hostname'), params.get('username'), params.get('port'))).encode('utf-8'))
+        return cls(os.path.join(os.path.expanduser(path), 'rest-index-%s.json' % key.hexdigest()), ttl)
+
+    def _load(self):
+        if not self.cache_file:
+            return
+        try:
+            with open(self.cache_file) as f:
+                cached = json.load(f)
+            now = time.time()
+            for obj_id, (name, fetched_at) in cached.items():
+                if now - fetched_at < self.ttl:
+                    self.names[obj_id] = name
+                    self.fetched_at[obj_id] = fetched_at
+        except (IOError, OSError, ValueError, TypeError, AttributeError):
+            pass
+
+    def _save(self):
+        if not self.cache_file:
+            return
+        try:
+            if not os.path.isdir(os.path.dirname(self.cache_file)):
+                os.makedirs(os.path.dirname(self.cache_file), 0o700)
+            tmp_file = self.cache_file + '.%d.tmp' % os.getpid()
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(dict((obj_id, [name, self.fetched_at[obj_id]]) for obj_id, name in self.names.items()), f)
+            os.rename(tmp_file, self.cache_file)
+        except (IOError, OSError):
+            pass
+
+    def get(self, service, obj_id):
+        """
+        Return the object with the given id, fetched once per connection
+        Args:
+            service: Service of the object, e.g. tagging.Tag
+            obj_id: Id of the object
+
+        Returns: Object, None if it does not exist
+        """
+        if obj_id not in self.objects:
+            try:
+                obj = service.get(obj_id)
+            except NotFound:
+                obj = None
+            self.objects[obj_id] = obj
+            if obj is None:
+                self.names.pop(obj_id, None)
+            else:
+                self.names[obj_id] = obj.name
+                self.fetched_at[obj_id] = time.time()
+        return self.objects[obj_id]
+
+    def find(self, service, obj_ids, name):
+        """
+        Return the object with the given name among the given ids. Objects
+        known under that name are checked first, then the unknown ones, and
+        objects known under another name last, as they may have been renamed
+        since. Objects are fetched until one matches.
+        Args:
+            service: Service of the objects, e.g. tagging.Tag
+            obj_ids: Ids of the objects to search
+            name: Name of the object to find
+
+        Returns: Object if found else None
+        """
+        obj_ids = list(obj_ids)
+        candidates = [obj_id for obj_id in obj_ids if self.names.get(obj_id) == name]
+        candidates.extend(obj_id for obj_id in obj_ids if obj_id not in self.names)
+        candidates.extend(obj_id for obj_id in obj_ids if self.names.get(obj_id, name) != name)
+        fetched = False
+        result = None
+        for obj_id in candidates:
+            fetched = fetched or obj_id not in self.objects
+            obj = self.get(service, obj_id)
+            if obj is not None and obj.name == name:
+                result = obj
+                break
+        if fetched:
+            self._save()
+        return result
+
+    def forget(self, obj_id):
+        """ Drop an object which was renamed or deleted """
+        self.objects.pop(obj_id, None)
+        if self.names.pop(obj_id, None) is not None:
+            self._save()
+
+
 class VmwareRestClient(object):
     def __init__(self, module):
         """
@@ -69,6 +201,16 @@ class VmwareRestClient(object):
         self.params = module.params
         self.check_required_library()
         self.api_client = self.connect_to_vsphere_client()
+        self._object_index = None
+
+    @property
+    def object_index(self):
+        """
+        Id and name index of tags, categories and library items of this connection
+        """
+        if getattr(self, '_object_index', None) is None:
+            self._object_index = VmwareRestObjectIndex.from_params(self.params)
+        return self._object_index
 
     # Helper function
     def get_error_message(self, error):
@@ -184,7 +326,9 @@ class VmwareRestClient(object):
 
         add_tag = tags.append if isinstance(tags, list) else tags.add
         for tag_id in tag_ids:
-            add_tag(tag_service.get(tag_id))
+            tag_obj = self.object_index.get(tag_service, tag_id)
+            if tag_obj is not None:
+                add_tag(tag_obj)
 
         return tags
 
@@ -213,9 +357,10 @@ class VmwareRestClient(object):
 
         add_tag = tags.append if isinstance(tags, list) else tags.add
         for tag_obj in temp_tags_model:
+            category_obj = self.object_index.get(category_service, tag_obj.category_id)
             add_tag({
                 'id': tag_obj.id,
-                'category_name': category_service.get(tag_obj.category_id).name,
+                'category_name': None if category_obj is None else category_obj.name,
                 'name': tag_obj.name,
                 'description': tag_obj.description,
                 'category_id': tag_obj.category_id,
@@ -321,10 +466,14 @@ class VmwareRestClient(object):
         Returns:
             str: The item ID or None if the item is not found
         """
-        find_spec = Item.FindSpec(name=name)
-        item_ids = self.api_client.content.library.Item.find(find_spec)
-        item_id = item_ids[0] if item_ids else None
-        return item_id
+        key = (None, name)
+        if key not in self.object_index.library_items:
+            find_spec = Item.FindSpec(name=name)
+            item_ids = self.api_client.content.library.Item.find(find_spec)
+            if not item_ids:
+                return None
+            self.object_index.library_items[key] = item_ids[0]
+        return self.object_index.library_items[key]
 
     def get_library_item_from_content_library_name(self, name, content_library_name):
         """
@@ -336,16 +485,19 @@ class VmwareRestClient(object):
         Returns:
             str: The item ID or None if the item is not found
         """
-        cl_find_spec = self.api_client.content.Library.FindSpec(name=content_library_name)
-        cl_item_ids = self.api_client.content.Library.find(cl_find_spec)
-        cl_item_id = cl_item_ids[0] if cl_item_ids else None
-        if cl_item_id:
+        key = (content_library_name, name)
+        if key not in self.object_index.library_items:
+            cl_find_spec = self.api_client.content.Library.FindSpec(name=content_library_name)
+            cl_item_ids = self.api_client.content.Library.find(cl_find_spec)
+            cl_item_id = cl_item_ids[0] if cl_item_ids else None
+            if not cl_item_id:
+                return None
             find_spec = Item.FindSpec(name=name, library_id=cl_item_id)
             item_ids = self.api_client.content.library.Item.find(find_spec)
-            item_id = item_ids[0] if item_ids else None
-            return item_id
-        else:
-            return None
+            if not item_ids:
+                return None
+            self.object_index.library_items[key] = item_ids[0]
+        return self.object_index.library_items[key]
 
     def get_datacenter_by_name(self, datacenter_name):
         """
@@ -463,6 +615,21 @@ class VmwareRestClient(object):
                 return svc_obj
         return None
 
+    def find_svc_object_by_name(self, service, svc_obj_name=None):
+        """
+        Return service object by name, using the names already known to the object index of this connection
+        Args:
+            service: Service object
+            svc_obj_name: Name of service object to find
+
+        Returns: Service object if found else None
+
+        """
+        if not svc_obj_name:
+            return None
+
+        return self.object_index.find(service, service.list(), svc_obj_name)
+
     def get_tag_by_name(self, tag_name=None):
         """
         Return tag object by name
@@ -474,7 +641,7 @@ class VmwareRestClient(object):
         if not tag_name:
             return None
 
-        return self.search_svc_object_by_name(service=self.api_client.tagging.Tag, svc_obj_name=tag_name)
+        return self.find_svc_object_by_name(service=self.api_client.tagging.Tag, svc_obj_name=tag_name)
 
     def get_category_by_name(self, category_name=None):
         """
@@ -487,7 +654,7 @@ class VmwareRestClient(object):
         if not category_name:
             return None
 
-        return self.search_svc_object_by_name(service=self.api_client.tagging.Category, svc_obj_name=category_name)
+        return self.find_svc_object_by_name(service=self.api_client.tagging.Category, svc_obj_name=category_name)
 
     def get_tag_by_category_id(self, tag_name=None, category_id=None):
         """
@@ -501,16 +668,10 @@ class VmwareRestClient(object):
             return None
 
         if category_id is None:
-            return self.search_svc_object_by_name(service=self.api_client.tagging.Tag, svc_obj_name=tag_name)
+            return self.find_svc_object_by_name(service=self.api_client.tagging.Tag, svc_obj_name=tag_name)
 
-        result = None
-        for tag_id in self.api_client.tagging.Tag.list_tags_for_category(category_id):
-            tag_obj = self.api_client.tagging.Tag.get(tag_id)
-            if tag_obj.name == tag_name:
-                result = tag_obj
-                break
-
-        return result
+        tag_service = self.api_client.tagging.Tag
+        return self.object_index.find(tag_service, tag_service.list_tags_for_category(category_id), tag_name)
 
     def get_tag_by_category_name(self, tag_name=None, category_name=None):
         """
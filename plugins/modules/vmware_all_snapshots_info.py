@@ -123,7 +123,11 @@ vmware_all_snapshots_info:
 
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.community.vmware.plugins.module_utils.vmware import PyVmomi, list_snapshots_recursively
+from ansible_collections.community.vmware.plugins.module_utils.vmware import (
+    PyVmomi,
+    InventoryPathIndex,
+    iter_objects_properties,
+    list_snapshots_recursively)
 from ansible_collections.vmware.vmware.plugins.module_utils.argument_spec import base_argument_spec
 
 try:
@@ -136,31 +140,32 @@ class VMwareSnapshotInfo(PyVmomi):
     def __init__(self, module):
         super(VMwareSnapshotInfo, self).__init__(module)
 
-    def list_snapshots(self, vm):
-        return (
-            list_snapshots_recursively(vm.snapshot.rootSnapshotList)
-            if vm.snapshot
-            else []
-        )
-
-    def get_all_vms(self, datacenter):
-        content = self.content
-
+    def get_vms_with_snapshots(self, datacenter):
+        """
+        Get the name, folder and snapshot tree of the VMs of the datacenter which have snapshots.
+        The properties of all VMs are retrieved page by page with the property collector.
+        """
         datacenter_obj = self.find_datacenter_by_name(datacenter)
-        container = content.viewManager.CreateContainerView(
-            datacenter_obj, [vim.VirtualMachine], True
-        )
-        vms = container.view
-        container.Destroy()
-        return vms
+        if datacenter_obj is None:
+            self.module.fail_json(msg="Failed to find datacenter %s" % datacenter)
+
+        index = InventoryPathIndex.get(self.content)
+        for object_content in iter_objects_properties(
+            self.content, [vim.VirtualMachine], ['name', 'parent', 'snapshot.rootSnapshotList'], folder=datacenter_obj
+        ):
+            props = dict((prop.name, prop.val) for prop in object_content.propSet)
+            if not props.get('snapshot.rootSnapshotList'):
+                continue
+            parent = props.get('parent')
+            yield props.get('name'), index.name(parent) if parent else None, props['snapshot.rootSnapshotList']
 
     def gather_snapshots_info(self, filters, match_type, datacenter=None):
         snapshot_data = []
-        for vm in self.get_all_vms(datacenter):
-            for snapshot in self.list_snapshots(vm):
+        for vm_name, folder, root_snapshot_list in self.get_vms_with_snapshots(datacenter):
+            for snapshot in list_snapshots_recursively(root_snapshot_list):
                 snapshot_info = {
-                    "vm_name": vm.name,
-                    "folder": vm.parent.name,
+                    "vm_name": vm_name,
+                    "folder": folder,
                     **snapshot,
                 }
                 if self.passes_filters(snapshot_info, filters, match_type):
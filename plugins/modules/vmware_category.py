@@ -301,6 +301,7 @@ class VmwareCategory(VmwareRestClient):
         if any(change_list):
             try:
                 self.category_service.update(category_id, category_update_spec)
+                self.object_index.forget(category_id)
                 changed = True
             except Error as error:
                 self.module.fail_json(msg="%s" % self.get_error_message(error))
@@ -313,6 +314,7 @@ class VmwareCategory(VmwareRestClient):
         category_id = self.global_categories[self.category_name]['category_id']
         try:
             self.category_service.delete(category_id=category_id)
+            self.object_index.forget(category_id)
         except Error as error:
             self.module.fail_json(msg="%s" % self.get_error_message(error))
         self.module.exit_json(changed=True,
@@ -334,7 +336,9 @@ class VmwareCategory(VmwareRestClient):
         try:
 
             for category in self.category_service.list():
-                category_obj = self.category_service.get(category)
+                category_obj = self.object_index.get(self.category_service, category)
+                if category_obj is None:
+                    continue
                 self.global_categories[category_obj.name] = dict(
                     category_description=category_obj.description,
                     category_used_by=category_obj.used_by,
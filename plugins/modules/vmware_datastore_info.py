@@ -173,7 +173,8 @@ from ansible_collections.community.vmware.plugins.module_utils.vmware import (
     PyVmomi,
     get_all_objs,
     find_cluster_by_name,
-    get_parent_datacenter)
+    get_parent_datacenter,
+    retrieve_objects_properties)
 from ansible_collections.vmware.vmware.plugins.module_utils.argument_spec import base_argument_spec
 from ansible_collections.community.vmware.plugins.module_utils.vmware_rest_client import VmwareRestClient
 
@@ -187,27 +188,48 @@ class VMwareHostDatastore(PyVmomi):
         self.gather_vmfs_mount_info = self.module.params['gather_vmfs_mount_info']
         self.schema = self.module.params['schema']
         self.properties = self.module.params['properties']
+        self.host_mount_info = {}
+        self.datastore_cluster_names = {}
         if self.module.params['show_tag']:
             self.vmware_client = VmwareRestClient(self.module)
 
-    def check_datastore_host(self, esxi_host, datastore):
-        """ Get all datastores of specified ESXi host """
-        esxi = self.find_hostsystem_by_name(esxi_host)
-        if esxi is None:
-            self.module.fail_json(msg="Failed to find ESXi hostname %s " % esxi_host)
-        storage_system = esxi.configManager.storageSystem
-        host_file_sys_vol_mount_info = storage_system.fileSystemVolumeInfo.mountInfo
-        for host_mount_info in host_file_sys_vol_mount_info:
-            if host_mount_info.volume.name == datastore:
-                return host_mount_info
-        return None
+    def get_host_mount_info(self, esxi, datastore):
+        """ Get the mount info of a datastore on an ESXi host, the mount table of every host is fetched once """
+        if esxi not in self.host_mount_info:
+            mount_info = {}
+            for host_mount_info in esxi.configManager.storageSystem.fileSystemVolumeInfo.mountInfo:
+                mount_info.setdefault(host_mount_info.volume.name, host_mount_info)
+            self.host_mount_info[esxi] = mount_info
+        return self.host_mount_info[esxi].get(datastore)
+
+    def get_datastore_cluster_name(self, parent):
+        if not isinstance(parent, vim.StoragePod):
+            return 'N/A'
+        if parent not in self.datastore_cluster_names:
+            self.datastore_cluster_names[parent] = parent.name
+        return self.datastore_cluster_names[parent]
 
     def build_datastore_list(self, datastore_list):
         """ Build list with datastores """
+        datastore_list = list(datastore_list)
+        # retrieve what is needed for all datastores at once, and filter on name before building anything
+        properties = ['name', 'parent']
+        if self.schema == 'summary':
+            properties.append('summary')
+            if self.gather_nfs_mount_info or self.gather_vmfs_mount_info:
+                properties.append('host')
+        datastore_properties = retrieve_objects_properties(self.content, datastore_list, properties)
+
         datastores = list()
         for datastore in datastore_list:
+            props = datastore_properties.get(datastore)
+            if props is None:
+                continue
+            if self.module.params['name'] and props['name'] != self.module.params['name']:
+                continue
+
             if self.schema == 'summary':
-                summary = datastore.summary
+                summary = props['summary']
                 datastore_summary = dict()
                 datastore_summary['accessible'] = summary.accessible
                 datastore_summary['capacity'] = summary.capacity
@@ -219,12 +241,12 @@ class VMwareHostDatastore(PyVmomi):
                 if self.gather_nfs_mount_info or self.gather_vmfs_mount_info:
                     if self.gather_nfs_mount_info and summary.type.startswith("NFS"):
                         # get mount info from the first ESXi host attached to this NFS datastore
-                        host_mount_info = self.check_datastore_host(summary.datastore.host[0].key.name, summary.name)
+                        host_mount_info = self.get_host_mount_info(props['host'][0].key, summary.name)
                         datastore_summary['nfs_server'] = host_mount_info.volume.remoteHost
                         datastore_summary['nfs_path'] = host_mount_info.volume.remotePath
                     if self.gather_vmfs_mount_info and summary.type == "VMFS":
                         # get mount info from the first ESXi host attached to this VMFS datastore
-                        host_mount_info = self.check_datastore_host(summary.datastore.host[0].key.name, summary.name)
+                        host_mount_info = self.get_host_mount_info(props['host'][0].key, summary.name)
                         datastore_summary['vmfs_blockSize'] = host_mount_info.volume.blockSize
                         datastore_summary['vmfs_version'] = host_mount_info.volume.version
                         datastore_summary['vmfs_uuid'] = host_mount_info.volume.uuid
@@ -235,27 +257,17 @@ class VMwareHostDatastore(PyVmomi):
                 datastore_summary['url'] = summary.url
                 # Calculated values
                 datastore_summary['provisioned'] = summary.capacity - summary.freeSpace + summary.uncommitted
-                datastore_summary['datastore_cluster'] = 'N/A'
-                if isinstance(datastore.parent, vim.StoragePod):
-                    datastore_summary['datastore_cluster'] = datastore.parent.name
+                datastore_summary['datastore_cluster'] = self.get_datastore_cluster_name(props.get('parent'))
 
                 if self.module.params['show_tag']:
                     datastore_summary['tags'] = self.vmware_client.get_tags_for_datastore(datastore._moId)
 
-                if self.module.params['name']:
-                    if datastore_summary['name'] == self.module.params['name']:
-                        datastores.extend([datastore_summary])
-                else:
-                    datastores.extend([datastore_summary])
+                datastores.append(datastore_summary)
             else:
                 temp_ds = self.to_json(datastore, self.properties)
                 if self.module.params['show_tag']:
                     temp_ds.update({'tags': self.vmware_client.get_tags_for_datastore(datastore._moId)})
-                if self.module.params['name']:
-                    if datastore.name == self.module.params['name']:
-                        datastores.extend(([temp_ds]))
-                else:
-                    datastores.extend(([temp_ds]))
+                datastores.append(temp_ds)
 
         return datastores
 
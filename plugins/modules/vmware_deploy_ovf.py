@@ -99,6 +99,15 @@ options:
         - Force the given properties to be inserted into an OVF Environment and injected through VMware Tools.
         type: bool
         default: false
+    parallel_uploads:
+        description:
+        - Number of disk files uploaded to the host at the same time when deploying from O(ovf).
+        - Each upload reads its file from the OVF directory or the OVA file independently.
+        - If one upload fails, the import is aborted and the remaining uploads are not started.
+        - Not used with O(url), the host then pulls the files itself.
+        default: 1
+        type: int
+        version_added: '6.3.0'
     name:
         description:
         - Name of the VM to work with.
@@ -122,6 +131,8 @@ options:
         description:
         - 'URL for OVA file to deploy.'
         - Required if O(ovf) is not set.
+        - The server must support range requests. The OVF descriptor is read from the OVA by the module, the disk files are
+          pulled from O(url) by the host.
         - O(url) and O(ovf) are mutually exclusive parameters.
         type: str
         version_added: '3.9.0'
@@ -218,10 +229,14 @@ import traceback
 
 import xml.etree.ElementTree as ET
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPException
 from threading import Thread
 
 from ansible.module_utils.common.text.converters import to_native
 from ansible.module_utils.basic import AnsibleModule
+from urllib.error import HTTPError
 from urllib.request import Request, urlopen
 from ansible.module_utils.urls import generic_urlparse, open_url, urlparse, urlunparse
 from ansible_collections.community.vmware.plugins.module_utils.vmware import (
@@ -250,8 +265,26 @@ def path_exists(value):
 
 
 class WebHandle(object):
+    """
+    Seekable file object over a remote OVA, read with HTTP range requests.
+
+    Reads are served from a cache of fixed size blocks, so the many small reads
+    tarfile makes to walk the member headers cost one request per block. Blocks
+    missing for a read are fetched in parallel, and an interrupted range is
+    retried from the last byte received.
+    """
+    # size of the blocks fetched with one range request
+    block_size = 256 * 1024
+    # number of blocks kept in the cache
+    cache_blocks = 64
+    # number of range requests made at the same time for one read
+    max_workers = 4
+    # number of times an interrupted range request is resumed
+    retries = 3
+
     def __init__(self, url):
         self.url = url
+        self._blocks = OrderedDict()
         self.thumbprint = None
         self.ssl_context = None
 
@@ -336,18 +369,76 @@ class WebHandle(object):
     def seekable(self):
         return True
 
-    def read(self, amount):
-        start = self.offset
-        end = self.offset + amount - 1
-        req = Request(self.url,
-                      headers={'Range': 'bytes=%d-%d' % (start, end)})
-        r = urlopen(req) if not self.ssl_context else urlopen(
-            req, context=self.ssl_context)
-        self.offset += amount
-        result = r.read(amount)
-        r.close()
+    def read(self, amount=-1):
+        if amount is None or amount < 0:
+            amount = self.st_size - self.offset
+        end = min(self.offset + amount, self.st_size)
+        if end <= self.offset:
+            return b''
+        first = self.offset // self.block_size
+        last = (end - 1) // self.block_size
+        data = b''.join(self._get_blocks(range(first, last + 1)))
+        start = self.offset - first * self.block_size
+        result = data[start:start + end - self.offset]
+        self.offset = end
         return result
 
+    def _get_blocks(self, indexes):
+        missing = [index for index in indexes if index not in self._blocks]
+        if len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(missing), self.max_workers)) as executor:
+                fetched = list(executor.map(self._fetch_block, missing))
+        else:
+            fetched = [self._fetch_block(index) for index in missing]
+        self._blocks.update(zip(missing, fetched))
+
+        blocks = []
+        for index in indexes:
+            self._blocks.move_to_end(index)
+            blocks.append(self._blocks[index])
+        while len(self._blocks) > self.cache_blocks:
+            self._blocks.popitem(last=False)
+        return blocks
+
+    def _fetch_block(self, index):
+        start = index * self.block_size
+        return self._fetch_range(start, min(start + self.block_size, self.st_size) - 1)
+
+    def _fetch_range(self, start, end):
+        """ Fetch the bytes from start to end included, resuming an interrupted transfer where it stopped """
+        chunks = []
+        received = 0
+        attempt = 0
+        while True:
+            try:
+                req = Request(self.url, headers={'Range': 'bytes=%d-%d' % (start + received, end)})
+                r = urlopen(req) if not self.ssl_context else urlopen(req, context=self.ssl_context)
+                try:
+                    if r.status != 206:
+                        raise Exception("Range request to %s returned status %d" % (self.url, r.status))
+                    while start + received <= end:
+                        chunk = r.read(end + 1 - start - received)
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+                        received += len(chunk)
+                finally:
+                    r.close()
+                if start + received > end:
+                    return b''.join(chunks)
+                error = "connection closed after %d of %d bytes" % (received, end + 1 - start)
+            except HTTPError as e:
+                if e.code < 500:
+                    raise
+                error = e
+            except (OSError, HTTPException) as e:
+                error = e
+            attempt += 1
+            if attempt > self.retries:
+                raise Exception("Reading bytes %d-%d of %s failed after %d retries: %s"
+                                % (start, end, self.url, self.retries, to_native(error)))
+            time.sleep(attempt)
+
     # A slightly more accurate percentage
     def progress(self):
         return int(100.0 * self.offset / self.st_size)
@@ -387,6 +478,8 @@ class TarFileProgressReader(tarfile.ExFileObject):
 class VMDKUploader(Thread):
     def __init__(self, vmdk, url, validate_certs=True, tarinfo=None, create=False):
         Thread.__init__(self)
+        # Do not keep the module alive for uploads left running after a failure
+        self.daemon = True
 
         self.vmdk = vmdk
 
@@ -440,8 +533,18 @@ class VMDKUploader(Thread):
     def run(self):
         if self.tarinfo:
             try:
-                with TarFileProgressReader(self.vmdk, self.tarinfo) as self.f:
-                    self._open_url()
+                if isinstance(self.vmdk, tarfile.TarFile):
+                    tar = self.vmdk
+                else:
+                    # Path of the OVA, open it for this upload only so that
+                    # concurrent uploads do not share the file position
+                    tar = tarfile.open(self.vmdk)
+                try:
+                    with TarFileProgressReader(tar, self.tarinfo) as self.f:
+                        self._open_url()
+                finally:
+                    if tar is not self.vmdk:
+                        tar.close()
             except Exception:
                 self.e = sys.exc_info()
         else:
@@ -722,7 +825,7 @@ class VMwareDeployOvf(PyVmomi):
 
                 vmdk_tarinfo = None
                 if self.tar:
-                    vmdk = self.tar
+                    vmdk = self.params['ovf']
                     try:
                         vmdk_tarinfo = self.tar.getmember(file_item.path)
                     except KeyError:
@@ -754,15 +857,28 @@ class VMwareDeployOvf(PyVmomi):
                     )
                 )
 
-            total_size = sum(u.size for u in uploaders)
-            total_bytes_read = [0] * len(uploaders)
-            for i, uploader in enumerate(uploaders):
+            self.run_uploaders(lease, uploaders)
+
+    def run_uploaders(self, lease, uploaders):
+        '''
+        Run up to ``parallel_uploads`` uploaders at a time and report their overall progress to the lease.
+        The first failure aborts the lease, which ends the other uploads, and fails the module.
+        '''
+        max_running = max(1, self.params['parallel_uploads'] or 1)
+        total_size = sum(u.size for u in uploaders) or 1
+        pending = list(uploaders)
+        running = []
+        while pending or running:
+            while pending and len(running) < max_running:
+                uploader = pending.pop(0)
                 uploader.start()
-                while uploader.is_alive():
-                    time.sleep(0.1)
-                    total_bytes_read[i] = uploader.bytes_read
-                    lease.HttpNfcLeaseProgress(int(100.0 * sum(total_bytes_read) / total_size))
+                running.append(uploader)
 
+            time.sleep(0.1)
+            lease.HttpNfcLeaseProgress(int(100.0 * sum(u.bytes_read for u in uploaders) / total_size))
+
+            for uploader in [u for u in running if not u.is_alive()]:
+                running.remove(uploader)
                 if uploader.e:
                     lease.HttpNfcLeaseAbort(
                         vmodl.fault.SystemError(reason='%s' % to_native(uploader.e[1]))
@@ -868,6 +984,10 @@ def main():
         'url': {
             'type': 'str',
         },
+        'parallel_uploads': {
+            'type': 'int',
+            'default': 1,
+        },
         'disk_provisioning': {
             'choices': [
                 'flat',
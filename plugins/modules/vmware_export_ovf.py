@@ -16,6 +16,7 @@ module: vmware_export_ovf
 short_description: Exports a VMware virtual machine to an OVF file, device files and a manifest file
 description: >
    This module can be used to export a VMware virtual machine to OVF template from vCenter server or ESXi host.
+   The template can also be packed into a single OVA file.
 author:
 - Diane Wang (@Tomorrow9) <dianew@vmware.com>
 notes: []
@@ -78,6 +79,23 @@ options:
     - If the vmdk file is too large, you can increase the value.
     default: 30
     type: int
+  parallel_downloads:
+    description:
+    - Number of device files downloaded from the host at the same time.
+    - If one download fails, the export is aborted and the remaining downloads are not started.
+    default: 1
+    type: int
+    version_added: '6.3.0'
+  export_format:
+    description:
+    - Format of the exported template.
+    - With V(ovf), the OVF descriptor, the manifest and the device files are placed in a folder named with VM name under O(export_dir).
+    - With V(ova), they are packed into a single file named with VM name and the C(.ova) extension under O(export_dir),
+      the OVF descriptor first and the manifest second, and the intermediate folder is removed.
+    default: ovf
+    choices: [ ovf, ova ]
+    type: str
+    version_added: '6.3.0'
 extends_documentation_fragment:
 - vmware.vmware.base_options
 
@@ -92,11 +110,24 @@ EXAMPLES = r'''
     export_with_images: true
     export_dir: /path/to/ovf_template/
   delegate_to: localhost
+
+- name: Export a VM to a single OVA file, downloading up to 4 disks at the same time
+  community.vmware.vmware_export_ovf:
+    hostname: '{{ vcenter_hostname }}'
+    username: '{{ vcenter_username }}'
+    password: '{{ vcenter_password }}'
+    name: '{{ vm_name }}'
+    export_dir: /path/to/ova_template/
+    export_format: ova
+    parallel_downloads: 4
+  delegate_to: localhost
 '''
 
 RETURN = r'''
 instance:
-    description: list of the exported files, if exported from vCenter server, device file is not named with vm name
+    description:
+    - list of the exported files, if exported from vCenter server, device file is not named with vm name
+    - with O(export_format=ova), only the path of the OVA file is returned as C(ova_file)
     returned: always
     type: dict
     sample: None
@@ -104,6 +135,7 @@ instance:
 
 import os
 import hashlib
+import tarfile
 from time import sleep
 from threading import Thread
 from ansible.module_utils.urls import open_url
@@ -150,6 +182,54 @@ class LeaseProgressUpdater(Thread):
                 return
 
 
+class DeviceDownloader(Thread):
+    """
+    Download one device file of an export lease, hashing it while it is
+    streamed to disk and syncing it once it is complete.
+    """
+    def __init__(self, device_key, device_url, target_file, headers, chunk_size, timeout):
+        Thread.__init__(self)
+        # a failed export must not wait for the other downloads to end
+        self.daemon = True
+        self.device_key = device_key
+        self.device_url = device_url
+        self.target_file = target_file
+        self.headers = headers
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self.bytes_written = 0
+        self.sha256 = None
+        self.e = None
+
+    def run(self):
+        try:
+            response = open_url(self.device_url, headers=self.headers, validate_certs=False, timeout=self.timeout)
+        except Exception as err:
+            self.e = 'Exception caught when getting %s, %s' % (self.device_url, to_text(err))
+            return
+        if not response:
+            self.e = 'Getting %s failed' % self.device_url
+            return
+        if response.getcode() >= 400:
+            self.e = 'Getting %s return code %d' % (self.device_url, response.getcode())
+            return
+        sha256_hash = hashlib.sha256()
+        try:
+            with open(self.target_file, 'wb') as handle:
+                block = response.read(self.chunk_size)
+                while block:
+                    handle.write(block)
+                    sha256_hash.update(block)
+                    self.bytes_written += len(block)
+                    block = response.read(self.chunk_size)
+                handle.flush()
+                os.fsync(handle.fileno())
+        except Exception as err:
+            self.e = 'Exception caught when downloading %s, %s' % (self.device_url, to_text(err))
+            return
+        self.sha256 = sha256_hash.hexdigest()
+
+
 class VMwareExportVmOvf(PyVmomi):
     def __init__(self, module):
         super(VMwareExportVmOvf, self).__init__(module)
@@ -172,42 +252,64 @@ class VMwareExportVmOvf(PyVmomi):
                                           % (self.ovf_dir, to_text(err)))
         self.mf_file = os.path.join(self.ovf_dir, vm_obj.name + '.mf')
 
-    def download_device_files(self, headers, temp_target_disk, device_url, lease_updater, total_bytes_written,
-                              total_bytes_to_write):
-        mf_content = 'SHA256(' + os.path.basename(temp_target_disk) + ')= '
-        sha256_hash = hashlib.sha256()
-        response = None
+    def download_device_files(self, downloads, lease_updater, total_bytes_to_write):
+        """
+        Run up to ``parallel_downloads`` downloads at a time and feed their overall progress to the lease updater.
+        The first failure aborts the lease, which ends the other downloads, and fails the module.
+        """
+        max_running = max(1, self.params['parallel_downloads'] or 1)
+        pending = list(downloads)
+        running = []
+        while pending or running:
+            while pending and len(running) < max_running:
+                download = pending.pop(0)
+                download.start()
+                running.append(download)
 
-        with open(self.mf_file, 'a') as mf_handle:
-            with open(temp_target_disk, 'wb') as handle:
-                try:
-                    response = open_url(device_url, headers=headers, validate_certs=False, timeout=self.download_timeout)
-                except Exception as err:
-                    lease_updater.httpNfcLease.HttpNfcLeaseAbort()
-                    lease_updater.stop()
-                    self.module.fail_json(msg='Exception caught when getting %s, %s' % (device_url, to_text(err)))
-                if not response:
-                    lease_updater.httpNfcLease.HttpNfcLeaseAbort()
-                    lease_updater.stop()
-                    self.module.fail_json(msg='Getting %s failed' % device_url)
-                if response.getcode() >= 400:
+            sleep(0.1)
+            written_percent = (sum(d.bytes_written for d in downloads) * 100) / total_bytes_to_write
+            lease_updater.progressPercent = min(int(written_percent), 100)
+
+            for download in [d for d in running if not d.is_alive()]:
+                running.remove(download)
+                if download.e:
                     lease_updater.httpNfcLease.HttpNfcLeaseAbort()
                     lease_updater.stop()
-                    self.module.fail_json(msg='Getting %s return code %d' % (device_url, response.getcode()))
-                current_bytes_written = 0
-                block = response.read(self.chunk_size)
-                while block:
-                    handle.write(block)
-                    sha256_hash.update(block)
-                    handle.flush()
-                    os.fsync(handle.fileno())
-                    current_bytes_written += len(block)
-                    block = response.read(self.chunk_size)
-                written_percent = ((current_bytes_written + total_bytes_written) * 100) / total_bytes_to_write
-                lease_updater.progressPercent = int(written_percent)
-            mf_handle.write(mf_content + sha256_hash.hexdigest() + '\n')
-        self.facts['device_files'].append(temp_target_disk)
-        return current_bytes_written
+                    self.module.fail_json(msg=download.e)
+
+        with open(self.mf_file, 'a') as mf_handle:
+            for download in downloads:
+                mf_handle.write('SHA256(' + os.path.basename(download.target_file) + ')= ' + download.sha256 + '\n')
+                self.facts['device_files'].append(download.target_file)
+
+    def pack_ova(self, vm_obj):
+        """
+        Pack the exported files into a single OVA file, the OVF descriptor first and the manifest second
+        as the OVF specification requires, then remove the intermediate folder.
+        The GNU format is used since ustar cannot store a disk larger than 8 GiB.
+        """
+        ova_file = os.path.join(self.params['export_dir'], vm_obj.name + '.ova')
+        members = [self.facts['ovf_file'], self.facts['manifest']] + self.facts['device_files']
+        packed = False
+        try:
+            with open(ova_file, 'wb') as handle:
+                with tarfile.open(fileobj=handle, mode='w', format=tarfile.GNU_FORMAT) as tar:
+                    for member in members:
+                        tar.add(member, arcname=os.path.basename(member))
+                handle.flush()
+                os.fsync(handle.fileno())
+            packed = True
+            for member in members:
+                os.remove(member)
+            if not os.listdir(self.ovf_dir):
+                os.rmdir(self.ovf_dir)
+        except (OSError, ValueError, tarfile.TarError) as err:
+            # a partial OVA is useless, the exported files are kept instead
+            if not packed and os.path.exists(ova_file):
+                os.remove(ova_file)
+            self.module.fail_json(msg='Exception caught when create OVA file %s, with error %s'
+                                      % (ova_file, to_text(err)))
+        self.facts = {'ova_file': ova_file}
 
     def export_to_ovf_files(self, vm_obj):
         self.create_export_dir(vm_obj=vm_obj)
@@ -221,7 +323,6 @@ class VMwareExportVmOvf(PyVmomi):
         http_nfc_lease = vm_obj.ExportVm()
         # create a thread to track file download progress
         lease_updater = LeaseProgressUpdater(http_nfc_lease, self.lease_interval)
-        total_bytes_written = 0
         # total storage space occupied by the virtual machine across all datastores
         total_bytes_to_write = vm_obj.summary.storage.unshared
         # new deployed VM with no OS installed
@@ -238,6 +339,7 @@ class VMwareExportVmOvf(PyVmomi):
         try:
             while True:
                 if http_nfc_lease.state == vim.HttpNfcLease.State.ready:
+                    downloads = []
                     for deviceUrl in http_nfc_lease.info.deviceUrl:
                         file_download = False
                         if deviceUrl.targetId and deviceUrl.disk:
@@ -261,18 +363,21 @@ class VMwareExportVmOvf(PyVmomi):
                         if '*' in device_url:
                             device_url = device_url.replace('*', self.params['hostname'])
                         if file_download:
-                            current_bytes_written = self.download_device_files(headers=headers,
-                                                                               temp_target_disk=temp_target_disk,
-                                                                               device_url=device_url,
-                                                                               lease_updater=lease_updater,
-                                                                               total_bytes_written=total_bytes_written,
-                                                                               total_bytes_to_write=total_bytes_to_write)
-                            total_bytes_written += current_bytes_written
-                            ovf_file = vim.OvfManager.OvfFile()
-                            ovf_file.deviceId = deviceUrl.key
-                            ovf_file.path = device_file_name
-                            ovf_file.size = current_bytes_written
-                            ovf_files.append(ovf_file)
+                            downloads.append(DeviceDownloader(device_key=deviceUrl.key,
+                                                              device_url=device_url,
+                                                              target_file=temp_target_disk,
+                                                              headers=headers,
+                                                              chunk_size=self.chunk_size,
+                                                              timeout=self.download_timeout))
+                    self.download_device_files(downloads=downloads,
+                                               lease_updater=lease_updater,
+                                               total_bytes_to_write=total_bytes_to_write)
+                    for download in downloads:
+                        ovf_file = vim.OvfManager.OvfFile()
+                        ovf_file.deviceId = download.device_key
+                        ovf_file.path = os.path.basename(download.target_file)
+                        ovf_file.size = download.bytes_written
+                        ovf_files.append(ovf_file)
                     break
                 if http_nfc_lease.state == vim.HttpNfcLease.State.initializing:
                     sleep(2)
@@ -310,6 +415,8 @@ class VMwareExportVmOvf(PyVmomi):
                 http_nfc_lease.HttpNfcLeaseComplete()
                 lease_updater.stop()
                 self.facts.update({'manifest': self.mf_file, 'ovf_file': ovf_descriptor_path})
+                if self.params['export_format'] == 'ova':
+                    self.pack_ova(vm_obj)
         except Exception as err:
             kwargs = {
                 'changed': False,
@@ -334,6 +441,8 @@ def main():
         export_with_images=dict(type='bool', default=False),
         export_with_extraconfig=dict(type='bool', default=False),
         download_timeout=dict(type='int', default=30),
+        parallel_downloads=dict(type='int', default=1),
+        export_format=dict(type='str', default='ovf', choices=['ovf', 'ova']),
     )
 
     module = AnsibleModule(argument_spec=argument_spec,
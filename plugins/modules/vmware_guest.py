@@ -74,7 +74,7 @@ options:
   uuid:
     description:
     - UUID of the virtual machine to manage if known, this is VMware's unique identifier.
-    - This is required if O(name) is not supplied.
+    - This is required if O(name) or O(batch) is not supplied.
     - If virtual machine does not exists, then this parameter is ignored.
     - Please note that a supplied UUID will be ignored on virtual machine creation, as VMware creates the UUID internally.
     type: str
@@ -804,6 +804,26 @@ options:
     - Specify convert disk type while cloning template or virtual machine.
     choices: [ 'thin', 'thick', 'eagerzeroedthick' ]
     type: str
+  batch:
+    description:
+    - List of virtual machines to manage in a single module run, for example to deploy many virtual machines from one template.
+    - Every item takes the options of this module, like O(name), O(template), O(folder), O(state) or O(networks),
+      except the connection options. Options which are not set in an item are taken from the module options.
+    - An option of type dict set in an item, like O(hardware), replaces the module option as a whole, the two are not merged.
+      For example O(hardware.num_cpus) set in the module options is not used for an item which sets O(hardware.memory_mb) only.
+    - Up to O(parallel_deployments) virtual machines are managed at the same time over one connection,
+      datacenter, cluster, host and network lookups are shared by all items.
+    - The result of every item is returned in RV(results), the module fails if any item fails.
+    - Mutually exclusive with O(name) and O(uuid).
+    type: list
+    elements: dict
+    version_added: '6.3.0'
+  parallel_deployments:
+    description:
+    - Maximum number of virtual machines of O(batch) managed at the same time.
+    default: 4
+    type: int
+    version_added: '6.3.0'
 extends_documentation_fragment:
 - vmware.vmware.base_options
 
@@ -1090,19 +1110,50 @@ EXAMPLES = r'''
       size_mb: 2048
   delegate_to: localhost
   register: deploy_vm
+
+- name: Deploy a lab of virtual machines from one template
+  community.vmware.vmware_guest:
+    hostname: "{{ vcenter_hostname }}"
+    username: "{{ vcenter_username }}"
+    password: "{{ vcenter_password }}"
+    datacenter: DC1
+    cluster: Cluster1
+    folder: /DC1/vm/lab
+    template: template_el9
+    state: poweredon
+    parallel_deployments: 8
+    batch:
+      - name: lab-01
+      - name: lab-02
+      - name: lab-03
+        hardware:
+          memory_mb: 8192
+  delegate_to: localhost
+  register: lab_vms
 '''
 
 RETURN = r'''
 instance:
     description: metadata about the new virtual machine
-    returned: always
+    returned: when O(batch) is not set
     type: dict
     sample: None
+results:
+    description:
+    - Result of every virtual machine of O(batch), in the same order.
+    - Every result contains the O(name) of the item and the keys returned for a single virtual machine.
+    returned: when O(batch) is set
+    type: list
+    elements: dict
+    version_added: '6.3.0'
 '''
 
+import copy
 import re
 import time
 import string
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, RLock
 
 try:
     from pyVmomi import vim, vmodl
@@ -1110,6 +1161,7 @@ except ImportError:
     pass
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
 from ansible.module_utils.common.network import is_mac
 from ansible.module_utils.common.text.converters import to_text, to_native
 from ansible_collections.community.vmware.plugins.module_utils.vmware import (
@@ -1123,6 +1175,7 @@ from ansible_collections.community.vmware.plugins.module_utils.vmware import (
     find_dvs_by_name,
     find_dvspg_by_name,
     wait_for_vm_ip,
+    wait_for_tasks,
     quote_obj_name,
 )
 from ansible_collections.vmware.vmware.plugins.module_utils.argument_spec import base_argument_spec
@@ -1140,6 +1193,8 @@ class PyVmomiCache(PyVmomi):
         self.clusters = {}
         self.esx_hosts = {}
         self.parent_datacenters = {}
+        # the cache is shared by the virtual machines of a batch, lookups may nest
+        self.lock = RLock()
 
     def find_obj(self, content, types, name, confine_to_datacenter=True):
         """ Wrapper around find_obj to set datacenter context """
@@ -1173,43 +1228,47 @@ class PyVmomiCache(PyVmomi):
     def get_network(self, network_name):
         network_name = quote_obj_name(network_name)
 
-        if network_name not in self.networks:
-            networks = self.find_network_by_name(network_name)
-            if len(networks) == 1:
-                self.networks[network_name] = networks[0]
-            else:
-                self.networks[network_name] = self.find_obj(self.content, [vim.Network], network_name)
+        with self.lock:
+            if network_name not in self.networks:
+                networks = self.find_network_by_name(network_name)
+                if len(networks) == 1:
+                    self.networks[network_name] = networks[0]
+                else:
+                    self.networks[network_name] = self.find_obj(self.content, [vim.Network], network_name)
 
-        return self.networks[network_name]
+            return self.networks[network_name]
 
     def get_cluster(self, cluster):
-        if cluster not in self.clusters:
-            self.clusters[cluster] = self.find_obj(self.content, [vim.ClusterComputeResource], cluster)
+        with self.lock:
+            if cluster not in self.clusters:
+                self.clusters[cluster] = self.find_obj(self.content, [vim.ClusterComputeResource], cluster)
 
-        return self.clusters[cluster]
+            return self.clusters[cluster]
 
     def get_esx_host(self, host):
-        if host not in self.esx_hosts:
-            self.esx_hosts[host] = self.find_obj(self.content, [vim.HostSystem], host)
+        with self.lock:
+            if host not in self.esx_hosts:
+                self.esx_hosts[host] = self.find_obj(self.content, [vim.HostSystem], host)
 
-        return self.esx_hosts[host]
+            return self.esx_hosts[host]
 
     def get_parent_datacenter(self, obj):
         """ Walk the parent tree to find the objects datacenter """
         if isinstance(obj, vim.Datacenter):
             return obj
-        if obj in self.parent_datacenters:
-            return self.parent_datacenters[obj]
-        datacenter = None
-        while True:
-            if not hasattr(obj, 'parent'):
-                break
-            obj = obj.parent
-            if isinstance(obj, vim.Datacenter):
-                datacenter = obj
-                break
-        self.parent_datacenters[obj] = datacenter
-        return datacenter
+        with self.lock:
+            if obj in self.parent_datacenters:
+                return self.parent_datacenters[obj]
+            datacenter = None
+            while True:
+                if not hasattr(obj, 'parent'):
+                    break
+                obj = obj.parent
+                if isinstance(obj, vim.Datacenter):
+                    datacenter = obj
+                    break
+            self.parent_datacenters[obj] = datacenter
+            return datacenter
 
 
 class PyVmomiHelper(PyVmomi):
@@ -1223,6 +1282,30 @@ class PyVmomiHelper(PyVmomi):
         self.tracked_changes = {}     # dict of changes made or would-be-made in check mode, updated when change_applied is set
         self.customspec = None
         self.cache = PyVmomiCache(self.content, dc_name=self.params['datacenter'])
+        self.batch_caches = {self.params['datacenter']: self.cache}
+        self.batch_lock = Lock()
+
+    def for_batch_vm(self, module):
+        """
+        Return a helper for one virtual machine of a batch. It shares the connection with this helper
+        and the lookup cache with all virtual machines of the same datacenter.
+        """
+        helper = copy.copy(self)
+        helper.module = module
+        helper.params = module.params
+        helper.current_vm_obj = None
+        helper.device_helper = PyVmomiDeviceHelper(module)
+        helper.configspec = None
+        helper.relospec = None
+        helper.change_detected = False
+        helper.change_applied = False
+        helper.tracked_changes = {}
+        helper.customspec = None
+        with self.batch_lock:
+            if module.params['datacenter'] not in self.batch_caches:
+                self.batch_caches[module.params['datacenter']] = PyVmomiCache(self.content, dc_name=module.params['datacenter'])
+            helper.cache = self.batch_caches[module.params['datacenter']]
+        return helper
 
     def gather_facts(self, vm):
         return gather_vm_facts(self.content, vm)
@@ -2953,7 +3036,7 @@ class PyVmomiHelper(PyVmomi):
         if datacenter is None:
             self.module.fail_json(msg='No datacenter named %(datacenter)s was found' % self.params)
 
-        dcpath = compile_folder_path_for_object(datacenter)
+        dcpath = compile_folder_path_for_object(datacenter, content=self.content)
 
         # Nested folder does not have trailing /
         if not dcpath.endswith('/'):
@@ -3366,32 +3449,29 @@ class PyVmomiHelper(PyVmomi):
 
         return {'changed': self.change_applied, 'failed': False}
 
-    def wait_for_task(self, task, poll_interval=1):
+    def wait_for_task(self, task):
         """
         Wait for a VMware task to complete.  Terminal states are 'error' and 'success'.
 
         Inputs:
           - task: the task to wait for
-          - poll_interval: polling interval to check the task, in seconds
 
         Modifies:
           - self.change_applied
         """
         # https://www.vmware.com/support/developer/vc-sdk/visdk25pubs/ReferenceGuide/vim.Task.html
         # https://www.vmware.com/support/developer/vc-sdk/visdk25pubs/ReferenceGuide/vim.TaskInfo.html
-        # https://github.com/virtdevninja/pyvmomi-community-samples/blob/master/samples/tools/tasks.py
         error_msg = ''
-        while task.info.state not in ['error', 'success']:
-            time.sleep(poll_interval)
+        task_info = wait_for_tasks([task], timeout=None)[0]
 
-        if task.info.state == 'error':
-            error_msg = task.info.error.msg
-            if hasattr(task.info.error, 'faultMessage'):
-                for fault in task.info.error.faultMessage:
+        if task_info.state == 'error':
+            error_msg = task_info.error.msg
+            if hasattr(task_info.error, 'faultMessage'):
+                for fault in task_info.error.faultMessage:
                     if hasattr(fault, 'message') and fault.message:
                         error_msg += fault.message + ';'
                 error_msg = error_msg.rstrip(';')
-        self.change_applied = self.change_applied or task.info.state == 'success'
+        self.change_applied = self.change_applied or task_info.state == 'success'
         return error_msg
 
     def get_vm_events(self, vm, eventTypeIdList):
@@ -3432,6 +3512,207 @@ class PyVmomiHelper(PyVmomi):
         return False
 
 
+def ensure_vm_state(pyv, module):
+    """ Bring the virtual machine described by the module parameters to the requested state """
+    result = {'failed': False, 'changed': False}
+
+    # Check requirements for virtualization based security
+    if pyv.params['hardware']['virt_based_security']:
+        if not pyv.params['hardware']['nested_virt']:
+            pyv.module.fail_json(msg="Virtualization based security requires nested virtualization. Please enable nested_virt.")
+
+        if not pyv.params['hardware']['secure_boot']:
+            pyv.module.fail_json(msg="Virtualization based security requires (U)EFI secure boot. Please enable secure_boot.")
+
+        if not pyv.params['hardware']['iommu']:
+            pyv.module.fail_json(msg="Virtualization based security requires I/O MMU. Please enable iommu.")
+
+    # Check if the VM exists before continuing
+    vm = pyv.get_vm()
+
+    # VM already exists
+    if vm:
+        if module.params['state'] == 'absent':
+            # destroy it
+            if module.check_mode:
+                result.update(
+                    vm_name=vm.name,
+                    changed=True,
+                    current_powerstate=vm.summary.runtime.powerState.lower(),
+                    desired_operation='remove_vm',
+                )
+                return result
+            if module.params['force']:
+                # has to be poweredoff first
+                set_vm_power_state(pyv.content, vm, 'poweredoff', module.params['force'])
+            result = pyv.remove_vm(vm, module.params['delete_from_inventory'])
+        elif module.params['state'] == 'present':
+            # Note that check_mode is handled inside reconfigure_vm
+            result = pyv.reconfigure_vm()
+        elif module.params['state'] in ['poweredon', 'powered-on', 'poweredoff',
+                                        'powered-off', 'restarted', 'suspended',
+                                        'shutdownguest', 'shutdown-guest',
+                                        'rebootguest', 'reboot-guest']:
+            if module.check_mode:
+                # Identify if the power state would have changed if not in check mode
+                current_powerstate = vm.summary.runtime.powerState.lower()
+                powerstate_will_change = False
+                if ((current_powerstate == 'poweredon' and module.params['state'] not in ['poweredon', 'powered-on'])
+                        or (current_powerstate == 'poweredoff' and module.params['state']
+                            not in ['poweredoff', 'powered-off', 'shutdownguest', 'shutdown-guest'])
+                        or (current_powerstate == 'suspended' and module.params['state'] != 'suspended')):
+                    powerstate_will_change = True
+
+                result.update(
+                    vm_name=vm.name,
+                    changed=powerstate_will_change,
+                    current_powerstate=current_powerstate,
+                    desired_operation='set_vm_power_state',
+                )
+                return result
+            # set powerstate
+            tmp_result = set_vm_power_state(pyv.content, vm, module.params['state'], module.params['force'], module.params['state_change_timeout'])
+            if tmp_result['changed']:
+                result["changed"] = True
+                if module.params['state'] in ['poweredon', 'powered-on', 'restarted', 'rebootguest', 'reboot-guest'] and module.params['wait_for_ip_address']:
+                    wait_result = wait_for_vm_ip(pyv.content, vm, module.params['wait_for_ip_address_timeout'])
+                    if not wait_result:
+                        module.fail_json(msg='Waiting for IP address timed out')
+                    tmp_result['instance'] = wait_result
+            if not tmp_result["failed"]:
+                result["failed"] = False
+            result['instance'] = tmp_result['instance']
+            if tmp_result["failed"]:
+                result["failed"] = True
+                result["msg"] = tmp_result["msg"]
+        else:
+            # This should not happen
+            raise AssertionError()
+    # VM doesn't exist
+    else:
+        if module.params['state'] in ['poweredon', 'powered-on', 'poweredoff', 'powered-off',
+                                      'present', 'restarted', 'suspended']:
+            if module.check_mode:
+                result.update(
+                    changed=True,
+                    desired_operation='deploy_vm',
+                )
+                return result
+            result = pyv.deploy_vm()
+            if result['failed']:
+                module.fail_json(msg='Failed to create a virtual machine : %s' % result['msg'])
+
+    return result
+
+
+class BatchVmResult(BaseException):
+    """ Result of one virtual machine of a batch, raised instead of ending the module run """
+
+    def __init__(self, result):
+        super(BatchVmResult, self).__init__(result.get('msg'))
+        self.result = result
+
+
+class BatchVmModule(object):
+    """ Stand-in for the AnsibleModule of one virtual machine of a batch, exit_json and fail_json end this virtual machine only """
+
+    def __init__(self, module, params):
+        self._module = module
+        self.params = params
+
+    def exit_json(self, **kwargs):
+        kwargs.setdefault('changed', False)
+        kwargs['failed'] = False
+        raise BatchVmResult(kwargs)
+
+    def fail_json(self, msg, **kwargs):
+        kwargs.setdefault('changed', False)
+        kwargs.update(failed=True, msg=msg)
+        raise BatchVmResult(kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._module, name)
+
+
+def get_no_log_values(argument_spec, params):
+    """ Return the values of the no_log options in params, including the ones of suboptions """
+    values = set()
+    for option, spec in argument_spec.items():
+        value = params.get(option)
+        if value is None:
+            continue
+        if spec.get('no_log'):
+            if isinstance(value, (list, tuple, set)):
+                values.update(to_native(item) for item in value if item is not None)
+            elif isinstance(value, dict):
+                values.update(to_native(item) for item in value.values() if item is not None)
+            else:
+                values.add(to_native(value))
+        elif spec.get('options'):
+            for suboptions in (value if isinstance(value, list) else [value]):
+                if isinstance(suboptions, dict):
+                    values.update(get_no_log_values(spec['options'], suboptions))
+    return values
+
+
+def get_batch_params(module, argument_spec):
+    """
+    Validate the items of the batch and return the parameters of every virtual machine.
+    Options not set in an item are taken from the module parameters.
+    """
+    connection_options = set(base_argument_spec())
+    item_spec = {}
+    for option, spec in argument_spec.items():
+        if option in connection_options or option in ('batch', 'parallel_deployments'):
+            continue
+        item_spec[option] = dict((key, value) for key, value in spec.items() if key != 'default')
+    validator = ArgumentSpecValidator(item_spec)
+
+    batch_params = []
+    for index, item in enumerate(module.params['batch']):
+        invalid = sorted(connection_options.intersection(item))
+        if invalid:
+            module.fail_json(msg="Connection options can not be set in batch item %d: %s" % (index, ', '.join(invalid)))
+        validation = validator.validate(item)
+        module.no_log_values.update(get_no_log_values(item_spec, validation.validated_parameters))
+        if validation.error_messages:
+            module.fail_json(msg="Invalid batch item %d: %s" % (index, ', '.join(validation.error_messages)))
+
+        params = dict((key, value) for key, value in module.params.items() if key not in ('batch', 'parallel_deployments'))
+        params.update((key, value) for key, value in validation.validated_parameters.items() if value is not None)
+        if not params['name'] and not params['uuid']:
+            module.fail_json(msg="One of name or uuid is required in batch item %d" % index)
+        if params['cluster'] and params['esxi_hostname']:
+            module.fail_json(msg="Parameters are mutually exclusive in batch item %d: cluster|esxi_hostname" % index)
+        batch_params.append(params)
+    return batch_params
+
+
+def manage_batch_vm(pyv, module, params):
+    """ Bring one virtual machine of the batch to the requested state, failures only end this virtual machine """
+    vm_module = BatchVmModule(module, params)
+    try:
+        result = ensure_vm_state(pyv.for_batch_vm(vm_module), vm_module)
+    except BatchVmResult as e:
+        result = e.result
+    except Exception as e:
+        result = {'changed': False, 'failed': True, 'msg': to_native(e)}
+    result['name'] = params['name']
+    return result
+
+
+def manage_batch(pyv, module, argument_spec):
+    """
+    Manage all virtual machines of the batch over the connection of pyv, with up to
+    parallel_deployments virtual machines at the same time.
+    Returns the results in the order of the batch.
+    """
+    batch_params = get_batch_params(module, argument_spec)
+    with ThreadPoolExecutor(max_workers=max(1, module.params['parallel_deployments'])) as executor:
+        futures = [executor.submit(manage_batch_vm, pyv, module, params) for params in batch_params]
+    return [future.result() for future in futures]
+
+
 def main():
     argument_spec = base_argument_spec()
     argument_spec.update(
@@ -3572,105 +3853,32 @@ def main():
         datastore=dict(type='str'),
         convert=dict(type='str', choices=['thin', 'thick', 'eagerzeroedthick']),
         delete_from_inventory=dict(type='bool', default=False),
+        batch=dict(type='list', elements='dict'),
+        parallel_deployments=dict(type='int', default=4),
     )
 
     module = AnsibleModule(argument_spec=argument_spec,
                            supports_check_mode=True,
                            mutually_exclusive=[
                                ['cluster', 'esxi_hostname'],
+                               ['batch', 'name'],
+                               ['batch', 'uuid'],
                            ],
                            required_one_of=[
-                               ['name', 'uuid'],
+                               ['name', 'uuid', 'batch'],
                            ],
                            )
-    result = {'failed': False, 'changed': False}
     pyv = PyVmomiHelper(module)
 
-    # Check requirements for virtualization based security
-    if pyv.params['hardware']['virt_based_security']:
-        if not pyv.params['hardware']['nested_virt']:
-            pyv.module.fail_json(msg="Virtualization based security requires nested virtualization. Please enable nested_virt.")
-
-        if not pyv.params['hardware']['secure_boot']:
-            pyv.module.fail_json(msg="Virtualization based security requires (U)EFI secure boot. Please enable secure_boot.")
-
-        if not pyv.params['hardware']['iommu']:
-            pyv.module.fail_json(msg="Virtualization based security requires I/O MMU. Please enable iommu.")
-
-    # Check if the VM exists before continuing
-    vm = pyv.get_vm()
-
-    # VM already exists
-    if vm:
-        if module.params['state'] == 'absent':
-            # destroy it
-            if module.check_mode:
-                result.update(
-                    vm_name=vm.name,
-                    changed=True,
-                    current_powerstate=vm.summary.runtime.powerState.lower(),
-                    desired_operation='remove_vm',
-                )
-                module.exit_json(**result)
-            if module.params['force']:
-                # has to be poweredoff first
-                set_vm_power_state(pyv.content, vm, 'poweredoff', module.params['force'])
-            result = pyv.remove_vm(vm, module.params['delete_from_inventory'])
-        elif module.params['state'] == 'present':
-            # Note that check_mode is handled inside reconfigure_vm
-            result = pyv.reconfigure_vm()
-        elif module.params['state'] in ['poweredon', 'powered-on', 'poweredoff',
-                                        'powered-off', 'restarted', 'suspended',
-                                        'shutdownguest', 'shutdown-guest',
-                                        'rebootguest', 'reboot-guest']:
-            if module.check_mode:
-                # Identify if the power state would have changed if not in check mode
-                current_powerstate = vm.summary.runtime.powerState.lower()
-                powerstate_will_change = False
-                if ((current_powerstate == 'poweredon' and module.params['state'] not in ['poweredon', 'powered-on'])
-                        or (current_powerstate == 'poweredoff' and module.params['state']
-                            not in ['poweredoff', 'powered-off', 'shutdownguest', 'shutdown-guest'])
-                        or (current_powerstate == 'suspended' and module.params['state'] != 'suspended')):
-                    powerstate_will_change = True
+    if module.params['batch']:
+        results = manage_batch(pyv, module, argument_spec)
+        result = dict(changed=any(vm_result['changed'] for vm_result in results), results=results)
+        failed = len([vm_result for vm_result in results if vm_result['failed']])
+        if failed:
+            module.fail_json(msg="Failed to manage %d of %d virtual machines" % (failed, len(results)), **result)
+        module.exit_json(**result)
 
-                result.update(
-                    vm_name=vm.name,
-                    changed=powerstate_will_change,
-                    current_powerstate=current_powerstate,
-                    desired_operation='set_vm_power_state',
-                )
-                module.exit_json(**result)
-            # set powerstate
-            tmp_result = set_vm_power_state(pyv.content, vm, module.params['state'], module.params['force'], module.params['state_change_timeout'])
-            if tmp_result['changed']:
-                result["changed"] = True
-                if module.params['state'] in ['poweredon', 'powered-on', 'restarted', 'rebootguest', 'reboot-guest'] and module.params['wait_for_ip_address']:
-                    wait_result = wait_for_vm_ip(pyv.content, vm, module.params['wait_for_ip_address_timeout'])
-                    if not wait_result:
-                        module.fail_json(msg='Waiting for IP address timed out')
-                    tmp_result['instance'] = wait_result
-            if not tmp_result["failed"]:
-                result["failed"] = False
-            result['instance'] = tmp_result['instance']
-            if tmp_result["failed"]:
-                result["failed"] = True
-                result["msg"] = tmp_result["msg"]
-        else:
-            # This should not happen
-            raise AssertionError()
-    # VM doesn't exist
-    else:
-        if module.params['state'] in ['poweredon', 'powered-on', 'poweredoff', 'powered-off',
-                                      'present', 'restarted', 'suspended']:
-            if module.check_mode:
-                result.update(
-                    changed=True,
-                    desired_operation='deploy_vm',
-                )
-                module.exit_json(**result)
-            result = pyv.deploy_vm()
-            if result['failed']:
-                module.fail_json(msg='Failed to create a virtual machine : %s' % result['msg'])
+    result = ensure_vm_state(pyv, module)
 
     if result['failed']:
         module.fail_json(**result)
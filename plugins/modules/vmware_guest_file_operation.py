@@ -15,6 +15,7 @@ module: vmware_guest_file_operation
 short_description: Files operation in a VMware guest operating system without network
 description:
     - Module to copy a file to a VM, fetch a file from a VM and create or delete a directory in the guest OS.
+    - Files are streamed in chunks, so they do not need to fit in memory on the controller.
 author:
   - Stéphane Travassac (@stravassac)
 notes:
@@ -127,6 +128,22 @@ options:
                 - Overwrite or not.
                 type: bool
                 default: false
+            recursive:
+                description:
+                - Allow O(copy.src) to be a directory.
+                - The content of the directory is copied into O(copy.dest), which is created with its missing parent directories.
+                - Guest files which already exist are skipped unless O(copy.overwrite=true).
+                - All the files are transferred over the same pooled HTTP connections.
+                type: bool
+                default: false
+                version_added: '6.3.0'
+            checksum:
+                description:
+                - Expected checksum of the copied file, in the format C(<algorithm>:<checksum>), for example C(sha256:0123...).
+                - The checksum is computed while the file is streamed. If it does not match, the guest file is deleted and the module fails.
+                - Not supported when copying a directory.
+                type: str
+                version_added: '6.3.0'
         required: false
         type: dict
     fetch:
@@ -136,7 +153,7 @@ options:
             src:
                 description:
                 - The file on the remote system to fetch.
-                - This I(must) be a file, not a directory.
+                - This I(must) be a file, not a directory, unless O(fetch.recursive=true).
                 required: true
                 type: str
             dest:
@@ -144,6 +161,21 @@ options:
                 - File destination on localhost, path must be exist.
                 required: true
                 type: str
+            recursive:
+                description:
+                - Fetch the directory O(fetch.src) with its files and subdirectories into O(fetch.dest), which is created if missing.
+                - Symbolic links are skipped.
+                - All the files are transferred over the same pooled HTTP connections.
+                type: bool
+                default: false
+                version_added: '6.3.0'
+            checksum:
+                description:
+                - Expected checksum of the fetched file, in the format C(<algorithm>:<checksum>), for example C(sha256:0123...).
+                - The checksum is computed while the file is streamed. If it does not match, O(fetch.dest) is left unchanged and the module fails.
+                - Not supported with O(fetch.recursive=true).
+                type: str
+                version_added: '6.3.0'
         required: false
         type: dict
     timeout:
@@ -218,9 +250,50 @@ EXAMPLES = r'''
         dest: "/root/test.zip"
         overwrite: false
   delegate_to: localhost
+
+- name: Copy a directory to vm and verify a file fetched from vm
+  community.vmware.vmware_guest_file_operation:
+    hostname: "{{ vcenter_hostname }}"
+    username: "{{ vcenter_username }}"
+    password: "{{ vcenter_password }}"
+    datacenter: "{{ datacenter_name }}"
+    vm_id: "{{ guest_name }}"
+    vm_username: "{{ guest_username }}"
+    vm_password: "{{ guest_userpassword }}"
+    copy:
+        src: "files/installer/"
+        dest: "/opt/installer"
+        recursive: true
+  delegate_to: localhost
+
+- name: Fetch a file from vm and verify its checksum
+  community.vmware.vmware_guest_file_operation:
+    hostname: "{{ vcenter_hostname }}"
+    username: "{{ vcenter_username }}"
+    password: "{{ vcenter_password }}"
+    datacenter: "{{ datacenter_name }}"
+    vm_id: "{{ guest_name }}"
+    vm_username: "{{ guest_username }}"
+    vm_password: "{{ guest_userpassword }}"
+    fetch:
+        src: "/root/test.zip"
+        dest: "files/test.zip"
+        checksum: "sha256:{{ test_zip_sha256 }}"
+  delegate_to: localhost
 '''
 
 RETURN = r'''
+checksum:
+    description: Checksum of the transferred file, computed with the algorithm of O(copy.checksum) or O(fetch.checksum).
+    returned: when O(copy.checksum) or O(fetch.checksum) is set
+    type: str
+    sample: 9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08
+files:
+    description: Paths of the guest files copied or of the local files fetched.
+    returned: when a directory is copied or fetched
+    type: list
+    elements: str
+    sample: ["/opt/installer/setup.sh", "/opt/installer/lib/data.bin"]
 '''
 
 try:
@@ -228,9 +301,16 @@ try:
 except ImportError:
     pass
 
+try:
+    import requests
+except ImportError:
+    pass
+
+import hashlib
 import os
+import tempfile
 from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils import urls
+from ansible.module_utils.urls import get_user_agent
 from ansible.module_utils.common.text.converters import to_bytes, to_native
 from ansible_collections.community.vmware.plugins.module_utils.vmware import (
     PyVmomi, find_cluster_by_name, find_datacenter_by_name,
@@ -238,6 +318,27 @@ from ansible_collections.community.vmware.plugins.module_utils.vmware import (
 from ansible_collections.vmware.vmware.plugins.module_utils.argument_spec import base_argument_spec
 
 
+class ChunkReader(object):
+    """ File object handing out a bounded chunk at a time to the HTTP client, hashing what it reads """
+    def __init__(self, local_file, size, chunk_size, algorithm=None):
+        self.local_file = local_file
+        self.size = size
+        self.chunk_size = chunk_size
+        self.hash = hashlib.new(algorithm) if algorithm else None
+
+    def __len__(self):
+        return self.size
+
+    def read(self, size=-1):
+        chunk = self.local_file.read(self.chunk_size)
+        if self.hash:
+            self.hash.update(chunk)
+        return chunk
+
+    def hexdigest(self):
+        return self.hash.hexdigest() if self.hash else None
+
+
 class VmwareGuestFileManager(PyVmomi):
     def __init__(self, module):
         super(VmwareGuestFileManager, self).__init__(module)
@@ -245,6 +346,9 @@ class VmwareGuestFileManager(PyVmomi):
         cluster_name = module.params['cluster']
         folder = module.params['folder']
         self.timeout = module.params['timeout']
+        # stream files 1 MB at a time
+        self.chunk_size = 2 ** 20
+        self._session = None
 
         datacenter = None
         if datacenter_name:
@@ -353,31 +457,121 @@ class VmwareGuestFileManager(PyVmomi):
 
         return result
 
+    @property
+    def session(self):
+        """ HTTP session pooling the connections to the host for all the transfers """
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.verify = self.module.params['validate_certs']
+            # same proxy and user agent settings as fetch_url()
+            self._session.trust_env = self.module.params.get('use_proxy', True)
+            self._session.headers['User-Agent'] = self.module.params.get('http_agent', get_user_agent())
+        return self._session
+
+    def _transfer_url(self, url):
+        return url.replace("*", self.module.params['hostname']).replace("443", str(self.module.params['port']))
+
+    @staticmethod
+    def _guest_join(path, name):
+        sep = '\\' if '\\' in path and '/' not in path else '/'
+        return path.rstrip(sep) + sep + name
+
+    def _get_checksum(self, checksum):
+        """ Split a checksum given as <algorithm>:<checksum> """
+        if not checksum:
+            return None, None
+        try:
+            algorithm, value = checksum.split(':', 1)
+        except ValueError:
+            self.module.fail_json(msg="The checksum parameter has to be in format <algorithm>:<checksum>")
+        if algorithm not in hashlib.algorithms_available:
+            self.module.fail_json(msg="Unsupported checksum algorithm %s" % algorithm)
+        return algorithm, value.strip().lower()
+
+    def _list_guest_files(self, file_manager, creds, path):
+        index = 0
+        while True:
+            listing = file_manager.ListFilesInGuest(vm=self.vm, auth=creds, filePath=path, index=index)
+            for guest_file in listing.files or []:
+                yield guest_file
+            if not listing.remaining:
+                return
+            index += len(listing.files)
+
+    def _fetch_file(self, file_manager, creds, src, dest, algorithm=None, checksum=None):
+        """
+        Stream a guest file to a temporary file moved to dest once complete, returns its checksum if algorithm is set.
+        If checksum is set and does not match, dest is left alone and the module fails.
+        """
+        file_transfer_info = file_manager.InitiateFileTransferFromGuest(vm=self.vm, auth=creds, guestFilePath=src)
+        resp = self.session.get(self._transfer_url(file_transfer_info.url), stream=True, timeout=self.timeout)
+        tmp_dest = None
+        try:
+            if resp.status_code != 200:
+                self.module.fail_json(msg="Failed to fetch file : %s" % resp.reason, body=resp.text)
+            try:
+                fd, tmp_dest = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(dest)),
+                                                prefix='.%s.' % os.path.basename(dest))
+            except Exception as e:
+                self.module.fail_json(msg="local file write exception : %s" % to_native(e),
+                                      uuid=self.vm.summary.config.uuid)
+            file_hash = hashlib.new(algorithm) if algorithm else None
+            with os.fdopen(fd, "wb") as local_file:
+                for chunk in resp.iter_content(chunk_size=self.chunk_size):
+                    local_file.write(chunk)
+                    if file_hash:
+                        file_hash.update(chunk)
+            digest = file_hash.hexdigest() if file_hash else None
+            if checksum and digest != checksum:
+                self.module.fail_json(msg="The checksum of the fetched file %s does not match: expected %s, got %s"
+                                          % (src, checksum, digest),
+                                      uuid=self.vm.summary.config.uuid)
+            self.module.atomic_move(tmp_dest, dest)
+        finally:
+            resp.close()
+            if tmp_dest and os.path.exists(tmp_dest):
+                os.remove(tmp_dest)
+        return digest
+
+    def _fetch_directory(self, file_manager, creds, src, dest):
+        fetched = []
+        pending = [(src, dest)]
+        while pending:
+            guest_dir, local_dir = pending.pop(0)
+            if not os.path.isdir(local_dir):
+                os.makedirs(local_dir)
+            for guest_file in self._list_guest_files(file_manager, creds, guest_dir):
+                if guest_file.path in ('.', '..'):
+                    continue
+                guest_path = self._guest_join(guest_dir, guest_file.path)
+                local_path = os.path.join(local_dir, guest_file.path)
+                if guest_file.type == 'directory':
+                    pending.append((guest_path, local_path))
+                elif guest_file.type == 'file':
+                    self._fetch_file(file_manager, creds, guest_path, local_path)
+                    fetched.append(local_path)
+        return fetched
+
     def fetch(self):
         result = dict(changed=True, uuid=self.vm.summary.config.uuid)
         vm_username = self.module.params['vm_username']
         vm_password = self.module.params['vm_password']
-        hostname = self.module.params['hostname']
-        port = self.module.params['port']
         dest = self.module.params["fetch"]['dest']
         src = self.module.params['fetch']['src']
+        recursive = self.module.params['fetch']['recursive']
+        algorithm, checksum = self._get_checksum(self.module.params['fetch']['checksum'])
+        if recursive and checksum:
+            self.module.fail_json(msg="fetch.checksum is not supported with fetch.recursive")
         creds = vim.vm.guest.NamePasswordAuthentication(username=vm_username, password=vm_password)
         file_manager = self.content.guestOperationsManager.fileManager
 
         try:
-            fileTransferInfo = file_manager.InitiateFileTransferFromGuest(vm=self.vm, auth=creds,
-                                                                          guestFilePath=src)
-            url = fileTransferInfo.url
-            url = url.replace("*", hostname).replace("443", str(port))
-            resp, info = urls.fetch_url(self.module, url, method="GET", timeout=self.timeout)
-            if info.get('status') != 200 or not resp:
-                self.module.fail_json(msg="Failed to fetch file : %s" % info.get('msg', ''), body=info.get('body', ''))
-            try:
-                with open(dest, "wb") as local_file:
-                    local_file.write(resp.read())
-            except Exception as e:
-                self.module.fail_json(msg="local file write exception : %s" % to_native(e),
-                                      uuid=self.vm.summary.config.uuid)
+            if recursive:
+                result['files'] = self._fetch_directory(file_manager, creds, src, dest)
+            else:
+                digest = self._fetch_file(file_manager, creds, src, dest, algorithm, checksum)
+                if checksum:
+                    result['checksum'] = digest
         except vim.fault.FileNotFound as file_not_found:
             self.module.fail_json(msg="Guest file %s does not exist : %s" % (src, to_native(file_not_found.msg)),
                                   uuid=self.vm.summary.config.uuid)
@@ -397,15 +591,54 @@ class VmwareGuestFileManager(PyVmomi):
 
         return result
 
+    def _copy_file(self, file_manager, creds, b_src, dest, overwrite, algorithm=None):
+        """ Stream a local file to the guest, returns its checksum if algorithm is set """
+        file_size = os.path.getsize(b_src)
+        file_attributes = vim.vm.guest.FileManager.FileAttributes()
+        url = file_manager.InitiateFileTransferToGuest(vm=self.vm, auth=creds, guestFilePath=dest,
+                                                       fileAttributes=file_attributes, overwrite=overwrite,
+                                                       fileSize=file_size)
+        with open(b_src, "rb") as local_file:
+            reader = ChunkReader(local_file, file_size, self.chunk_size, algorithm)
+            resp = self.session.put(self._transfer_url(url), data=reader, timeout=self.timeout)
+        resp.close()
+        if resp.status_code != 200:
+            self.module.fail_json(msg='problem during file transfer, http message:%s %s' % (resp.status_code, resp.reason),
+                                  uuid=self.vm.summary.config.uuid)
+        return reader.hexdigest()
+
+    def _copy_directory(self, file_manager, creds, b_src, dest, overwrite):
+        copied = []
+        for b_root, b_dirs, b_files in os.walk(b_src):
+            b_dirs.sort()
+            guest_dir = dest
+            relative_path = to_native(os.path.relpath(b_root, b_src))
+            if relative_path != '.':
+                for name in relative_path.split(os.sep):
+                    guest_dir = self._guest_join(guest_dir, name)
+            try:
+                file_manager.MakeDirectoryInGuest(vm=self.vm, auth=creds, directoryPath=guest_dir,
+                                                  createParentDirectories=True)
+            except vim.fault.FileAlreadyExists:
+                pass
+            for b_name in sorted(b_files):
+                guest_path = self._guest_join(guest_dir, to_native(b_name))
+                try:
+                    self._copy_file(file_manager, creds, os.path.join(b_root, b_name), guest_path, overwrite)
+                except vim.fault.FileAlreadyExists:
+                    continue
+                copied.append(guest_path)
+        return copied
+
     def copy(self):
         result = dict(changed=True, uuid=self.vm.summary.config.uuid)
         vm_username = self.module.params['vm_username']
         vm_password = self.module.params['vm_password']
-        hostname = self.module.params['hostname']
-        port = self.module.params['port']
         overwrite = self.module.params["copy"]["overwrite"]
         dest = self.module.params["copy"]['dest']
         src = self.module.params['copy']['src']
+        recursive = self.module.params['copy']['recursive']
+        algorithm, checksum = self._get_checksum(self.module.params['copy']['checksum'])
         b_src = to_bytes(src, errors='surrogate_or_strict')
 
         if not os.path.exists(b_src):
@@ -413,27 +646,26 @@ class VmwareGuestFileManager(PyVmomi):
         if not os.access(b_src, os.R_OK):
             self.module.fail_json(msg="Source %s not readable" % src)
         if os.path.isdir(b_src):
-            self.module.fail_json(msg="copy does not support copy of directory: %s" % src)
-
-        data = None
-        with open(b_src, "rb") as local_file:
-            data = local_file.read()
-        file_size = os.path.getsize(b_src)
+            if not recursive:
+                self.module.fail_json(msg="copy does not support copy of directory without copy.recursive: %s" % src)
+            if checksum:
+                self.module.fail_json(msg="copy.checksum is not supported when copying a directory: %s" % src)
 
         creds = vim.vm.guest.NamePasswordAuthentication(username=vm_username, password=vm_password)
-        file_attributes = vim.vm.guest.FileManager.FileAttributes()
         file_manager = self.content.guestOperationsManager.fileManager
         try:
-            url = file_manager.InitiateFileTransferToGuest(vm=self.vm, auth=creds, guestFilePath=dest,
-                                                           fileAttributes=file_attributes, overwrite=overwrite,
-                                                           fileSize=file_size)
-            url = url.replace("*", hostname).replace("443", str(port))
-            resp, info = urls.fetch_url(self.module, url, data=data, method="PUT", timeout=self.timeout)
-
-            status_code = info["status"]
-            if status_code != 200:
-                self.module.fail_json(msg='problem during file transfer, http message:%s' % info,
-                                      uuid=self.vm.summary.config.uuid)
+            if os.path.isdir(b_src):
+                result['files'] = self._copy_directory(file_manager, creds, b_src, dest, overwrite)
+                result['changed'] = bool(result['files'])
+            else:
+                digest = self._copy_file(file_manager, creds, b_src, dest, overwrite, algorithm)
+                if checksum:
+                    if digest != checksum:
+                        file_manager.DeleteFileInGuest(vm=self.vm, auth=creds, filePath=dest)
+                        self.module.fail_json(msg="The checksum of the copied file %s does not match: expected %s, got %s"
+                                                  % (src, checksum, digest),
+                                              uuid=self.vm.summary.config.uuid)
+                    result['checksum'] = digest
         except vim.fault.FileAlreadyExists:
             result['changed'] = False
             result['msg'] = "Guest file %s already exists" % dest
@@ -485,7 +717,9 @@ def main():
             options=dict(
                 src=dict(required=True, type='str'),
                 dest=dict(required=True, type='str'),
-                overwrite=dict(required=False, type='bool', default=False)
+                overwrite=dict(required=False, type='bool', default=False),
+                recursive=dict(required=False, type='bool', default=False),
+                checksum=dict(required=False, type='str'),
             )
         ),
         fetch=dict(
@@ -494,6 +728,8 @@ def main():
             options=dict(
                 src=dict(required=True, type='str'),
                 dest=dict(required=True, type='str'),
+                recursive=dict(required=False, type='bool', default=False),
+                checksum=dict(required=False, type='str'),
             )
         ),
         timeout=dict(type='int', default=100)
@@ -164,7 +164,7 @@ class VMwareGuestRegisterOperation(PyVmomi):
         if not datacenter:
             self.module.fail_json(msg="Cannot find the specified Datacenter: %s" % self.datacenter)
 
-        dcpath = compile_folder_path_for_object(datacenter)
+        dcpath = compile_folder_path_for_object(datacenter, content=self.content)
         if not dcpath.endswith("/"):
             dcpath += "/"
 
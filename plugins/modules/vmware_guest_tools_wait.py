@@ -65,6 +65,12 @@ options:
      - Max duration of the waiting period (seconds).
      default: 500
      type: int
+   wait_for_ip_address:
+     description:
+     - Also wait until vCenter detects an IP address for the virtual machine.
+     default: false
+     type: bool
+     version_added: '6.3.0'
    datacenter:
      description:
      - Name of the datacenter.
@@ -127,7 +133,11 @@ instance:
 '''
 
 import datetime
-import time
+
+try:
+    from pyVmomi import vim, vmodl
+except ImportError:
+    pass
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.common.text.converters import to_native
@@ -143,19 +153,50 @@ class PyVmomiHelper(PyVmomi):
         return gather_vm_facts(self.content, vm)
 
     def wait_for_tools(self, vm, timeout):
-        tools_running = False
-        vm_facts = {}
+        """
+        Watch the guest properties of the VM with a PropertyCollector filter, so
+        vCenter reports changes as they happen instead of being polled.
+        Facts are only gathered once the tools are running.
+        """
+        wait_for_ip_address = self.params['wait_for_ip_address']
+        path_set = ['guest.toolsRunningStatus']
+        if wait_for_ip_address:
+            path_set.append('guest.ipAddress')
+        guest = {}
         start_at = datetime.datetime.now()
 
-        while start_at + timeout > datetime.datetime.now():
-            newvm = self.get_vm()
-            vm_facts = self.gather_facts(newvm)
-            if vm_facts['guest_tools_status'] == 'guestToolsRunning':
-                return {'changed': True, 'failed': False, 'instance': vm_facts}
-            time.sleep(5)
-
-        if not tools_running:
-            return {'failed': True, 'msg': 'VMware tools either not present or not running after {0} seconds'.format(timeout.total_seconds())}
+        collector = self.content.propertyCollector.CreatePropertyCollector()
+        try:
+            collector.CreateFilter(vmodl.query.PropertyCollector.FilterSpec(
+                objectSet=[vmodl.query.PropertyCollector.ObjectSpec(obj=vm)],
+                propSet=[vmodl.query.PropertyCollector.PropertySpec(type=vim.VirtualMachine, pathSet=path_set)],
+            ), partialUpdates=False)
+
+            version = ''
+            while True:
+                if guest.get('guest.toolsRunningStatus') == 'guestToolsRunning' and \
+                        (not wait_for_ip_address or guest.get('guest.ipAddress')):
+                    return {'changed': True, 'failed': False, 'instance': self.gather_facts(vm)}
+
+                remaining = (start_at + timeout - datetime.datetime.now()).total_seconds()
+                if remaining <= 0:
+                    break
+                update_set = collector.WaitForUpdatesEx(
+                    version, vmodl.query.PropertyCollector.WaitOptions(maxWaitSeconds=max(1, int(remaining)))
+                )
+                if update_set is None:
+                    continue
+                version = update_set.version
+                for filter_update in update_set.filterSet:
+                    for object_update in filter_update.objectSet:
+                        for change in object_update.changeSet:
+                            guest[change.name] = None if change.op == 'remove' else change.val
+        finally:
+            collector.Destroy()
+
+        if guest.get('guest.toolsRunningStatus') == 'guestToolsRunning':
+            return {'failed': True, 'msg': 'No IP address detected for the VM after {0} seconds'.format(timeout.total_seconds())}
+        return {'failed': True, 'msg': 'VMware tools either not present or not running after {0} seconds'.format(timeout.total_seconds())}
 
 
 def main():
@@ -168,6 +209,7 @@ def main():
         moid=dict(type='str'),
         use_instance_uuid=dict(type='bool', default=False),
         timeout=dict(type='int', default=500),
+        wait_for_ip_address=dict(type='bool', default=False),
         datacenter=dict(type='str'),
     )
     module = AnsibleModule(
@@ -37,6 +37,14 @@ options:
     - Note that the list of advanced options (with description and values) can be found by running `vim-cmd hostsvc/advopt/options`.
     default: {}
     type: dict
+  parallel_hosts:
+    description:
+    - Number of ESXi hosts configured at the same time.
+    - All options are validated on every host before any host is configured.
+    - By default one host is configured at a time, higher values configure the hosts of O(cluster_name) in parallel.
+    default: 1
+    type: int
+    version_added: '6.3.0'
 extends_documentation_fragment:
 - vmware.vmware.base_options
 
@@ -84,8 +92,15 @@ try:
 except ImportError:
     pass
 
+from concurrent.futures import ThreadPoolExecutor
+
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.community.vmware.plugins.module_utils.vmware import PyVmomi, is_boolean, is_integer, is_truthy
+from ansible_collections.community.vmware.plugins.module_utils.vmware import (
+    PyVmomi,
+    is_boolean,
+    is_integer,
+    is_truthy,
+    retrieve_objects_properties)
 from ansible_collections.vmware.vmware.plugins.module_utils.argument_spec import base_argument_spec
 from ansible.module_utils.common.text.converters import to_native
 
@@ -96,50 +111,89 @@ class VmwareConfigManager(PyVmomi):
         cluster_name = self.params.get('cluster_name', None)
         esxi_host_name = self.params.get('esxi_hostname', None)
         self.options = self.params.get('options', dict())
+        self.option_types = {}
         self.hosts = self.get_all_host_objs(cluster_name=cluster_name, esxi_host_name=esxi_host_name)
 
+    def get_option_types(self, option_manager, build):
+        """ Get the type of every supported option, the list is fetched once per ESXi build """
+        if build not in self.option_types:
+            self.option_types[build] = dict(
+                (s_option.key, s_option.optionType) for s_option in option_manager.supportedOption
+            )
+        return self.option_types[build]
+
+    def get_option_values(self, option_types):
+        """ Validate the requested options against the supported ones and convert them to their type """
+        option_values = {}
+        for option_key, option_value in self.options.items():
+            if option_key in option_types:
+                # We handle all supported types here so we can give meaningful errors.
+                option_type = option_types[option_key]
+                if is_boolean(option_value) and isinstance(option_type, vim.option.BoolOption):
+                    option_value = is_truthy(option_value)
+                elif (isinstance(option_value, int) or is_integer(option_value))\
+                        and isinstance(option_type, vim.option.IntOption):
+                    option_value = VmomiSupport.vmodlTypes['int'](option_value)
+                elif (isinstance(option_value, int) or is_integer(option_value, 'long'))\
+                        and isinstance(option_type, vim.option.LongOption):
+                    option_value = VmomiSupport.vmodlTypes['long'](option_value)
+                elif isinstance(option_value, float) and isinstance(option_type, vim.option.FloatOption):
+                    pass
+                elif isinstance(option_value, str) and isinstance(option_type, (vim.option.StringOption, vim.option.ChoiceOption)):
+                    pass
+                else:
+                    self.module.fail_json(msg="Provided value is of type %s."
+                                              " Option %s expects: %s" % (type(option_value), option_key, type(option_type)))
+                option_values[option_key] = option_value
+            else:  # Don't silently drop unknown options. This prevents typos from falling through the cracks.
+                self.module.fail_json(msg="Unsupported option %s" % option_key)
+        return option_values
+
+    def configure_host(self, option_manager, option_values):
+        """ Query the current value of the requested options only and update the ones which differ """
+        change_option_list = []
+        for option_key, option_value in option_values.items():
+            try:
+                current_value = next(
+                    (option.value for option in option_manager.QueryOptions(name=option_key) if option.key == option_key), None
+                )
+            except vim.fault.InvalidName:
+                current_value = None
+            if option_value != current_value:
+                change_option_list.append(vim.option.OptionValue(key=option_key, value=option_value))
+
+        if change_option_list and self.module.check_mode is False:
+            option_manager.UpdateOptions(changedValue=change_option_list)
+        return [option.key for option in change_option_list]
+
     def set_host_configuration_facts(self):
         changed_list = []
         message = ''
+        host_properties = retrieve_objects_properties(
+            self.content, self.hosts, ['configManager.advancedOption', 'config.product.build']
+        )
+        host_options = []
         for host in self.hosts:
-            option_manager = host.configManager.advancedOption
-            host_facts = {}
-            for s_option in option_manager.supportedOption:
-                host_facts[s_option.key] = dict(option_type=s_option.optionType, value=None)
-
-            for option in option_manager.QueryOptions():
-                if option.key in host_facts:
-                    host_facts[option.key].update(
-                        value=option.value,
-                    )
-
-            change_option_list = []
-            for option_key, option_value in self.options.items():
-                if option_key in host_facts:
-                    # We handle all supported types here so we can give meaningful errors.
-                    option_type = host_facts[option_key]['option_type']
-                    if is_boolean(option_value) and isinstance(option_type, vim.option.BoolOption):
-                        option_value = is_truthy(option_value)
-                    elif (isinstance(option_value, int) or is_integer(option_value))\
-                            and isinstance(option_type, vim.option.IntOption):
-                        option_value = VmomiSupport.vmodlTypes['int'](option_value)
-                    elif (isinstance(option_value, int) or is_integer(option_value, 'long'))\
-                            and isinstance(option_type, vim.option.LongOption):
-                        option_value = VmomiSupport.vmodlTypes['long'](option_value)
-                    elif isinstance(option_value, float) and isinstance(option_type, vim.option.FloatOption):
-                        pass
-                    elif isinstance(option_value, str) and isinstance(option_type, (vim.option.StringOption, vim.option.ChoiceOption)):
-                        pass
-                    else:
-                        self.module.fail_json(msg="Provided value is of type %s."
-                                                  " Option %s expects: %s" % (type(option_value), option_key, type(option_type)))
-
-                    if option_value != host_facts[option_key]['value']:
-                        change_option_list.append(vim.option.OptionValue(key=option_key, value=option_value))
-                        changed_list.append(option_key)
-                else:  # Don't silently drop unknown options. This prevents typos from falling through the cracks.
-                    self.module.fail_json(msg="Unsupported option %s" % option_key)
-            if change_option_list:
+            props = host_properties.get(host, {})
+            option_manager = props.get('configManager.advancedOption') or host.configManager.advancedOption
+            option_types = self.get_option_types(option_manager, props.get('config.product.build', host))
+            host_options.append((option_manager, self.get_option_values(option_types)))
+
+        with ThreadPoolExecutor(max_workers=max(1, self.params['parallel_hosts'])) as executor:
+            futures = [executor.submit(self.configure_host, option_manager, option_values)
+                       for option_manager, option_values in host_options]
+
+        for future in futures:
+            try:
+                host_changed_list = future.result()
+            except (vmodl.fault.SystemError, vmodl.fault.InvalidArgument) as e:
+                self.module.fail_json(msg="Failed to update option/s as one or more OptionValue "
+                                          "contains an invalid value: %s" % to_native(e.msg))
+            except vim.fault.InvalidName as e:
+                self.module.fail_json(msg="Failed to update option/s as one or more OptionValue "
+                                          "objects refers to a non-existent option : %s" % to_native(e.msg))
+            changed_list.extend(host_changed_list)
+            if host_changed_list:
                 if self.module.check_mode:
                     changed_suffix = ' would be changed.'
                 else:
@@ -151,15 +205,6 @@ class VmwareConfigManager(PyVmomi):
                 elif len(changed_list) == 1:
                     message = changed_list[0]
                 message += changed_suffix
-                if self.module.check_mode is False:
-                    try:
-                        option_manager.UpdateOptions(changedValue=change_option_list)
-                    except (vmodl.fault.SystemError, vmodl.fault.InvalidArgument) as e:
-                        self.module.fail_json(msg="Failed to update option/s as one or more OptionValue "
-                                                  "contains an invalid value: %s" % to_native(e.msg))
-                    except vim.fault.InvalidName as e:
-                        self.module.fail_json(msg="Failed to update option/s as one or more OptionValue "
-                                                  "objects refers to a non-existent option : %s" % to_native(e.msg))
             else:
                 message = 'All settings are already configured.'
 
@@ -172,6 +217,7 @@ def main():
         cluster_name=dict(type='str', required=False),
         esxi_hostname=dict(type='str', required=False),
         options=dict(type='dict', default=dict(), required=False),
+        parallel_hosts=dict(type='int', default=1),
     )
 
     module = AnsibleModule(
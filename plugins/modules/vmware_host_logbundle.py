@@ -15,17 +15,33 @@ module: vmware_host_logbundle
 short_description: Fetch logbundle file from ESXi
 description:
     - This module can be used to fetch logbundle file from ESXi.
+    - The logbundle is streamed to a temporary file next to the destination, which is renamed once the download is complete.
 author:
     - sky-joker (@sky-joker)
 options:
     esxi_hostname:
       description:
         - Name of the host system to fetch the logbundle.
+        - Required if O(cluster_name) is not set.
+        - O(esxi_hostname) and O(cluster_name) are mutually exclusive parameters.
       type: str
-      required: true
+    cluster_name:
+      description:
+        - Name of the cluster to fetch the logbundles of all its host systems.
+        - The logbundles are saved as C(<host name>.tgz) in the directory O(dest).
+        - Required if O(esxi_hostname) is not set.
+      type: str
+      version_added: '6.3.0'
+    parallel_downloads:
+      description:
+        - Number of logbundles fetched at the same time with O(cluster_name).
+      type: int
+      default: 4
+      version_added: '6.3.0'
     dest:
       description:
         - file destination on localhost, path must be exist.
+        - With O(cluster_name), an existing directory to save the logbundles in.
       type: str
       required: true
     download_timeout:
@@ -135,6 +151,15 @@ EXAMPLES = r'''
     manifests:
       - System:Base
       - VirtualMachines:VirtualMachineStats
+
+- name: fetch logbundle files from all ESXi of a cluster, two at a time
+  community.vmware.vmware_host_logbundle:
+    hostname: "{{ vcenter_hostname }}"
+    username: "{{ vcenter_username }}"
+    password: "{{ vcenter_password }}"
+    cluster_name: "{{ cluster_name }}"
+    dest: ./logbundles/
+    parallel_downloads: 2
 '''
 
 RETURN = r'''
@@ -155,6 +180,25 @@ dest:
         "state": "file",
         "uid": 0
       }
+size:
+    description: number of bytes of the logbundle file
+    returned: on success with O(esxi_hostname)
+    type: int
+    sample: 25783140
+    version_added: '6.3.0'
+bundles:
+    description: saved path and size of the logbundle file of each ESXi
+    returned: with O(cluster_name)
+    type: list
+    elements: dict
+    sample: [
+        {
+            "esxi_hostname": "esxi01.example.com",
+            "dest": "./logbundles/esxi01.example.com.tgz",
+            "size": 25783140
+        }
+    ]
+    version_added: '6.3.0'
 '''
 
 try:
@@ -162,24 +206,34 @@ try:
 except ImportError:
     pass
 
+import os
+import tempfile
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 
-from ansible_collections.community.vmware.plugins.module_utils.vmware import PyVmomi
+from ansible_collections.community.vmware.plugins.module_utils.vmware import PyVmomi, find_cluster_by_name
 from ansible_collections.vmware.vmware.plugins.module_utils.argument_spec import base_argument_spec
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.urls import fetch_url
 
 
+class LogbundleError(Exception):
+    pass
+
+
 class VMwareHostLogbundle(PyVmomi):
     def __init__(self, module):
         super(VMwareHostLogbundle, self).__init__(module)
         self.esxi_hostname = self.params['esxi_hostname']
+        self.cluster_name = self.params['cluster_name']
         self.dest = self.params['dest']
         self.manifests = self.params['manifests']
         self.performance_data = self.params['performance_data']
         self.download_timeout = self.params['download_timeout']
+        # stream the logbundle 1 MB at a time
+        self.chunk_size = 2 ** 20
 
-        if not self.dest.endswith('.tgz'):
+        if not self.cluster_name and not self.dest.endswith('.tgz'):
             self.dest = self.dest + '.tgz'
 
     def generate_req_headers(self, url):
@@ -194,30 +248,36 @@ class VMwareHostLogbundle(PyVmomi):
 
         return headers
 
-    def validate_manifests(self):
-        url = 'https://' + self.esxi_hostname + '/cgi-bin/vm-support.cgi?listmanifests=1'
+    def validate_manifests(self, esxi_hostname):
+        url = 'https://' + esxi_hostname + '/cgi-bin/vm-support.cgi?listmanifests=1'
         headers = self.generate_req_headers(url)
 
         manifests = []
         try:
             resp, info = fetch_url(self.module, method='GET', headers=headers, url=url)
             if info['status'] != 200:
-                self.module.fail_json(msg="failed to fetch manifests from %s: %s" % (url, info['msg']))
+                raise LogbundleError("failed to fetch manifests from %s: %s" % (url, info['msg']))
             manifest_list = ET.fromstring(resp.read())
             for manifest in manifest_list[0]:
                 manifests.append(manifest.attrib['id'])
 
+        except LogbundleError:
+            raise
         except Exception as e:
-            self.module.fail_json(msg="Failed to fetch manifests from %s: %s" % (url, e))
+            raise LogbundleError("Failed to fetch manifests from %s: %s" % (url, e))
 
         for manifest in self.manifests:
             validate_manifest_result = [m for m in manifests if m == manifest]
             if not validate_manifest_result:
-                self.module.fail_json(msg="%s is a manifest that cannot be specified." % manifest)
+                raise LogbundleError("%s is a manifest that cannot be specified." % manifest)
 
-    def get_logbundle(self):
-        self.validate_manifests()
-        url = 'https://' + self.esxi_hostname + '/cgi-bin/vm-support.cgi?manifests=' + '%20'.join(self.manifests)
+    def download_logbundle(self, esxi_hostname, dest):
+        """
+        Stream the logbundle of an ESXi to a temporary file renamed to dest once complete
+        Returns: number of bytes written
+        """
+        self.validate_manifests(esxi_hostname)
+        url = 'https://' + esxi_hostname + '/cgi-bin/vm-support.cgi?manifests=' + '%20'.join(self.manifests)
 
         if self.performance_data:
             duration = self.performance_data.get('duration')
@@ -226,26 +286,79 @@ class VMwareHostLogbundle(PyVmomi):
 
         headers = self.generate_req_headers(url)
 
+        size = 0
         try:
             if self.download_timeout is not None:
                 resp, info = fetch_url(self.module, method='GET', headers=headers, url=url, timeout=self.download_timeout)
             else:
                 resp, info = fetch_url(self.module, method='GET', headers=headers, url=url)
             if info['status'] != 200:
-                self.module.fail_json(msg="failed to fetch logbundle from %s: %s" % (url, info['msg']))
-            with open(self.dest, 'wb') as local_file:
-                local_file.write(resp.read())
-
+                raise LogbundleError("failed to fetch logbundle from %s: %s" % (url, info['msg']))
+            fd, tmp_dest = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(dest)),
+                                            prefix='.%s.' % os.path.basename(dest))
+            try:
+                with os.fdopen(fd, 'wb') as local_file:
+                    chunk = resp.read(self.chunk_size)
+                    while chunk:
+                        local_file.write(chunk)
+                        size += len(chunk)
+                        chunk = resp.read(self.chunk_size)
+                self.module.atomic_move(tmp_dest, dest)
+            finally:
+                if os.path.exists(tmp_dest):
+                    os.remove(tmp_dest)
+
+        except LogbundleError:
+            raise
         except Exception as e:
-            self.module.fail_json(msg="Failed to fetch logbundle from %s: %s" % (url, e))
+            raise LogbundleError("Failed to fetch logbundle from %s: %s" % (url, e))
+
+        return size
 
-        self.module.exit_json(changed=True, dest=self.dest)
+    def get_logbundle(self):
+        try:
+            size = self.download_logbundle(self.esxi_hostname, self.dest)
+        except LogbundleError as e:
+            self.module.fail_json(msg=str(e))
+
+        self.module.exit_json(changed=True, dest=self.dest, size=size)
+
+    def get_cluster_logbundles(self):
+        cluster = find_cluster_by_name(self.content, self.cluster_name)
+        if cluster is None:
+            self.module.fail_json(msg="Unable to find cluster %s" % self.cluster_name)
+        if not os.path.isdir(self.dest):
+            self.module.fail_json(msg="%s must be an existing directory with cluster_name" % self.dest)
+
+        esxi_hostnames = [host.name for host in cluster.host]
+        with ThreadPoolExecutor(max_workers=max(1, self.params['parallel_downloads'])) as executor:
+            downloads = []
+            for esxi_hostname in esxi_hostnames:
+                dest = os.path.join(self.dest, esxi_hostname + '.tgz')
+                downloads.append((esxi_hostname, dest, executor.submit(self.download_logbundle, esxi_hostname, dest)))
+
+        bundles = []
+        errors = []
+        for esxi_hostname, dest, future in downloads:
+            try:
+                bundles.append(dict(esxi_hostname=esxi_hostname, dest=dest, size=future.result()))
+            except LogbundleError as e:
+                errors.append(str(e))
+
+        if errors:
+            self.module.fail_json(msg="Failed to fetch logbundles from %d of %d hosts: %s"
+                                      % (len(errors), len(esxi_hostnames), ' '.join(errors)),
+                                  bundles=bundles)
+
+        self.module.exit_json(changed=bool(bundles), dest=self.dest, bundles=bundles)
 
 
 def main():
     argument_spec = base_argument_spec()
     argument_spec.update(
-        esxi_hostname=dict(type='str', required=True),
+        esxi_hostname=dict(type='str'),
+        cluster_name=dict(type='str'),
+        parallel_downloads=dict(type='int', default=4),
         dest=dict(type='str', required=True),
         download_timeout=dict(type='int'),
         manifests=dict(type='list', elements='str',
@@ -271,10 +384,15 @@ def main():
                               ))
     )
 
-    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True,
+                           required_one_of=[['esxi_hostname', 'cluster_name']],
+                           mutually_exclusive=[['esxi_hostname', 'cluster_name']])
 
     vmware_host_logbundle_mgr = VMwareHostLogbundle(module)
-    vmware_host_logbundle_mgr.get_logbundle()
+    if module.params['cluster_name']:
+        vmware_host_logbundle_mgr.get_cluster_logbundles()
+    else:
+        vmware_host_logbundle_mgr.get_logbundle()
 
 
 if __name__ == "__main__":
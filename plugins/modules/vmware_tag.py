@@ -132,7 +132,7 @@ class VmwareTag(VmwareRestClient):
 
         if self.category_id is None:
             category_name = self.params.get('category_name')
-            category_obj = self.search_svc_object_by_name(service=self.category_service, svc_obj_name=category_name)
+            category_obj = self.find_svc_object_by_name(service=self.category_service, svc_obj_name=category_name)
             if category_obj is None:
                 self.module.fail_json(msg="Unable to find the category %s" % category_name)
 
@@ -209,6 +209,7 @@ class VmwareTag(VmwareRestClient):
             tag_update_spec.description = desired_tag_desc
             try:
                 self.tag_service.update(tag_id, tag_update_spec)
+                self.object_index.forget(tag_id)
             except Error as error:
                 self.module.fail_json(msg="%s" % self.get_error_message(error))
 
@@ -225,6 +226,7 @@ class VmwareTag(VmwareRestClient):
         tag_id = self.tag_obj.id
         try:
             self.tag_service.delete(tag_id=tag_id)
+            self.object_index.forget(tag_id)
         except Error as error:
             self.module.fail_json(msg="%s" % self.get_error_message(error))
 
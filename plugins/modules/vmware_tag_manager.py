@@ -306,14 +306,14 @@ class VmwareTagManager(VmwareRestClient):
                 category_name = tag.get('category')
                 if category_name is not None:
                     # User specified category
-                    category_obj = self.search_svc_object_by_name(self.category_service, category_name)
+                    category_obj = self.find_svc_object_by_name(self.category_service, category_name)
                     if category_obj is None:
                         self.module.fail_json(msg="Unable to find the category %s" % category_name)
             elif isinstance(tag, str):
                 if ":" in tag:
                     # User specified category
                     category_name, tag_name = tag.split(":", 1)
-                    category_obj = self.search_svc_object_by_name(self.category_service, category_name)
+                    category_obj = self.find_svc_object_by_name(self.category_service, category_name)
                     if category_obj is None:
                         self.module.fail_json(msg="Unable to find the category %s" % category_name)
                 else:
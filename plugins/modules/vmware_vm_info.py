@@ -289,7 +289,7 @@ except ImportError:
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.community.vmware.plugins.module_utils.vmware import PyVmomi, \
-    get_all_objs, _get_vm_prop, get_parent_datacenter, find_vm_by_name
+    InventoryPathIndex, find_vm_by_name, get_objects_properties, iter_objects_properties, retrieve_objects_properties
 from ansible_collections.vmware.vmware.plugins.module_utils.argument_spec import base_argument_spec
 from ansible_collections.community.vmware.plugins.module_utils.vmware_rest_client import VmwareRestClient
 
@@ -297,14 +297,14 @@ from ansible_collections.community.vmware.plugins.module_utils.vmware_rest_clien
 class VmwareVmInfo(PyVmomi):
     def __init__(self, module):
         super(VmwareVmInfo, self).__init__(module)
+        self.host_names = None
         if self.module.params.get('show_tag'):
             self.vmware_client = VmwareRestClient(self.module)
 
     def get_tag_info(self, vm_dynamic_obj):
         return self.vmware_client.get_tags_for_vm(vm_mid=vm_dynamic_obj._moId)
 
-    def get_vm_attributes(self, vm):
-        custom_field_values = vm.customValue
+    def get_vm_attributes(self, custom_field_values):
         custom_field_mgr = self.custom_field_mgr
         vm_attributes = {}
         for custom_field in custom_field_mgr:
@@ -313,10 +313,60 @@ class VmwareVmInfo(PyVmomi):
                     vm_attributes[custom_field.name] = custom_value.value
         return vm_attributes
 
+    def get_property_paths(self):
+        """
+        Get the VM properties needed for the requested information.
+        """
+        paths = [
+            'config.template',
+            'summary.config.name',
+            'summary.config.guestFullName',
+            'summary.config.uuid',
+            'summary.config.instanceUuid',
+            'summary.runtime.powerState',
+            'summary.guest.ipAddress',
+        ]
+        if self.params.get('show_mac_address') or self.params.get('show_allocated'):
+            paths.append('config.hardware.device')
+        if self.params.get('show_allocated'):
+            paths.extend(['config.hardware.numCPU', 'config.hardware.memoryMB'])
+        if self.params.get('show_net'):
+            paths.append('guest.net')
+        if self.params.get('show_esxi_hostname') or self.params.get('show_cluster'):
+            paths.append('summary.runtime.host')
+        if self.params.get('show_resource_pool'):
+            paths.append('resourcePool')
+        if self.params.get('show_attribute'):
+            paths.append('customValue')
+        if self.params.get('show_folder') or self.params.get('show_datacenter'):
+            paths.extend(['parent', 'parentVApp'])
+        if self.params.get('show_datastore'):
+            paths.append('config.datastoreUrl')
+        return paths
+
+    def get_host_names(self):
+        """
+        Get the name of every ESXi host, read once for all VMs.
+        """
+        if self.host_names is None:
+            self.host_names = {}
+            for object_content in get_objects_properties(self.content, [vim.HostSystem], ['summary.config.name']):
+                for prop in object_content.propSet:
+                    self.host_names[object_content.obj] = prop.val
+        return self.host_names
+
+    def get_datacenter(self, index, parent):
+        for item in reversed(index.lineage(parent)):
+            if isinstance(item, vim.Datacenter):
+                return item
+        return None
+
     # https://github.com/vmware/pyvmomi-community-samples/blob/master/samples/getallvms.py
     def get_virtual_machines(self):
         """
         Get one/all virtual machines and related configurations information.
+        The properties of all VMs are fetched page by page with the property collector,
+        parents, hosts and clusters are resolved from lookup tables built once.
         """
         folder = self.params.get('folder')
         folder_obj = None
@@ -325,68 +375,73 @@ class VmwareVmInfo(PyVmomi):
             if not folder_obj:
                 self.module.fail_json(msg="Failed to find folder specified by %(folder)s" % self.params)
 
+        paths = self.get_property_paths()
         vm_name = self.params.get('vm_name')
         if vm_name:
             virtual_machine = find_vm_by_name(self.content, vm_name=vm_name, folder=folder_obj)
             if not virtual_machine:
                 self.module.fail_json(msg="Failed to find virtual machine %s" % vm_name)
-            else:
-                virtual_machines = [virtual_machine]
+            virtual_machines = retrieve_objects_properties(self.content, [virtual_machine], paths).items()
         else:
-            virtual_machines = get_all_objs(self.content, [vim.VirtualMachine], folder=folder_obj)
+            virtual_machines = (
+                (object_content.obj, dict((prop.name, prop.val) for prop in object_content.propSet))
+                for object_content in iter_objects_properties(self.content, [vim.VirtualMachine], paths, folder=folder_obj)
+            )
+
+        index = InventoryPathIndex.get(self.content)
+        vm_type = self.module.params.get('vm_type')
         _virtual_machines = []
 
-        for vm in virtual_machines:
-            _ip_address = ""
-            summary = vm.summary
-            if summary.guest is not None:
-                _ip_address = summary.guest.ipAddress
-                if _ip_address is None:
-                    _ip_address = ""
+        for vm, props in virtual_machines:
+            is_template = props.get('config.template')
+            if (vm_type == 'vm' and is_template) or (vm_type == 'template' and not is_template):
+                continue
+
+            _ip_address = props.get('summary.guest.ipAddress') or ""
+            all_devices = props.get('config.hardware.device') or []
             _mac_address = []
             if self.module.params.get('show_mac_address'):
-                all_devices = _get_vm_prop(vm, ('config', 'hardware', 'device'))
-                if all_devices:
-                    for dev in all_devices:
-                        if isinstance(dev, vim.vm.device.VirtualEthernetCard):
-                            _mac_address.append(dev.macAddress)
+                for dev in all_devices:
+                    if isinstance(dev, vim.vm.device.VirtualEthernetCard):
+                        _mac_address.append(dev.macAddress)
 
             net_dict = {}
             if self.module.params.get('show_net'):
-                vmnet = _get_vm_prop(vm, ('guest', 'net'))
-                if vmnet:
-                    for device in vmnet:
-                        net_dict[device.macAddress] = dict()
-                        net_dict[device.macAddress]['ipv4'] = []
-                        net_dict[device.macAddress]['ipv6'] = []
-                        if device.ipConfig is not None:
-                            for ip_addr in device.ipConfig.ipAddress:
-                                if "::" in ip_addr.ipAddress:
-                                    net_dict[device.macAddress]['ipv6'].append(ip_addr.ipAddress + "/" + str(ip_addr.prefixLength))
-                                else:
-                                    net_dict[device.macAddress]['ipv4'].append(ip_addr.ipAddress + "/" + str(ip_addr.prefixLength))
+                for device in props.get('guest.net') or []:
+                    net_dict[device.macAddress] = dict()
+                    net_dict[device.macAddress]['ipv4'] = []
+                    net_dict[device.macAddress]['ipv6'] = []
+                    if device.ipConfig is not None:
+                        for ip_addr in device.ipConfig.ipAddress:
+                            if "::" in ip_addr.ipAddress:
+                                net_dict[device.macAddress]['ipv6'].append(ip_addr.ipAddress + "/" + str(ip_addr.prefixLength))
+                            else:
+                                net_dict[device.macAddress]['ipv4'].append(ip_addr.ipAddress + "/" + str(ip_addr.prefixLength))
 
             esxi_hostname = None
             esxi_parent = None
 
             if self.module.params.get('show_esxi_hostname') or self.module.params.get('show_cluster'):
-                if summary.runtime.host:
-                    esxi_hostname = summary.runtime.host.summary.config.name
-                    esxi_parent = summary.runtime.host.parent
+                host = props.get('summary.runtime.host')
+                if host:
+                    esxi_hostname = self.get_host_names().get(host)
+                    esxi_parent = index.parent(host)
 
             cluster_name = None
             if self.module.params.get('show_cluster'):
                 if esxi_parent and isinstance(esxi_parent, vim.ClusterComputeResource):
-                    cluster_name = summary.runtime.host.parent.name
+                    cluster_name = index.name(esxi_parent)
 
             resource_pool = None
             if self.module.params.get('show_resource_pool'):
-                if vm.resourcePool and vm.resourcePool != vm.resourcePool.owner.resourcePool:
-                    resource_pool = vm.resourcePool.name
+                # The root resource pool of a compute resource is not reported
+                vm_resource_pool = props.get('resourcePool')
+                if vm_resource_pool and not isinstance(index.parent(vm_resource_pool), vim.ComputeResource):
+                    resource_pool = index.name(vm_resource_pool)
 
             vm_attributes = dict()
             if self.module.params.get('show_attribute'):
-                vm_attributes = self.get_vm_attributes(vm)
+                vm_attributes = self.get_vm_attributes(props.get('customValue') or [])
 
             vm_tags = list()
             if self.module.params.get('show_tag'):
@@ -395,39 +450,39 @@ class VmwareVmInfo(PyVmomi):
             allocated = {}
             if self.module.params.get('show_allocated'):
                 storage_allocated = 0
-                for device in vm.config.hardware.device:
+                for device in all_devices:
                     if isinstance(device, vim.vm.device.VirtualDisk):
                         storage_allocated += device.capacityInBytes
                 allocated = {
                     "storage": storage_allocated,
-                    "cpu": vm.config.hardware.numCPU,
-                    "memory": vm.config.hardware.memoryMB}
+                    "cpu": props.get('config.hardware.numCPU'),
+                    "memory": props.get('config.hardware.memoryMB')}
 
             vm_folder = None
-            if self.module.params.get('show_folder'):
-                vm_folder = PyVmomi.get_vm_path(content=self.content, vm_name=vm)
+            if self.module.params.get('show_folder') and props.get('parent'):
+                vm_folder = '/' + '/'.join(index.path_names(props['parent']))
 
             datacenter = None
             if self.module.params.get('show_datacenter'):
-                datacenter = get_parent_datacenter(vm)
+                parent = props.get('parent') or props.get('parentVApp')
+                if parent:
+                    datacenter = self.get_datacenter(index, parent)
             datastore_url = list()
             if self.module.params.get('show_datastore'):
                 datastore_attributes = ('name', 'url')
-                vm_datastore_urls = _get_vm_prop(vm, ('config', 'datastoreUrl'))
-                if vm_datastore_urls:
-                    for entry in vm_datastore_urls:
-                        datastore_url.append({key: getattr(entry, key) for key in dir(entry) if key in datastore_attributes})
+                for entry in props.get('config.datastoreUrl') or []:
+                    datastore_url.append({key: getattr(entry, key) for key in dir(entry) if key in datastore_attributes})
             virtual_machine = {
-                "guest_name": summary.config.name,
-                "guest_fullname": summary.config.guestFullName,
-                "power_state": summary.runtime.powerState,
+                "guest_name": props.get('summary.config.name'),
+                "guest_fullname": props.get('summary.config.guestFullName'),
+                "power_state": props.get('summary.runtime.powerState'),
                 "ip_address": _ip_address,  # Kept for backward compatibility
                 "mac_address": _mac_address,  # Kept for backward compatibility
-                "uuid": summary.config.uuid,
-                "instance_uuid": summary.config.instanceUuid,
+                "uuid": props.get('summary.config.uuid'),
+                "instance_uuid": props.get('summary.config.instanceUuid'),
                 "vm_network": net_dict,
                 "esxi_hostname": esxi_hostname,
-                "datacenter": None if datacenter is None else datacenter.name,
+                "datacenter": None if datacenter is None else index.name(datacenter),
                 "cluster": cluster_name,
                 "resource_pool": resource_pool,
                 "attributes": vm_attributes,
@@ -437,15 +492,7 @@ class VmwareVmInfo(PyVmomi):
                 "datastore_url": datastore_url,
                 "allocated": allocated
             }
-
-            vm_type = self.module.params.get('vm_type')
-            is_template = _get_vm_prop(vm, ('config', 'template'))
-            if vm_type == 'vm' and not is_template:
-                _virtual_machines.append(virtual_machine)
-            elif vm_type == 'template' and is_template:
-                _virtual_machines.append(virtual_machine)
-            elif vm_type == 'all':
-                _virtual_machines.append(virtual_machine)
+            _virtual_machines.append(virtual_machine)
         return _virtual_machines
 
 
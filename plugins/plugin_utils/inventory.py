@@ -12,6 +12,8 @@ __metaclass__ = type
 import ssl
 import atexit
 import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     # requests is required for exception handling of the ConnectionError
@@ -32,6 +34,7 @@ except ImportError:
     HAS_PYVMOMI = False
 
 try:
+    from com.vmware.vapi.std_client import DynamicID
     from vmware.vapi.vsphere.client import create_vsphere_client
 
     HAS_VSPHERE = True
@@ -41,11 +44,20 @@ except ImportError:
 from ansible.errors import AnsibleError, AnsibleParserError
 from ansible.module_utils.common.dict_transformations import _snake_to_camel
 from ansible.module_utils.common.text.converters import to_text, to_native
+from ansible_collections.community.vmware.plugins.module_utils.vmware import retrieve_properties_paged
 
 
 class BaseVMwareInventory:
     def __init__(
-        self, hostname, username, password, port, validate_certs, with_tags, display
+        self,
+        hostname,
+        username,
+        password,
+        port,
+        validate_certs,
+        with_tags,
+        display,
+        max_workers=1,
     ):
         self.hostname = hostname
         self.username = username
@@ -56,6 +68,7 @@ class BaseVMwareInventory:
         self.content = None
         self.rest_content = None
         self.display = display
+        self.max_workers = max_workers or 1
 
     def do_login(self):
         """
@@ -209,6 +222,13 @@ class BaseVMwareInventory:
                 "the documentation for more information."
             )
 
+    def _map(self, func, items):
+        """
+        Apply func to all items, concurrently with up to max_workers threads sharing the session
+        :return: iterator of results in the order of items
+        """
+        return concurrent_map(func, items, self.max_workers)
+
     def get_managed_objects_properties(
         self, vim_type, properties=None, resources=None, strict=False
     ):
@@ -220,6 +240,25 @@ class BaseVMwareInventory:
         :param strict: Dictates if plugin raises error or just warns
         :return: local content object
         """
+        objects = []
+        for page in self.iter_managed_objects_properties(
+            vim_type, properties=properties, resources=resources, strict=strict
+        ):
+            objects.extend(page)
+        return objects
+
+    def iter_managed_objects_properties(
+        self, vim_type, properties=None, resources=None, strict=False, page_size=None
+    ):
+        """
+        Look up Managed Object References in vCenter / ESXi Environment page by page
+        :param vim_type: Type of vim object e.g, for datacenter - vim.Datacenter
+        :param properties: List of properties related to vim object e.g. Name
+        :param resources: List of resources to limit search scope
+        :param strict: Dictates if plugin raises error or just warns
+        :param page_size: Maximum number of objects per page, None lets the server decide
+        :return: generator of lists of object contents
+        """
         traversal_spec = vmodl.query.PropertyCollector.TraversalSpec
         filter_spec = vmodl.query.PropertyCollector.FilterSpec
         object_spec = vmodl.query.PropertyCollector.ObjectSpec
@@ -234,31 +273,35 @@ class BaseVMwareInventory:
             self.display.warning(message)
 
         def get_contents(container, vim_types):
-            return self.content.propertyCollector.RetrieveContents(
-                [
-                    filter_spec(
-                        objectSet=[
-                            object_spec(
-                                obj=self.content.viewManager.CreateContainerView(
-                                    container, vim_types, True
-                                ),
-                                skip=False,
-                                selectSet=[
-                                    traversal_spec(
-                                        type=vim.view.ContainerView,
-                                        path="view",
-                                        skip=False,
-                                    )
-                                ],
-                            )
-                        ],
-                        propSet=[
-                            property_spec(type=t, all=False, pathSet=["name"])
-                            for t in vim_types
-                        ],
-                    )
-                ]
+            view = self.content.viewManager.CreateContainerView(
+                container, vim_types, True
             )
+            try:
+                return self.content.propertyCollector.RetrieveContents(
+                    [
+                        filter_spec(
+                            objectSet=[
+                                object_spec(
+                                    obj=view,
+                                    skip=False,
+                                    selectSet=[
+                                        traversal_spec(
+                                            type=vim.view.ContainerView,
+                                            path="view",
+                                            skip=False,
+                                        )
+                                    ],
+                                )
+                            ],
+                            propSet=[
+                                property_spec(type=t, all=False, pathSet=["name"])
+                                for t in vim_types
+                            ],
+                        )
+                    ]
+                )
+            finally:
+                view.Destroy()
 
         def filter_containers(containers, typ, filter_list):
             if len(filter_list) > 0:
@@ -266,8 +309,10 @@ class BaseVMwareInventory:
                 results = []
                 found_filters = {}
 
-                for container in containers:
-                    results.extend(get_contents(container, [typ]))
+                for contents in self._map(
+                    lambda container: get_contents(container, [typ]), containers
+                ):
+                    results.extend(contents)
 
                 for res in results:
                     if res.propSet[0].val in filter_list:
@@ -288,7 +333,7 @@ class BaseVMwareInventory:
             if vim_type:
                 containers = filter_containers(containers, vim_type, names)
 
-            new_containers = []
+            filter_args = []
             for fil in filters:
                 new_filters = None
                 for k, v in fil.items():
@@ -298,10 +343,14 @@ class BaseVMwareInventory:
                         vim_type = getattr(vim, _snake_to_camel(k, True))
                         names = v
                         type_to_name_map[vim_type] = k.replace("_", " ")
+                filter_args.append((vim_type, names, new_filters))
 
-                new_containers.extend(
-                    build_containers(containers, vim_type, names, new_filters)
-                )
+            # sibling filters are looked up concurrently
+            new_containers = []
+            for filter_containers_list in self._map(
+                lambda args: build_containers(containers, *args), filter_args
+            ):
+                new_containers.extend(filter_containers_list)
 
             if len(filters) > 0:
                 return new_containers
@@ -311,16 +360,20 @@ class BaseVMwareInventory:
             [self.content.rootFolder], None, None, resource_filters
         )
         if len(containers) == 0:
-            return []
+            return
 
+        views = self._map(
+            lambda r: self.content.viewManager.CreateContainerView(r, [vim_type], True),
+            containers,
+        )
         objs_list = [
             object_spec(
-                obj=self.content.viewManager.CreateContainerView(r, [vim_type], True),
+                obj=view,
                 selectSet=[
                     traversal_spec(path="view", skip=False, type=vim.view.ContainerView)
                 ],
             )
-            for r in containers
+            for view in views
         ]
 
         is_all = not properties
@@ -337,13 +390,131 @@ class BaseVMwareInventory:
             reportMissingObjectsInResults=False,
         )
 
+        filter_specs = [filter_spec]
+        if self.max_workers > 1:
+            filter_specs = split_filter_spec(filter_spec)
+
+        def retrieve(spec):
+            pages = retrieve_properties_paged(
+                self.content.propertyCollector, spec, page_size
+            )
+            # a worker retrieves all pages of its container, which are kept until processed
+            return list(pages) if len(filter_specs) > 1 else pages
+
         try:
-            return self.content.propertyCollector.RetrieveContents([filter_spec])
+            for pages in self._map(retrieve, filter_specs):
+                for page in pages:
+                    yield page
         except vmodl.query.InvalidProperty as err:
             _handle_error("Invalid property name: %s" % err.name)
         except Exception as err:  # pylint: disable=broad-except
             _handle_error("Couldn't retrieve contents from host: %s" % to_native(err))
-        return []
+
+
+# Set in the threads of concurrent_map()
+_worker_state = threading.local()
+
+
+def concurrent_map(func, items, max_workers):
+    """
+    Apply func to all items with up to max_workers threads.
+    Calls made from one of the threads run serially, so that nested calls do not multiply the threads.
+    :param func: Function to apply
+    :param items: Items to apply the function to
+    :param max_workers: Maximum number of threads, 1 applies func in the calling thread
+    :return: generator of results in the order of items, each one yielded as soon as it and the previous ones are done
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1 or getattr(_worker_state, "active", False):
+        for item in items:
+            yield func(item)
+        return
+
+    def run(item):
+        _worker_state.active = True
+        try:
+            return func(item)
+        finally:
+            _worker_state.active = False
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        for result in executor.map(run, items):
+            yield result
+
+
+def split_filter_spec(filter_spec):
+    """
+    Split a filter spec into one filter spec per object spec, so that the
+    objects of every container can be retrieved concurrently
+    :param filter_spec: FilterSpec of the objects and properties to retrieve
+    :return: list of FilterSpec
+    """
+    return [
+        vmodl.query.PropertyCollector.FilterSpec(
+            objectSet=[object_spec],
+            propSet=filter_spec.propSet,
+            reportMissingObjectsInResults=filter_spec.reportMissingObjectsInResults,
+        )
+        for object_spec in filter_spec.objectSet
+    ]
+
+
+class TagResolver:
+    """
+    Resolve the tags attached to inventory objects with bulk vSphere Automation API calls.
+
+    Attached tags are listed for many objects at once with
+    TagAssociation.list_attached_tags_on_objects, and the details of each tag
+    and category are fetched only once and cached by ID.
+    """
+
+    CHUNK_SIZE = 500
+
+    def __init__(self, rest_content):
+        self.tag_svc = rest_content.tagging.Tag
+        self.cat_svc = rest_content.tagging.Category
+        self.tag_association = rest_content.tagging.TagAssociation
+        self.tag_ids = set(self.tag_svc.list())
+        self.tags = {}
+        self.categories = {}
+
+    def get_category_name(self, category_id):
+        if category_id not in self.categories:
+            self.categories[category_id] = self.cat_svc.get(category_id).name
+        return self.categories[category_id]
+
+    def get_tag(self, tag_id):
+        """
+        Return the tag name and category name of the given tag ID,
+        None for tags that do not exist anymore (ghost tags - community.vmware#681)
+        """
+        if tag_id not in self.tag_ids:
+            return None
+        if tag_id not in self.tags:
+            tag_obj = self.tag_svc.get(tag_id)
+            self.tags[tag_id] = (tag_obj.name, self.get_category_name(tag_obj.category_id))
+        return self.tags[tag_id]
+
+    def get_attached_tags(self, object_type, mo_ids):
+        """
+        Get the tags attached to the given objects
+        :param object_type: vSphere type name of the objects e.g. VirtualMachine
+        :param mo_ids: List of managed object IDs
+        :return: dict of managed object ID to list of (tag name, category name) tuples
+        """
+        attached_tags = dict((mo_id, []) for mo_id in mo_ids)
+        if not self.tag_ids:
+            return attached_tags
+
+        mo_ids = list(attached_tags)
+        for start in range(0, len(mo_ids), self.CHUNK_SIZE):
+            dynamic_ids = [DynamicID(type=object_type, id=mo_id) for mo_id in mo_ids[start:start + self.CHUNK_SIZE]]
+            for object_to_tags in self.tag_association.list_attached_tags_on_objects(dynamic_ids):
+                for tag_id in object_to_tags.tag_ids:
+                    tag = self.get_tag(tag_id)
+                    if tag is not None:
+                        attached_tags[object_to_tags.object_id.id].append(tag)
+        return attached_tags
 
 
 def in_place_merge(a, b):
@@ -370,12 +541,22 @@ def to_nested_dict(vm_properties):
     host_properties = {}
 
     for vm_prop_name, vm_prop_val in vm_properties.items():
-        prop_parents = reversed(vm_prop_name.split("."))
-        prop_dict = parse_vim_property(vm_prop_val)
-
-        for k in prop_parents:
-            prop_dict = {k: prop_dict}
-        host_properties = in_place_merge(host_properties, prop_dict)
+        prop_parents = vm_prop_name.split(".")
+        prop_val = parse_vim_property(vm_prop_val)
+
+        # Walk down to the parent of the property, creating levels as needed
+        parent = host_properties
+        for k in prop_parents[:-1]:
+            child = parent.get(k)
+            if not isinstance(child, dict):
+                child = parent[k] = {}
+            parent = child
+
+        k = prop_parents[-1]
+        if isinstance(prop_val, dict) and isinstance(parent.get(k), dict):
+            in_place_merge(parent[k], prop_val)
+        else:
+            parent[k] = prop_val
 
     return host_properties
 
@@ -385,56 +566,94 @@ def to_flatten_dict(d, parent_key="", sep="."):
     Parse properties dict to dot notation
 
     """
-    items = []
+    result = {}
+    _flatten_into(result, d, parent_key, sep)
+    return result
+
+
+def _flatten_into(result, d, parent_key, sep):
     for k, v in d.items():
         new_key = parent_key + sep + k if parent_key else k
         if v and isinstance(v, dict):
-            items.extend(to_flatten_dict(v, new_key, sep=sep).items())
+            _flatten_into(result, v, new_key, sep)
         else:
-            items.append((new_key, v))
-    return dict(items)
+            result[new_key] = v
+
+
+# Parsers and DataObject property names are looked up once per type
+_VIM_PROPERTY_PARSERS = {}
+_DATA_OBJECT_PROPERTIES = {}
+_IGNORED_DATA_OBJECT_PROPERTIES = frozenset(["dynamicProperty", "dynamicType", "managedObjectType"])
 
 
 def parse_vim_property(vim_prop):
     """
     Helper method to parse VIM properties of virtual machine
     """
-    prop_type = type(vim_prop).__name__
-    if prop_type.startswith(("vim", "vmodl", "Link")):
-        if isinstance(vim_prop, DataObject):
-            r = {}
-            for prop in vim_prop._GetPropertyList():  # pylint: disable=protected-access
-                if prop.name not in [
-                    "dynamicProperty",
-                    "dynamicType",
-                    "managedObjectType",
-                ]:
-                    sub_prop = getattr(vim_prop, prop.name)
-                    r[prop.name] = parse_vim_property(sub_prop)
-            return r
-
-        if isinstance(vim_prop, list):
-            r = []
-            for prop in vim_prop:
-                r.append(parse_vim_property(prop))
-            return r
-        return vim_prop.__str__()
-
-    elif prop_type == "datetime":
-        return Iso8601.ISO8601Format(vim_prop)
-
-    elif prop_type == "long":
-        return int(vim_prop)
-    elif prop_type == "long[]":
-        return [int(x) for x in vim_prop]
-
-    elif isinstance(vim_prop, list):
-        return [parse_vim_property(x) for x in vim_prop]
-
-    elif prop_type in ["bool", "int", "NoneType", "dict"]:
-        return vim_prop
-
-    elif prop_type in ["binary"]:
-        return to_text(base64.b64encode(vim_prop))
-
-    return to_text(vim_prop)
+    prop_type = type(vim_prop)
+    parser = _VIM_PROPERTY_PARSERS.get(prop_type)
+    if parser is None:
+        parser = _VIM_PROPERTY_PARSERS[prop_type] = _get_vim_property_parser(prop_type)
+    return parser(vim_prop)
+
+
+def _get_vim_property_parser(prop_type):
+    """
+    Select how values of the given type are parsed
+    """
+    type_name = prop_type.__name__
+    if type_name.startswith(("vim", "vmodl", "Link")):
+        if issubclass(prop_type, DataObject):
+            return _parse_data_object
+        if issubclass(prop_type, list):
+            return _parse_list
+        return str
+
+    elif type_name == "datetime":
+        return Iso8601.ISO8601Format
+
+    elif type_name == "long":
+        return int
+    elif type_name == "long[]":
+        return _parse_long_list
+
+    elif issubclass(prop_type, list):
+        return _parse_list
+
+    elif type_name in ["bool", "int", "NoneType", "dict"]:
+        return _identity
+
+    elif type_name in ["binary"]:
+        return _parse_binary
+
+    return to_text
+
+
+def _parse_data_object(vim_prop):
+    prop_names = _DATA_OBJECT_PROPERTIES.get(type(vim_prop))
+    if prop_names is None:
+        prop_names = _DATA_OBJECT_PROPERTIES[type(vim_prop)] = [
+            prop.name
+            for prop in vim_prop._GetPropertyList()  # pylint: disable=protected-access
+            if prop.name not in _IGNORED_DATA_OBJECT_PROPERTIES
+        ]
+    return dict(
+        (prop_name, parse_vim_property(getattr(vim_prop, prop_name)))
+        for prop_name in prop_names
+    )
+
+
+def _parse_list(vim_prop):
+    return [parse_vim_property(prop) for prop in vim_prop]
+
+
+def _parse_long_list(vim_prop):
+    return [int(x) for x in vim_prop]
+
+
+def _parse_binary(vim_prop):
+    return to_text(base64.b64encode(vim_prop))
+
+
+def _identity(vim_prop):
+    return vim_prop
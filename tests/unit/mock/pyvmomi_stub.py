@@ -0,0 +1,196 @@
+# Copyright: (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import itertools
+
+from pyVmomi import vim, vmodl
+
+
+class RecordingStub(object):
+    """
+    Minimal pyVmomi stub adapter serving recorded inventory data.
+
+    Every lazy property read and every managed method call is a SOAP round
+    trip against a real vCenter, the stub records them in ``calls`` so tests
+    can assert how many round trips an operation costs.
+    """
+
+    def __init__(self):
+        self.properties = {}
+        self.inventory = []
+        self.calls = []
+        self.timeline = []
+        self._counter = itertools.count()
+        self.service_content = vim.ServiceInstanceContent(
+            rootFolder=vim.Folder('group-d1', self),
+            propertyCollector=vmodl.query.PropertyCollector('propertyCollector', self),
+            viewManager=vim.view.ViewManager('ViewManager', self),
+        )
+
+    @property
+    def round_trips(self):
+        return len(self.calls)
+
+    def reset(self):
+        self.calls = []
+
+    def add(self, vimtype, moid, **properties):
+        """ Record a managed object with the given property values and return it """
+        obj = vimtype(moid, self)
+        self.properties[moid] = properties
+        self.inventory.append(obj)
+        return obj
+
+    def remove(self, moid):
+        """ Delete a recorded managed object, as if it was destroyed on the server """
+        self.inventory = [obj for obj in self.inventory if obj._moId != moid]
+        self.properties.pop(moid, None)
+        for properties in self.properties.values():
+            if 'view' in properties:
+                properties['view'] = [obj for obj in properties['view'] if obj._moId != moid]
+
+    def mo(self, vimtype, moid):
+        """ Return a managed object reference bound to this stub """
+        return vimtype(moid, self)
+
+    # pyVmomi stub adapter interface
+
+    def InvokeAccessor(self, mo, info):
+        self.calls.append((mo._moId, info.name))
+        return self.properties.get(mo._moId, {}).get(info.name)
+
+    def InvokeMethod(self, mo, info, args):
+        self.calls.append((mo._moId, info.name))
+        return getattr(self, '_%s' % info.name)(mo, *args)
+
+    # server side emulation
+
+    def _CreateContainerView(self, mo, container, type, recursive):
+        view = vim.view.ContainerView('session-view-%d' % next(self._counter), self)
+        self.properties[view._moId] = {
+            'view': [obj for obj in self.inventory if not type or isinstance(obj, tuple(type))],
+        }
+        return view
+
+    def _Destroy(self, mo):
+        self.properties.pop(mo._moId, None)
+
+    def get_path(self, obj, path):
+        """ Resolve a dotted property path without recording a round trip """
+        parts = path.split('.')
+        value = self.properties.get(obj._moId, {}).get(parts[0])
+        for part in parts[1:]:
+            if value is None:
+                return None
+            value = getattr(value, part, None)
+        return value
+
+    def _collect(self, spec):
+        objects = []
+        for object_spec in spec.objectSet:
+            if not object_spec.skip:
+                objects.append(object_spec.obj)
+            for select in object_spec.selectSet or []:
+                value = self.get_path(object_spec.obj, select.path)
+                if isinstance(value, list):
+                    objects.extend(value)
+                elif value is not None:
+                    objects.append(value)
+
+        result = []
+        for obj in objects:
+            for prop_spec in spec.propSet:
+                if not isinstance(obj, prop_spec.type):
+                    continue
+                prop_set = []
+                for path in prop_spec.pathSet:
+                    value = self.get_path(obj, path)
+                    if type(value) is list:
+                        # the wire format needs typed arrays
+                        value = type(value[0]).Array(value) if value else None
+                    if value is not None:
+                        prop_set.append(vmodl.DynamicProperty(name=path, val=value))
+                result.append(vmodl.query.PropertyCollector.ObjectContent(obj=obj, propSet=prop_set))
+                break
+        return result
+
+    def _RetrieveContents(self, mo, specSet):
+        result = []
+        for spec in specSet:
+            result.extend(self._collect(spec))
+        return result
+
+    def _RetrievePropertiesEx(self, mo, specSet, options):
+        objects = self._RetrieveContents(mo, specSet)
+        token = 'token-%d' % next(self._counter)
+        self.properties[token] = {'objects': objects, 'page_size': options.maxObjects or len(objects)}
+        return self._ContinueRetrievePropertiesEx(mo, token)
+
+    def _ContinueRetrievePropertiesEx(self, mo, token):
+        state = self.properties.pop(token)
+        page, rest = state['objects'][:state['page_size']], state['objects'][state['page_size']:]
+        if rest:
+            token = 'token-%d' % next(self._counter)
+            self.properties[token] = dict(state, objects=rest)
+        else:
+            token = None
+        return vmodl.query.PropertyCollector.RetrieveResult(objects=page, token=token)
+
+    def _CancelRetrievePropertiesEx(self, mo, token):
+        self.properties.pop(token)
+
+    def _CreatePropertyCollector(self, mo):
+        collector = vmodl.query.PropertyCollector('session-collector-%d' % next(self._counter), self)
+        self.properties[collector._moId] = {'filter': [], 'seen': {}, 'present': set(), 'pending': [], 'version': 0}
+        return collector
+
+    def _CreateFilter(self, mo, spec, partialUpdates):
+        self.properties[mo._moId]['filter'].append(spec)
+        return vmodl.query.PropertyCollector.Filter('session-filter-%d' % next(self._counter), self)
+
+    def _WaitForUpdatesEx(self, mo, version, options):
+        """
+        Report the values which changed since the previous call. Entries of
+        ``timeline`` are run one per call before collecting, to change recorded
+        values while a caller is waiting. With ``maxObjectUpdates`` the updates
+        beyond it are reported by the next calls, as truncated update sets.
+        """
+        if self.timeline:
+            self.timeline.pop(0)()
+        if mo._moId not in self.properties:
+            raise vmodl.fault.ManagedObjectNotFound(obj=mo)
+        state = self.properties[mo._moId]
+        object_updates = state['pending'] or self._collect_updates(state, version)
+        limit = (options and options.maxObjectUpdates) or len(object_updates)
+        object_updates, state['pending'] = object_updates[:limit], object_updates[limit:]
+        if not object_updates:
+            return None
+        state['version'] += 1
+        return vmodl.query.PropertyCollector.UpdateSet(
+            version=str(state['version']),
+            filterSet=[vmodl.query.PropertyCollector.FilterUpdate(objectSet=object_updates)],
+            truncated=bool(state['pending']),
+        )
+
+    def _collect_updates(self, state, version):
+        object_updates = []
+        present = set()
+        for spec in state['filter']:
+            for object_content in self._collect(spec):
+                present.add(object_content.obj)
+                changes = []
+                for prop in object_content.propSet:
+                    key = (object_content.obj._moId, prop.name)
+                    if state['seen'].get(key, self) is not prop.val:
+                        state['seen'][key] = prop.val
+                        changes.append(vmodl.query.PropertyCollector.Change(name=prop.name, op='assign', val=prop.val))
+                if changes:
+                    object_updates.append(vmodl.query.PropertyCollector.ObjectUpdate(
+                        kind='modify' if version else 'enter', obj=object_content.obj, changeSet=changes))
+        for obj in state['present'] - present:
+            object_updates.append(vmodl.query.PropertyCollector.ObjectUpdate(kind='leave', obj=obj))
+        state['present'] = present
+        return object_updates
@@ -16,6 +16,7 @@ pyvmomi = pytest.importorskip('pyVmomi')
 from ansible_collections.community.vmware.plugins.module_utils.vmware import option_diff
 
 import ansible_collections.community.vmware.plugins.module_utils.vmware as vmware_module_utils
+from ansible_collections.community.vmware.tests.unit.mock.pyvmomi_stub import RecordingStub
 
 
 test_data = [
@@ -146,3 +147,325 @@ def test_required_params(request, params, msg, fake_ansible_module):
 ])
 def test_option_diff(test_options, test_current_options, test_truthy_strings_as_bool):
     assert option_diff(test_options, test_current_options, test_truthy_strings_as_bool)[0].value == test_options["data"]
+
+
+@pytest.fixture
+def recording_stub():
+    return RecordingStub()
+
+
+def test_find_vm_by_name_single_round_trip(recording_stub):
+    """ Name lookups read all names with one PropertyCollector call instead of one read per object """
+    for i in range(100):
+        recording_stub.add(pyvmomi.vim.VirtualMachine, 'vm-%d' % i, name='vm%d' % i)
+    content = recording_stub.service_content
+
+    vm = vmware_module_utils.find_vm_by_name(content, 'vm42')
+    assert vm._moId == 'vm-42'
+    # CreateContainerView, RetrieveContents and Destroy
+    assert recording_stub.round_trips == 3
+
+    recording_stub.reset()
+    vm = vmware_module_utils.find_vm_by_name(content, 'vm7')
+    assert vm._moId == 'vm-7'
+    # cached index, the hit is verified with a single name read
+    assert recording_stub.calls == [('vm-7', 'name')]
+
+
+def test_object_name_index_per_connection(recording_stub):
+    """ Each connection has its own indexes, kept on the connection """
+    other_stub = RecordingStub()
+    recording_stub.add(pyvmomi.vim.Datastore, 'datastore-1', name='ds1')
+    other_stub.add(pyvmomi.vim.Datastore, 'datastore-7', name='ds1')
+
+    assert vmware_module_utils.find_datastore_by_name(recording_stub.service_content, 'ds1')._moId == 'datastore-1'
+    assert vmware_module_utils.find_datastore_by_name(other_stub.service_content, 'ds1')._moId == 'datastore-7'
+    assert vmware_module_utils.ConnectionIndexes.of(other_stub.service_content) is other_stub._community_vmware_indexes
+    assert vmware_module_utils.ConnectionIndexes.of(recording_stub.service_content) is not other_stub._community_vmware_indexes
+
+
+def test_find_object_by_name_refreshes_on_miss(recording_stub):
+    recording_stub.add(pyvmomi.vim.Datastore, 'datastore-1', name='ds1')
+    content = recording_stub.service_content
+
+    assert vmware_module_utils.find_datastore_by_name(content, 'ds1')._moId == 'datastore-1'
+    recording_stub.add(pyvmomi.vim.Datastore, 'datastore-2', name='ds2')
+    assert vmware_module_utils.find_datastore_by_name(content, 'ds2')._moId == 'datastore-2'
+    assert vmware_module_utils.find_datastore_by_name(content, 'missing') is None
+    # the index rebuilt by the miss is not trusted by the next lookup
+    recording_stub.add(pyvmomi.vim.Datastore, 'datastore-3', name='ds3')
+    assert vmware_module_utils.find_datastore_by_name(content, 'ds3')._moId == 'datastore-3'
+    assert [obj._moId for obj in vmware_module_utils.find_all_objects_by_name(content, 'ds1', pyvmomi.vim.Datastore)] == ['datastore-1']
+    recording_stub.add(pyvmomi.vim.Datastore, 'datastore-4', name='ds4')
+    assert vmware_module_utils.find_datastore_by_name(content, 'ds4')._moId == 'datastore-4'
+    assert vmware_module_utils.get_all_objs(content, [pyvmomi.vim.Datastore]) == {
+        recording_stub.mo(pyvmomi.vim.Datastore, 'datastore-1'): 'ds1',
+        recording_stub.mo(pyvmomi.vim.Datastore, 'datastore-2'): 'ds2',
+        recording_stub.mo(pyvmomi.vim.Datastore, 'datastore-3'): 'ds3',
+        recording_stub.mo(pyvmomi.vim.Datastore, 'datastore-4'): 'ds4',
+    }
+
+
+def record_vm_inventory(stub, count):
+    """ Record a datacenter with one cluster, host, datastore and count powered on virtual machines """
+    vim = pyvmomi.vim
+    stub.add(vim.Datacenter, 'datacenter-1', name='DC0', parent=stub.service_content.rootFolder)
+    stub.add(vim.Folder, 'group-v1', name='vm', parent=stub.mo(vim.Datacenter, 'datacenter-1'))
+    stub.add(vim.ClusterComputeResource, 'domain-c1', name='C0')
+    stub.add(vim.HostSystem, 'host-1', parent=stub.mo(vim.ClusterComputeResource, 'domain-c1'),
+             summary=vim.host.Summary(config=vim.host.Summary.ConfigSummary(name='esxi1')))
+    stub.add(vim.Datastore, 'datastore-1', info=vim.host.VmfsDatastoreInfo(name='ds0'))
+    vms = []
+    for i in range(count):
+        nic = vim.vm.device.VirtualVmxnet3(
+            key=4000, macAddress='00:50:56:00:00:%02x' % i, addressType='assigned',
+            deviceInfo=vim.Description(label='Network adapter 1', summary='VM Network'),
+            backing=vim.vm.device.VirtualEthernetCard.NetworkBackingInfo(deviceName='VM Network'),
+        )
+        vms.append(stub.add(
+            vim.VirtualMachine, 'vm-%d' % i,
+            name='vm%d' % i,
+            parent=stub.mo(vim.Folder, 'group-v1'),
+            config=vim.vm.ConfigInfo(
+                name='vm%d' % i, uuid='uuid-%d' % i, instanceUuid='instance-uuid-%d' % i, template=False,
+                version='vmx-19', annotation='', guestId='otherGuest',
+                hardware=vim.vm.VirtualHardware(numCPU=2, numCoresPerSocket=1, memoryMB=1024, device=[nic]),
+                files=vim.vm.FileInfo(vmPathName='[ds0] vm%d/vm%d.vmx' % (i, i), logDirectory='[ds0] vm%d' % i),
+                extraConfig=[vim.option.OptionValue(key='RemoteDisplay.vnc.enabled', value='true')],
+            ),
+            summary=vim.vm.Summary(
+                runtime=vim.vm.RuntimeInfo(powerState='poweredOn', consolidationNeeded=False,
+                                           host=stub.mo(vim.HostSystem, 'host-1')),
+                guest=vim.vm.Summary.GuestSummary(guestFullName='Other', guestId='otherGuest'),
+                config=vim.vm.Summary.ConfigSummary(tpmPresent=False),
+                customValue=[],
+            ),
+            guest=vim.vm.GuestInfo(
+                toolsRunningStatus='guestToolsRunning', toolsVersion='12345', ipAddress='10.0.0.%d' % i,
+                net=[vim.vm.GuestInfo.NicInfo(deviceConfigId=4000, macAddress='00:50:56:00:00:%02x' % i,
+                                              ipAddress=['10.0.0.%d' % i])],
+            ),
+            layout=vim.vm.FileLayout(configFile=['vm%d.nvram' % i], logFile=['vmware.log'], disk=[], snapshot=[]),
+            datastore=[stub.mo(vim.Datastore, 'datastore-1')],
+        ))
+    return vms
+
+
+def test_gather_vm_facts(recording_stub):
+    vm = record_vm_inventory(recording_stub, 1)[0]
+    facts = vmware_module_utils.gather_vm_facts(recording_stub.service_content, vm)
+
+    assert facts['hw_name'] == 'vm0'
+    assert facts['hw_power_status'] == 'poweredOn'
+    assert facts['hw_processor_count'] == 2
+    assert facts['hw_esxi_host'] == 'esxi1'
+    assert facts['hw_cluster'] == 'C0'
+    assert facts['hw_datastores'] == ['ds0']
+    assert facts['hw_folder'] == '/DC0/vm'
+    assert facts['hw_files'] == ['[ds0] vm0/vm0.vmx', '[ds0] vm0/vm0.nvram', '[ds0] vm0/vmware.log']
+    assert facts['hw_interfaces'] == ['eth0']
+    assert facts['hw_eth0']['ipaddresses'] == ['10.0.0.0']
+    assert facts['ipv4'] == '10.0.0.0'
+    assert facts['vnc'] == {'enabled': 'true'}
+    assert facts['advanced_settings'] == {'RemoteDisplay.vnc.enabled': 'true'}
+    assert facts['snapshots'] == [] and facts['current_snapshot'] is None
+    assert facts['tpm_info'] == {'tpm_present': False, 'provider_id': None}
+
+
+@pytest.mark.parametrize('count', [10, 50])
+def test_gather_multiple_vm_facts_round_trips(count):
+    """ SOAP round trips do not grow with the number of virtual machines """
+    round_trips = []
+    for vm_count in (1, count):
+        stub = RecordingStub()
+        vms = record_vm_inventory(stub, vm_count)
+        stub.reset()
+        facts = vmware_module_utils.gather_multiple_vm_facts(stub.service_content, vms)
+
+        assert [f['hw_name'] for f in facts] == ['vm%d' % i for i in range(vm_count)]
+        # properties and folder paths are fetched in a constant number of calls
+        assert len([call for call in stub.calls if call[1] == 'RetrieveContents']) == 4
+        round_trips.append(stub.round_trips)
+
+    assert round_trips[0] == round_trips[1]
+
+
+def test_inventory_paths(recording_stub):
+    """ Paths are computed from one PropertyCollector pass over all containers """
+    vim = pyvmomi.vim
+    root = recording_stub.service_content.rootFolder
+    folder = recording_stub.add(vim.Folder, 'group-f1', name='F0', parent=root)
+    datacenter = recording_stub.add(vim.Datacenter, 'datacenter-1', name='DC0', parent=folder)
+    parent = recording_stub.add(vim.Folder, 'group-v1', name='vm', parent=datacenter)
+    for depth in range(6):
+        parent = recording_stub.add(vim.Folder, 'group-v%d' % (depth + 2), name='f%d' % depth, parent=parent)
+    vms = [recording_stub.add(vim.VirtualMachine, 'vm-%d' % i, name='vm%d' % i, parent=parent) for i in range(10)]
+    recording_stub.reset()
+
+    content = recording_stub.service_content
+    paths = [vmware_module_utils.PyVmomi.get_vm_path(content, vm) for vm in vms]
+    assert paths == ['/F0/DC0/vm/f0/f1/f2/f3/f4/f5'] * 10
+    # one view, one RetrieveContents, one Destroy and a parent read per VM
+    assert recording_stub.round_trips == 3 + len(vms)
+
+    assert vmware_module_utils.compile_folder_path_for_object(datacenter, content=content) == '/F0'
+    assert vmware_module_utils.compile_folder_path_for_object(datacenter) == '/F0'
+
+
+def test_inventory_paths_long_lived_connection(recording_stub):
+    """ Containers created after the index was built are found by later lookups over the same connection """
+    vim = pyvmomi.vim
+    content = recording_stub.service_content
+    datacenter = recording_stub.add(vim.Datacenter, 'datacenter-1', name='DC0', parent=content.rootFolder)
+    vm_folder = recording_stub.add(vim.Folder, 'group-v1', name='vm', parent=datacenter)
+    vm = recording_stub.add(vim.VirtualMachine, 'vm-1', name='vm1', parent=vm_folder)
+    assert vmware_module_utils.PyVmomi.get_vm_path(content, vm) == '/DC0/vm'
+
+    for i in range(2):
+        folder = recording_stub.add(vim.Folder, 'group-v%d' % (i + 2), name='new%d' % i, parent=vm_folder)
+        recording_stub.properties['vm-1']['parent'] = folder
+        assert vmware_module_utils.PyVmomi.get_vm_path(content, vm) == '/DC0/vm/new%d' % i
+
+    index = vmware_module_utils.InventoryPathIndex.get(content)
+    assert recording_stub._community_vmware_indexes.inventory_paths is index
+    assert vmware_module_utils.InventoryPathIndex.get(RecordingStub().service_content) is not index
+
+
+def test_to_json_properties(recording_stub):
+    """ Requested properties are retrieved with one PropertyCollector call, as deep as the property collector allows """
+    vm = record_vm_inventory(recording_stub, 1)[0]
+    pyv = vmware_module_utils.PyVmomi.__new__(vmware_module_utils.PyVmomi)
+    pyv.content = recording_stub.service_content
+    pyv.module = mock.Mock()
+    recording_stub.reset()
+
+    result = pyv.to_json(vm, ['config.hardware.memoryMB', 'name', 'config.hardware.device.backing.deviceName', '_moId'])
+    assert not pyv.module.fail_json.called
+    assert result == {
+        'config': {'hardware': {'memoryMB': 1024, 'device': {'backing': [{'deviceName': 'VM Network'}]}}},
+        'name': 'vm0',
+        '_moId': 'vm-0',
+        'moid': 'vm-0',
+    }
+    assert recording_stub.calls == [('propertyCollector', 'RetrieveContents')]
+
+    runtime = pyv.to_json(vm, ['summary.runtime'])['summary']['runtime']
+    assert runtime['_vimtype'] == 'vim.vm.RuntimeInfo'
+    assert runtime['host'] == 'vim.HostSystem:host-1'
+    assert runtime['powerState'] == 'poweredOn'
+
+    pyv.to_json(vm, ['config.hardware.memoryMB.nosuch'])
+    pyv.module.fail_json.assert_called_with(msg="Property 'config.hardware.memoryMB.nosuch' not found.")
+
+
+def test_iter_objects_properties_pages(recording_stub):
+    """ Results are fetched page by page and the view is destroyed once done """
+    for i in range(5):
+        recording_stub.add(pyvmomi.vim.Datastore, 'datastore-%d' % i, name='ds%d' % i)
+    content = recording_stub.service_content
+
+    object_contents = vmware_module_utils.iter_objects_properties(content, [pyvmomi.vim.Datastore], ['name'], page_size=2)
+    assert [object_content.propSet[0].val for object_content in object_contents] == ['ds%d' % i for i in range(5)]
+    assert [call[1] for call in recording_stub.calls] == [
+        'CreateContainerView', 'RetrievePropertiesEx', 'ContinueRetrievePropertiesEx', 'ContinueRetrievePropertiesEx', 'Destroy',
+    ]
+
+    recording_stub.reset()
+    object_contents = vmware_module_utils.iter_objects_properties(content, [pyvmomi.vim.Datastore], ['name'], page_size=2)
+    next(object_contents)
+    object_contents.close()
+    assert [call[1] for call in recording_stub.calls] == [
+        'CreateContainerView', 'RetrievePropertiesEx', 'CancelRetrievePropertiesEx', 'Destroy',
+    ]
+
+
+def test_iter_objects_properties_continue_fails(recording_stub, monkeypatch):
+    """ A result set whose Continue call failed is not cancelled """
+    for i in range(5):
+        recording_stub.add(pyvmomi.vim.Datastore, 'datastore-%d' % i, name='ds%d' % i)
+    content = recording_stub.service_content
+
+    continue_retrieve = recording_stub._ContinueRetrievePropertiesEx
+
+    def expired(mo, token):
+        # the first page of RetrievePropertiesEx is served through the same method
+        if recording_stub.calls[-1][1] == 'ContinueRetrievePropertiesEx':
+            raise pyvmomi.vmodl.fault.InvalidArgument(invalidProperty='token')
+        return continue_retrieve(mo, token)
+
+    monkeypatch.setattr(recording_stub, '_ContinueRetrievePropertiesEx', expired)
+    with pytest.raises(pyvmomi.vmodl.fault.InvalidArgument):
+        list(vmware_module_utils.iter_objects_properties(content, [pyvmomi.vim.Datastore], ['name'], page_size=2))
+    assert [call[1] for call in recording_stub.calls] == [
+        'CreateContainerView', 'RetrievePropertiesEx', 'ContinueRetrievePropertiesEx', 'Destroy',
+    ]
+
+
+def test_wait_for_tasks(recording_stub):
+    """ Tasks are followed through WaitForUpdatesEx and reported as soon as they end """
+    vim = pyvmomi.vim
+    running = vim.TaskInfo(key='task-1', state='running')
+    task1 = recording_stub.add(vim.Task, 'task-1', info=running)
+    task2 = recording_stub.add(vim.Task, 'task-2', info=vim.TaskInfo(key='task-2', state='queued'))
+
+    def finish_task1():
+        recording_stub.properties['task-1']['info'] = vim.TaskInfo(key='task-1', state='success', result='done')
+
+    def fail_task2():
+        recording_stub.properties['task-2']['info'] = vim.TaskInfo(key='task-2', state='error', error=pyvmomi.vmodl.MethodFault(msg='boom'))
+
+    recording_stub.timeline = [lambda: None, finish_task1, fail_task2]
+    task_infos = vmware_module_utils.wait_for_tasks([task1, task2])
+
+    assert [info.state for info in task_infos] == ['success', 'error']
+    assert len([call for call in recording_stub.calls if call[1] == 'WaitForUpdatesEx']) == 3
+    # neither task.info nor the task state was polled
+    assert not [call for call in recording_stub.calls if call[1] == 'info']
+
+    assert vmware_module_utils.wait_for_task(task1) == (True, 'done')
+    with pytest.raises(vmware_module_utils.TaskError, match='boom'):
+        vmware_module_utils.wait_for_task(task2)
+
+
+def test_wait_for_task_question(recording_stub):
+    vim = pyvmomi.vim
+    task = recording_stub.add(vim.Task, 'task-1', info=vim.TaskInfo(key='task-1', state='running'))
+    vm = recording_stub.add(vim.VirtualMachine, 'vm-1', runtime=vim.vm.RuntimeInfo(
+        question=vim.vm.QuestionInfo(id='q1', text='Did you move or copy it?')))
+
+    with pytest.raises(vmware_module_utils.TaskError, match='move or copy'):
+        vmware_module_utils.wait_for_task(task, vm=vm)
+
+
+def test_session_cache(monkeypatch, tmp_path):
+    """ Sessions are stored per host, credentials and port and only reused while alive and within the TTL """
+    monkeypatch.setenv('VMWARE_SESSION_CACHE', str(tmp_path))
+    monkeypatch.setenv('VMWARE_SESSION_CACHE_TTL', '60')
+    session_cache = vmware_module_utils.SessionCache.from_env()
+    assert session_cache.ttl == 60
+
+    logins = []
+
+    def login():
+        service_instance = mock.Mock()
+        service_instance._stub.cookie = 'vmware_soap_session="%d"' % len(logins)
+        service_instance._stub.version = 'vim.version.v8_0_3_0'
+        logins.append(service_instance)
+        return service_instance
+
+    resumed = mock.Mock()
+    monkeypatch.setattr(session_cache, '_resume', lambda session, *args: resumed if session['cookie'] == 'vmware_soap_session="0"' else None)
+
+    assert session_cache.get_service_instance('vcenter', 'admin', 'secret', 443, login, None) is logins[0]
+    assert session_cache.get_service_instance('vcenter', 'admin', 'secret', 443, login, None) is resumed
+    assert len(logins) == 1
+
+    # a wrong password logs in instead of resuming the session of the right one
+    assert session_cache.get_service_instance('vcenter', 'admin', 'wrong', 443, login, None) is logins[1]
+
+    # another user gets its own session
+    assert session_cache.get_service_instance('vcenter', 'other', 'secret', 443, login, None) is logins[2]
+
+    # expired sessions are not reused
+    monkeypatch.setattr(vmware_module_utils.time, 'time', lambda: 10 ** 10)
+    assert session_cache.get_service_instance('vcenter', 'admin', 'secret', 443, login, None) is logins[3]
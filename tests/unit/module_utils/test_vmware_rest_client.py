@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from unittest import mock
+
+import ansible_collections.community.vmware.plugins.module_utils.vmware_rest_client as vmware_rest_client
+
+
+class FakeService(object):
+    """ Tagging service serving recorded objects and counting get calls """
+
+    def __init__(self, prefix, names):
+        self.objects = dict(
+            ('urn:%s:%d' % (prefix, i), mock.Mock(id='urn:%s:%d' % (prefix, i), category_id='urn:category:0', description=''))
+            for i in range(len(names))
+        )
+        for obj, name in zip(self.objects.values(), names):
+            obj.name = name
+        self.gets = []
+
+    def list(self):
+        return list(self.objects)
+
+    def list_tags_for_category(self, category_id):
+        return list(self.objects)
+
+    def get(self, obj_id):
+        self.gets.append(obj_id)
+        return self.objects[obj_id]
+
+
+def make_client(tags, categories, params=None):
+    client = vmware_rest_client.VmwareRestClient.__new__(vmware_rest_client.VmwareRestClient)
+    client.module = mock.Mock()
+    client.params = params or dict(hostname='vcenter', username='admin', port=443)
+    client.api_client = mock.Mock()
+    client.api_client.tagging.Tag = tags
+    client.api_client.tagging.Category = categories
+    client.api_client.tagging.TagAssociation.list_attached_tags.return_value = list(tags.objects)[:3]
+    return client
+
+
+def test_tags_fetched_once_per_connection(monkeypatch):
+    """ Every tag and category is fetched at most once, whatever the number of lookups """
+    monkeypatch.delenv('VMWARE_REST_INDEX_CACHE', raising=False)
+    tags = FakeService('tag', ['tag%d' % i for i in range(100)])
+    categories = FakeService('category', ['category0'])
+    client = make_client(tags, categories)
+
+    assert client.get_tag_by_name('tag50').name == 'tag50'
+    assert len(tags.gets) == 51
+    assert client.get_tag_by_category_name('tag10', 'category0').name == 'tag10'
+    assert client.get_tag_by_name('missing') is None
+    assert len(tags.gets) == 100
+
+    assert [tag['category_name'] for tag in client.get_tags_for_dynamic_obj(dobj='vm-1')] == ['category0'] * 3
+    assert [tag['category_name'] for tag in client.get_tags_for_dynamic_obj(dobj='vm-2')] == ['category0'] * 3
+    assert len(tags.gets) == 100
+    assert len(categories.gets) == 1
+
+
+def test_tag_names_cached_on_disk(monkeypatch, tmp_path):
+    """ Names kept on disk let a new connection fetch the matching tag only """
+    monkeypatch.setenv('VMWARE_REST_INDEX_CACHE', str(tmp_path))
+    monkeypatch.setenv('VMWARE_REST_INDEX_CACHE_TTL', '60')
+    tags = FakeService('tag', ['tag%d' % i for i in range(100)])
+    categories = FakeService('category', ['category0'])
+
+    make_client(tags, categories).get_tag_by_name('tag99')
+    tags.gets = []
+    assert make_client(tags, categories).get_tag_by_name('tag42').name == 'tag42'
+    assert tags.gets == ['urn:tag:42']
+
+    # a cached name is confirmed against the object, a miss fetches all the others
+    tags.objects['urn:tag:42'].name = 'renamed'
+    tags.gets = []
+    assert make_client(tags, categories).get_tag_by_name('tag42') is None
+    assert tags.gets == ['urn:tag:42'] + ['urn:tag:%d' % i for i in range(100) if i != 42]
+
+    # an object renamed to the requested name is found
+    tags.objects['urn:tag:7'].name = 'tag42'
+    tags.gets = []
+    assert make_client(tags, categories).get_tag_by_name('tag42').id == 'urn:tag:7'
+    assert tags.gets == ['urn:tag:%d' % i for i in range(8)]
+    tags.objects['urn:tag:7'].name = 'tag7'
+    tags.objects['urn:tag:42'].name = 'tag42'
+
+    # another user has its own index
+    tags.gets = []
+    make_client(tags, categories, dict(hostname='vcenter', username='other', port=443)).get_tag_by_name('tag7')
+    assert len(tags.gets) == 8
+
+    # expired names are not used
+    monkeypatch.setattr(vmware_rest_client.time, 'time', lambda: 10 ** 10)
+    tags.gets = []
+    assert make_client(tags, categories).get_tag_by_name('tag42').name == 'tag42'
+    assert tags.gets == ['urn:tag:%d' % i for i in range(43)]
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import tarfile
+
+from unittest import mock
+
+import pytest
+
+from ansible_collections.community.vmware.plugins.modules import vmware_export_ovf
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+    pass
+
+
+def fail_json(*args, **kwargs):
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+def make_export(tmp_path):
+    ovf_dir = tmp_path / 'test-vm'
+    ovf_dir.mkdir()
+    files = []
+    for name in ('test-vm.ovf', 'test-vm.mf', 'test-vm-disk-0.vmdk'):
+        (ovf_dir / name).write_bytes(b'content of ' + name.encode())
+        files.append(str(ovf_dir / name))
+    export = vmware_export_ovf.VMwareExportVmOvf.__new__(vmware_export_ovf.VMwareExportVmOvf)
+    export.module = mock.Mock()
+    export.module.fail_json.side_effect = fail_json
+    export.params = dict(export_dir=str(tmp_path))
+    export.ovf_dir = str(ovf_dir)
+    export.facts = dict(ovf_file=files[0], manifest=files[1], device_files=files[2:])
+    vm_obj = mock.Mock()
+    vm_obj.name = 'test-vm'
+    return export, vm_obj
+
+
+def test_pack_ova_large_disk(tmp_path):
+    """ A disk larger than the 8 GiB ustar limit is packed after the descriptor and the manifest """
+    export, vm_obj = make_export(tmp_path)
+    gettarinfo = tarfile.TarFile.gettarinfo
+    copyfileobj = tarfile.copyfileobj
+
+    def large_tarinfo(tar, name=None, arcname=None, fileobj=None):
+        tarinfo = gettarinfo(tar, name, arcname, fileobj)
+        if name.endswith('.vmdk'):
+            tarinfo.size = 9 * 2 ** 30
+        return tarinfo
+
+    def skip_large_data(src, dst, length=None, *args, **kwargs):
+        # only the header of the disk is written, not its 9 GiB of data
+        if length != 9 * 2 ** 30:
+            copyfileobj(src, dst, length, *args, **kwargs)
+
+    with mock.patch.object(tarfile.TarFile, 'gettarinfo', large_tarinfo), \
+            mock.patch.object(tarfile, 'copyfileobj', skip_large_data):
+        export.pack_ova(vm_obj)
+
+    ova_file = str(tmp_path / 'test-vm.ova')
+    assert export.facts == dict(ova_file=ova_file)
+    assert not (tmp_path / 'test-vm').exists()
+    with tarfile.open(ova_file) as tar:
+        members = [tar.next() for dummy in range(3)]
+    assert [member.name for member in members] == ['test-vm.ovf', 'test-vm.mf', 'test-vm-disk-0.vmdk']
+    assert members[2].size == 9 * 2 ** 30
+
+
+def test_pack_ova_failure_removes_partial_file(tmp_path):
+    """ A failure while packing leaves no truncated OVA behind and keeps the exported files """
+    export, vm_obj = make_export(tmp_path)
+
+    with mock.patch.object(tarfile.TarFile, 'addfile', side_effect=ValueError('header too large')):
+        with pytest.raises(AnsibleFailJson) as exc:
+            export.pack_ova(vm_obj)
+
+    assert 'header too large' in exc.value.args[0]['msg']
+    assert not (tmp_path / 'test-vm.ova').exists()
+    assert len(list((tmp_path / 'test-vm').iterdir())) == 3
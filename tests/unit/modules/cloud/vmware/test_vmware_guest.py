@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+import threading
+import time
+
+from contextlib import ExitStack
+from unittest import mock
+
+import pytest
+
+from ansible_collections.community.vmware.plugins.module_utils import vmware as vmware_module_utils
+from ansible_collections.community.vmware.plugins.modules import vmware_guest
+from ansible_collections.community.vmware.tests.unit.mock.pyvmomi_stub import RecordingStub
+from ansible_collections.community.vmware.tests.unit.modules.utils import patch_module_args
+
+
+class FakeHelper(object):
+    """ PyVmomiHelper stand-in, no connection is made """
+
+    def __init__(self, module):
+        self.module = module
+        self.params = module.params
+
+    def for_batch_vm(self, module):
+        return FakeHelper(module)
+
+
+class FakeEnsureVmState(object):
+    """ ensure_vm_state stand-in recording the parameters of every virtual machine """
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.params = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, pyv, module):
+        time.sleep(self.delays.get(module.params['name'], 0))
+        with self.lock:
+            self.params[module.params['name']] = module.params
+        if module.params['name'].startswith('bad'):
+            module.fail_json(msg='Failed to create a virtual machine : %s' % module.params['name'])
+        customization = module.params['customization'] or {}
+        return {'changed': True, 'failed': False,
+                'instance': {'hw_name': module.params['name'], 'password': customization.get('password')}}
+
+
+def run_module(capsys, args, ensure_vm_state=None, stub=None):
+    """
+    Run the module with the given arguments. ensure_vm_state replaces the helper and the state handling,
+    otherwise the real ones run against the inventory of stub.
+    """
+    module_args = dict(hostname='vcenter', username='admin', password='secret', validate_certs=False)
+    module_args.update(args)
+    with ExitStack() as stack:
+        stack.enter_context(patch_module_args(module_args))
+        if ensure_vm_state is not None:
+            stack.enter_context(mock.patch.object(vmware_guest, 'PyVmomiHelper', FakeHelper))
+            stack.enter_context(mock.patch.object(vmware_guest, 'ensure_vm_state', ensure_vm_state))
+        else:
+            stack.enter_context(mock.patch.object(vmware_module_utils.PyVmomi, 'connect_to_api',
+                                                  return_value=(mock.Mock(), stub.service_content)))
+        with pytest.raises(SystemExit):
+            vmware_guest.main()
+    return json.loads(capsys.readouterr().out)
+
+
+def test_batch_item_options(capsys):
+    """ Item options override the module options, options not set in an item are inherited """
+    ensure_vm_state = FakeEnsureVmState()
+    result = run_module(capsys, dict(
+        template='template_el9',
+        folder='/DC1/vm',
+        hardware=dict(num_cpus=2, memory_mb=1024),
+        batch=[
+            dict(name='lab-01'),
+            dict(name='lab-02', template='template_el8', state='poweredon', hardware=dict(memory_mb=8192)),
+        ],
+    ), ensure_vm_state)
+
+    assert not result.get('failed')
+    assert result['changed']
+    first, second = ensure_vm_state.params['lab-01'], ensure_vm_state.params['lab-02']
+    assert (first['template'], first['folder'], first['state']) == ('template_el9', '/DC1/vm', 'present')
+    assert (first['hardware']['num_cpus'], first['hardware']['memory_mb']) == (2, 1024)
+    assert (second['template'], second['folder'], second['state']) == ('template_el8', '/DC1/vm', 'poweredon')
+    # a dict option set in an item replaces the module option as a whole
+    assert (second['hardware']['num_cpus'], second['hardware']['memory_mb']) == (None, 8192)
+
+
+@pytest.mark.parametrize('args, msg', [
+    (dict(batch=[dict(name='lab-01'), dict(name='lab-02', hostname='other')]),
+     'Connection options can not be set in batch item 1: hostname'),
+    (dict(cluster='Cluster1', batch=[dict(name='lab-01', esxi_hostname='esxi01')]),
+     'Parameters are mutually exclusive in batch item 0: cluster|esxi_hostname'),
+    (dict(batch=[dict(name='lab-01'), dict(template='template_el9')]),
+     'One of name or uuid is required in batch item 1'),
+])
+def test_batch_item_validation(capsys, args, msg):
+    """ Invalid items fail the module before any virtual machine is managed """
+    ensure_vm_state = FakeEnsureVmState()
+    result = run_module(capsys, args, ensure_vm_state)
+
+    assert result['failed']
+    assert result['msg'] == msg
+    assert ensure_vm_state.params == {}
+
+
+def test_batch_item_failure(capsys):
+    """ A failing item fails only that item, results come in batch order and the module reports the failures """
+    # the first item ends last
+    ensure_vm_state = FakeEnsureVmState(delays={'lab-01': 0.2})
+    result = run_module(capsys, dict(
+        parallel_deployments=3,
+        batch=[dict(name='lab-01'), dict(name='bad-02'), dict(name='lab-03')],
+    ), ensure_vm_state)
+
+    assert result['failed']
+    assert result['msg'] == 'Failed to manage 1 of 3 virtual machines'
+    assert result['changed']
+    assert [vm['name'] for vm in result['results']] == ['lab-01', 'bad-02', 'lab-03']
+    assert [vm['failed'] for vm in result['results']] == [False, True, False]
+    assert result['results'][1]['msg'] == 'Failed to create a virtual machine : bad-02'
+    assert result['results'][2]['instance']['hw_name'] == 'lab-03'
+
+
+def test_batch_item_no_log(capsys):
+    """ no_log values set in items are masked in the module output """
+    result = run_module(capsys, dict(
+        batch=[dict(name='lab-01', customization=dict(password='item-password'))],
+    ), FakeEnsureVmState())
+
+    assert result['results'][0]['instance']['password'] == 'VALUE_SPECIFIED_IN_NO_LOG_PARAMETER'
+    assert 'item-password' not in json.dumps(result)
+
+
+def test_batch_real_helper(capsys):
+    """ The items of a batch are managed by their own helpers over the shared connection """
+    stub = RecordingStub()
+    stub.add(vmware_guest.vim.VirtualMachine, 'vm-1', name='lab-01',
+             summary=vmware_guest.vim.vm.Summary(runtime=vmware_guest.vim.vm.RuntimeInfo(powerState='poweredOn')))
+    stub.add(vmware_guest.vim.VirtualMachine, 'vm-2', name='lab-02',
+             summary=vmware_guest.vim.vm.Summary(runtime=vmware_guest.vim.vm.RuntimeInfo(powerState='poweredOff')))
+    result = run_module(capsys, dict(
+        _ansible_check_mode=True,
+        parallel_deployments=4,
+        state='poweredoff',
+        batch=[
+            dict(name='lab-01'),
+            dict(name='lab-02', state='absent'),
+            dict(name='lab-03'),
+            dict(name='lab-04', hardware=dict(virt_based_security=True)),
+        ],
+    ), stub=stub)
+
+    assert result['failed']
+    assert result['msg'] == 'Failed to manage 1 of 4 virtual machines'
+    first, second, third, fourth = result['results']
+    assert (first['desired_operation'], first['current_powerstate'], first['changed']) == ('set_vm_power_state', 'poweredon', True)
+    assert (second['desired_operation'], second['current_powerstate'], second['changed']) == ('remove_vm', 'poweredoff', True)
+    assert (third['desired_operation'], third['changed']) == ('deploy_vm', True)
+    assert fourth['failed']
+    assert fourth['msg'] == 'Virtualization based security requires nested virtualization. Please enable nested_virt.'
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import hashlib
+import io
+import os
+
+from unittest import mock
+
+import pytest
+
+pyvmomi = pytest.importorskip('pyVmomi')
+
+from ansible_collections.community.vmware.plugins.modules import vmware_guest_file_operation
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+    pass
+
+
+def fail_json(*args, **kwargs):
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class Response(object):
+    """ requests response streaming data in the requested chunk sizes, optionally failing after some chunks """
+
+    def __init__(self, data=b'', fail_after=None):
+        self.data = data
+        self.fail_after = fail_after
+        self.status_code = 200
+        self.reason = 'OK'
+        self.text = ''
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        for count, offset in enumerate(range(0, len(self.data), chunk_size)):
+            if count == self.fail_after:
+                raise IOError('connection reset by peer')
+            yield self.data[offset:offset + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class Session(object):
+    """ requests session serving the guest files of a dict and recording the uploaded ones """
+
+    def __init__(self, guest_files=None, fail_after=None):
+        self.guest_files = guest_files or {}
+        self.fail_after = fail_after
+        self.uploads = {}
+
+    def get(self, url, stream, timeout):
+        return Response(self.guest_files[url.split('/guestFile')[1]], self.fail_after)
+
+    def put(self, url, data, timeout):
+        chunks = []
+        chunk = data.read(8192)
+        while chunk:
+            chunks.append(chunk)
+            chunk = data.read(8192)
+        self.uploads[url.split('/guestFile')[1]] = b''.join(chunks)
+        return Response()
+
+
+def make_file_manager(session):
+    manager = vmware_guest_file_operation.VmwareGuestFileManager.__new__(vmware_guest_file_operation.VmwareGuestFileManager)
+    manager.module = mock.Mock(params=dict(hostname='esxi01', port=443))
+    manager.module.fail_json.side_effect = fail_json
+    manager.module.atomic_move.side_effect = os.rename
+    manager.vm = mock.Mock()
+    manager.timeout = 100
+    manager.chunk_size = 4
+    manager._session = session
+    return manager
+
+
+def guest_file_manager(listings=None):
+    """ Guest file manager handing out transfer URLs and listing the given directories """
+    file_manager = mock.Mock()
+    file_manager.InitiateFileTransferFromGuest.side_effect = lambda vm, auth, guestFilePath: (
+        pyvmomi.vim.vm.guest.FileManager.FileTransferInformation(url='https://*:443/guestFile%s' % guestFilePath))
+    file_manager.InitiateFileTransferToGuest.side_effect = lambda vm, auth, guestFilePath, **kwargs: (
+        'https://*:443/guestFile%s' % guestFilePath)
+
+    def list_files(vm, auth, filePath, index):
+        files = [pyvmomi.vim.vm.guest.FileManager.FileInfo(path=path, type=file_type) for path, file_type in listings[filePath]]
+        # two entries per call
+        return pyvmomi.vim.vm.guest.FileManager.ListFileInfo(files=files[index:index + 2], remaining=max(0, len(files) - index - 2))
+
+    file_manager.ListFilesInGuest.side_effect = list_files
+    return file_manager
+
+
+def test_chunk_reader():
+    """ The reader hands out bounded chunks whatever the requested size and hashes them """
+    reader = vmware_guest_file_operation.ChunkReader(io.BytesIO(b'0123456789'), 10, 4, 'sha256')
+
+    assert len(reader) == 10
+    assert [reader.read(), reader.read(8192), reader.read(), reader.read()] == [b'0123', b'4567', b'89', b'']
+    assert reader.hexdigest() == hashlib.sha256(b'0123456789').hexdigest()
+    assert vmware_guest_file_operation.ChunkReader(io.BytesIO(b''), 0, 4).hexdigest() is None
+
+
+def test_fetch_file(tmp_path):
+    """ The guest file is streamed to a temporary file moved to dest once complete """
+    manager = make_file_manager(Session({'/tmp/data.bin': b'0123456789'}))
+    dest = str(tmp_path / 'data.bin')
+
+    digest = manager._fetch_file(guest_file_manager(), None, '/tmp/data.bin', dest, 'sha256',
+                                 hashlib.sha256(b'0123456789').hexdigest())
+
+    assert digest == hashlib.sha256(b'0123456789').hexdigest()
+    with open(dest, 'rb') as f:
+        assert f.read() == b'0123456789'
+    assert os.path.dirname(manager.module.atomic_move.call_args[0][0]) == str(tmp_path)
+    assert os.listdir(str(tmp_path)) == ['data.bin']
+
+
+@pytest.mark.parametrize('fail_after, checksum, msg', [
+    (1, None, 'connection reset by peer'),
+    (None, 'sha256:0000', 'The checksum of the fetched file /tmp/data.bin does not match'),
+])
+def test_fetch_file_failure(tmp_path, fail_after, checksum, msg):
+    """ A failed or corrupted transfer leaves dest alone and no temporary file behind """
+    manager = make_file_manager(Session({'/tmp/data.bin': b'0123456789'}, fail_after=fail_after))
+    (tmp_path / 'data.bin').write_bytes(b'previous')
+    algorithm, value = checksum.split(':') if checksum else (None, None)
+
+    with pytest.raises((IOError, AnsibleFailJson)) as e:
+        manager._fetch_file(guest_file_manager(), None, '/tmp/data.bin', str(tmp_path / 'data.bin'), algorithm, value)
+
+    assert msg in str(e.value)
+    manager.module.atomic_move.assert_not_called()
+    assert os.listdir(str(tmp_path)) == ['data.bin']
+    assert (tmp_path / 'data.bin').read_bytes() == b'previous'
+
+
+def test_fetch_directory(tmp_path):
+    """ Directories are walked breadth first, symbolic links are skipped """
+    session = Session({'/opt/app/a.txt': b'a', '/opt/app/b.txt': b'bb', '/opt/app/lib/c.bin': b'ccc'})
+    manager = make_file_manager(session)
+    file_manager = guest_file_manager({
+        '/opt/app': [('.', 'directory'), ('..', 'directory'), ('a.txt', 'file'), ('lib', 'directory'),
+                     ('b.txt', 'file'), ('link', 'symlink')],
+        '/opt/app/lib': [('c.bin', 'file')],
+    })
+    dest = str(tmp_path / 'app')
+
+    fetched = manager._fetch_directory(file_manager, None, '/opt/app', dest)
+
+    assert fetched == [os.path.join(dest, 'a.txt'), os.path.join(dest, 'b.txt'), os.path.join(dest, 'lib', 'c.bin')]
+    assert (tmp_path / 'app' / 'lib' / 'c.bin').read_bytes() == b'ccc'
+    assert sorted(os.listdir(dest)) == ['a.txt', 'b.txt', 'lib']
+
+
+def test_copy_directory(tmp_path):
+    """ Local directories are recreated in the guest, existing guest files are skipped """
+    (tmp_path / 'lib').mkdir()
+    (tmp_path / 'a.txt').write_bytes(b'a')
+    (tmp_path / 'b.txt').write_bytes(b'bb')
+    (tmp_path / 'lib' / 'c.bin').write_bytes(b'0123456789')
+    session = Session()
+    manager = make_file_manager(session)
+    file_manager = guest_file_manager()
+    initiate = file_manager.InitiateFileTransferToGuest.side_effect
+
+    def already_exists(vm, auth, guestFilePath, **kwargs):
+        if guestFilePath == '/opt/app/b.txt':
+            raise pyvmomi.vim.fault.FileAlreadyExists()
+        return initiate(vm, auth, guestFilePath, **kwargs)
+
+    file_manager.InitiateFileTransferToGuest.side_effect = already_exists
+    copied = manager._copy_directory(file_manager, None, str(tmp_path).encode(), '/opt/app', False)
+
+    assert copied == ['/opt/app/a.txt', '/opt/app/lib/c.bin']
+    assert session.uploads == {'/opt/app/a.txt': b'a', '/opt/app/lib/c.bin': b'0123456789'}
+    assert [call[1]['directoryPath'] for call in file_manager.MakeDirectoryInGuest.call_args_list] == ['/opt/app', '/opt/app/lib']
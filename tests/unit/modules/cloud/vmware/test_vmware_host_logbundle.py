@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import io
+import os
+
+from unittest import mock
+
+import pytest
+
+from ansible_collections.community.vmware.plugins.modules import vmware_host_logbundle
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+    pass
+
+
+def fail_json(*args, **kwargs):
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class Response(object):
+    """ HTTP response returning data in the requested sizes, optionally failing after some reads """
+
+    def __init__(self, data, fail_after=None):
+        self.data = io.BytesIO(data)
+        self.reads = []
+        self.fail_after = fail_after
+
+    def read(self, size):
+        if self.fail_after is not None and len(self.reads) == self.fail_after:
+            raise IOError('connection reset by peer')
+        self.reads.append(size)
+        return self.data.read(size)
+
+
+def make_logbundle(tmp_path, responses, cluster_name=None):
+    logbundle = vmware_host_logbundle.VMwareHostLogbundle.__new__(vmware_host_logbundle.VMwareHostLogbundle)
+    logbundle.module = mock.Mock()
+    logbundle.module.fail_json.side_effect = fail_json
+    logbundle.module.atomic_move.side_effect = os.rename
+    logbundle.params = dict(parallel_downloads=2)
+    logbundle.content = mock.Mock()
+    logbundle.esxi_hostname = None if cluster_name else 'esxi01'
+    logbundle.cluster_name = cluster_name
+    logbundle.dest = str(tmp_path) if cluster_name else str(tmp_path / 'esxi-log.tgz')
+    logbundle.manifests = ['System:Base']
+    logbundle.performance_data = None
+    logbundle.download_timeout = None
+    logbundle.chunk_size = 4
+    logbundle.validate_manifests = mock.Mock()
+    logbundle.generate_req_headers = mock.Mock(return_value={})
+
+    def fetch_url(module, method, headers, url, timeout=None):
+        return responses[url.split('/')[2]], dict(status=200)
+
+    return logbundle, mock.patch.object(vmware_host_logbundle, 'fetch_url', side_effect=fetch_url)
+
+
+def test_download_logbundle_chunks(tmp_path):
+    """ The logbundle is streamed chunk by chunk to a temporary file moved to dest once complete """
+    response = Response(b'0123456789')
+    logbundle, fetch_url = make_logbundle(tmp_path, dict(esxi01=response))
+    dest = str(tmp_path / 'esxi-log.tgz')
+    with fetch_url:
+        assert logbundle.download_logbundle('esxi01', dest) == 10
+
+    # three chunks and the end of the stream
+    assert response.reads == [4, 4, 4, 4]
+    with open(dest, 'rb') as f:
+        assert f.read() == b'0123456789'
+    tmp_dest = logbundle.module.atomic_move.call_args[0][0]
+    assert os.path.dirname(tmp_dest) == str(tmp_path)
+    assert os.listdir(str(tmp_path)) == ['esxi-log.tgz']
+
+
+def test_download_logbundle_failure(tmp_path):
+    """ A failed download removes the temporary file and leaves dest alone """
+    logbundle, fetch_url = make_logbundle(tmp_path, dict(esxi01=Response(b'0123456789', fail_after=2)))
+    dest = str(tmp_path / 'esxi-log.tgz')
+    with fetch_url:
+        with pytest.raises(vmware_host_logbundle.LogbundleError, match='connection reset by peer'):
+            logbundle.download_logbundle('esxi01', dest)
+
+    logbundle.module.atomic_move.assert_not_called()
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_get_cluster_logbundles_errors(tmp_path):
+    """ Failed hosts are reported together, along with the logbundles of the other hosts """
+    hosts = []
+    for esxi_hostname in ('esxi01', 'esxi02', 'esxi03'):
+        host = mock.Mock()
+        host.name = esxi_hostname
+        hosts.append(host)
+    responses = dict(
+        esxi01=Response(b'0123456789'),
+        esxi02=Response(b'0123456789', fail_after=1),
+        esxi03=Response(b'01234'),
+    )
+    logbundle, fetch_url = make_logbundle(tmp_path, responses, cluster_name='Cluster1')
+    with fetch_url, mock.patch.object(vmware_host_logbundle, 'find_cluster_by_name', return_value=mock.Mock(host=hosts)):
+        with pytest.raises(AnsibleFailJson) as e:
+            logbundle.get_cluster_logbundles()
+
+    result = e.value.args[0]
+    assert result['msg'].startswith('Failed to fetch logbundles from 1 of 3 hosts: Failed to fetch logbundle from https://esxi02/')
+    assert result['bundles'] == [
+        dict(esxi_hostname='esxi01', dest=str(tmp_path / 'esxi01.tgz'), size=10),
+        dict(esxi_hostname='esxi03', dest=str(tmp_path / 'esxi03.tgz'), size=5),
+    ]
+    assert sorted(os.listdir(str(tmp_path))) == ['esxi01.tgz', 'esxi03.tgz']
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from unittest import mock
+
+import pytest
+
+pyvmomi = pytest.importorskip('pyVmomi')
+
+from ansible_collections.community.vmware.plugins.module_utils import vmware as vmware_module_utils
+from ansible_collections.community.vmware.plugins.modules import vmware_vm_info
+from ansible_collections.community.vmware.tests.unit.mock.pyvmomi_stub import RecordingStub
+
+
+SHOW_ALL = dict(
+    vm_type='all', vm_name=None, folder=None, show_attribute=True, show_cluster=True, show_datacenter=True,
+    show_datastore=True, show_folder=True, show_esxi_hostname=True, show_mac_address=True, show_net=True,
+    show_resource_pool=True, show_tag=False, show_allocated=True,
+)
+
+
+def record_inventory(stub, count):
+    """
+    Record a datacenter with a cluster, one host and count virtual machines. Every fifth VM is a template,
+    odd ones are in a subfolder and powered on a host, VMs whose index is a multiple of 4 are in the root resource pool.
+    """
+    vim = pyvmomi.vim
+    root = stub.service_content.rootFolder
+    stub.properties[root._moId] = {'name': 'Datacenters'}
+    datacenter = stub.add(vim.Datacenter, 'datacenter-1', name='DC1', parent=root)
+    vm_folder = stub.add(vim.Folder, 'group-v1', name='vm', parent=datacenter)
+    sub_folder = stub.add(vim.Folder, 'group-v2', name='sub', parent=vm_folder)
+    host_folder = stub.add(vim.Folder, 'group-h1', name='host', parent=datacenter)
+    cluster = stub.add(vim.ClusterComputeResource, 'domain-c1', name='CL1', parent=host_folder)
+    root_pool = stub.add(vim.ResourcePool, 'resgroup-1', name='Resources', parent=cluster, owner=cluster)
+    pool = stub.add(vim.ResourcePool, 'resgroup-2', name='rp2', parent=root_pool, owner=cluster)
+    stub.properties[cluster._moId]['resourcePool'] = root_pool
+    host = stub.add(vim.HostSystem, 'host-1', name='esx1', parent=cluster,
+                    summary=vim.host.Summary(config=vim.host.Summary.ConfigSummary(name='esx1.local')))
+    stub.properties[root._moId]['childEntity'] = [datacenter]
+
+    for i in range(count):
+        nic = vim.vm.device.VirtualVmxnet3(key=4000, macAddress='00:50:56:00:00:%02x' % i)
+        disk = vim.vm.device.VirtualDisk(key=2000, capacityInBytes=1024 * i)
+        config = vim.vm.ConfigInfo(
+            name='vm%d' % i, template=i % 5 == 0,
+            hardware=vim.vm.VirtualHardware(numCPU=2, memoryMB=512, device=[nic, disk]),
+            datastoreUrl=[vim.vm.ConfigInfo.DatastoreUrlPair(name='ds1', url='/vmfs/volumes/ds1')],
+        )
+        summary = vim.vm.Summary(
+            config=vim.vm.Summary.ConfigSummary(name='vm%d' % i, guestFullName='Linux', uuid='uuid-%d' % i, instanceUuid='instance-%d' % i),
+            runtime=vim.vm.RuntimeInfo(powerState='poweredOn', host=host if i % 2 else None),
+            guest=vim.vm.Summary.GuestSummary(ipAddress='10.0.0.%d' % i if i % 2 else None),
+        )
+        guest = vim.vm.GuestInfo(net=[vim.vm.GuestInfo.NicInfo(
+            macAddress=nic.macAddress,
+            ipConfig=vim.net.IpConfigInfo(ipAddress=[vim.net.IpConfigInfo.IpAddress(ipAddress='10.0.0.%d' % i, prefixLength=24)]),
+        )])
+        stub.add(vim.VirtualMachine, 'vm-%d' % i, name='vm%d' % i, parent=sub_folder if i % 2 else vm_folder,
+                 config=config, summary=summary, guest=guest, resourcePool=root_pool if i % 4 == 0 else pool,
+                 customValue=[vim.CustomFieldsManager.StringValue(key=1, value='owner%d' % i)])
+    return stub
+
+
+def get_virtual_machines(stub, **params):
+    vmware_module_utils.ConnectionIndexes.of(stub.service_content).clear()
+    vm_info = vmware_vm_info.VmwareVmInfo.__new__(vmware_vm_info.VmwareVmInfo)
+    vm_info.params = dict(SHOW_ALL, **params)
+    vm_info.module = mock.Mock(params=vm_info.params)
+    vm_info.content = stub.service_content
+    vm_info.custom_field_mgr = [pyvmomi.vim.CustomFieldsManager.FieldDef(key=1, name='owner')]
+    vm_info.host_names = None
+    stub.reset()
+    return vm_info.get_virtual_machines()
+
+
+def test_virtual_machines():
+    """ Facts of every virtual machine, retrieved in a number of round trips independent of the number of VMs """
+    stub = record_inventory(RecordingStub(), 12)
+
+    virtual_machines = get_virtual_machines(stub)
+
+    assert [vm['guest_name'] for vm in virtual_machines] == ['vm%d' % i for i in range(12)]
+    assert virtual_machines[0] == {
+        'guest_name': 'vm0',
+        'guest_fullname': 'Linux',
+        'power_state': 'poweredOn',
+        'ip_address': '',
+        'mac_address': ['00:50:56:00:00:00'],
+        'uuid': 'uuid-0',
+        'instance_uuid': 'instance-0',
+        'vm_network': {'00:50:56:00:00:00': {'ipv4': ['10.0.0.0/24'], 'ipv6': []}},
+        'esxi_hostname': None,
+        'datacenter': 'DC1',
+        'cluster': None,
+        'resource_pool': None,
+        'attributes': {'owner': 'owner0'},
+        'tags': [],
+        'folder': '/DC1/vm',
+        'moid': 'vm-0',
+        'datastore_url': [{'name': 'ds1', 'url': '/vmfs/volumes/ds1'}],
+        'allocated': {'cpu': 2, 'memory': 512, 'storage': 0},
+    }
+    assert virtual_machines[1] == dict(
+        virtual_machines[0],
+        guest_name='vm1',
+        ip_address='10.0.0.1',
+        mac_address=['00:50:56:00:00:01'],
+        uuid='uuid-1',
+        instance_uuid='instance-1',
+        vm_network={'00:50:56:00:00:01': {'ipv4': ['10.0.0.1/24'], 'ipv6': []}},
+        esxi_hostname='esx1.local',
+        cluster='CL1',
+        resource_pool='rp2',
+        attributes={'owner': 'owner1'},
+        folder='/DC1/vm/sub',
+        moid='vm-1',
+        allocated={'cpu': 2, 'memory': 512, 'storage': 1024},
+    )
+    # the root resource pool of a cluster is not reported
+    assert [vm['resource_pool'] for vm in virtual_machines[4:6]] == [None, 'rp2']
+
+    larger_stub = record_inventory(RecordingStub(), 24)
+    assert len(get_virtual_machines(larger_stub)) == 24
+    assert larger_stub.round_trips == stub.round_trips
+
+
+@pytest.mark.parametrize('vm_type, names', [
+    ('vm', ['vm1', 'vm2', 'vm3', 'vm4', 'vm6', 'vm7', 'vm8', 'vm9', 'vm11']),
+    ('template', ['vm0', 'vm5', 'vm10']),
+])
+def test_virtual_machines_vm_type(vm_type, names):
+    """ Virtual machines and templates are told apart """
+    stub = record_inventory(RecordingStub(), 12)
+
+    assert [vm['guest_name'] for vm in get_virtual_machines(stub, vm_type=vm_type)] == names
+
+
+def test_virtual_machines_hidden_facts():
+    """ Facts which are not requested are left empty """
+    stub = record_inventory(RecordingStub(), 2)
+
+    virtual_machine = get_virtual_machines(
+        stub, show_attribute=False, show_cluster=False, show_datacenter=False, show_datastore=False, show_folder=False,
+        show_esxi_hostname=False, show_mac_address=False, show_net=False, show_resource_pool=False, show_allocated=False,
+    )[1]
+
+    assert virtual_machine == {
+        'guest_name': 'vm1',
+        'guest_fullname': 'Linux',
+        'power_state': 'poweredOn',
+        'ip_address': '10.0.0.1',
+        'mac_address': [],
+        'uuid': 'uuid-1',
+        'instance_uuid': 'instance-1',
+        'vm_network': {},
+        'esxi_hostname': None,
+        'datacenter': None,
+        'cluster': None,
+        'resource_pool': None,
+        'attributes': {},
+        'tags': [],
+        'folder': None,
+        'moid': 'vm-1',
+        'datastore_url': [],
+        'allocated': {},
+    }
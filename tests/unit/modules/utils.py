@@ -4,6 +4,7 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import contextlib
 import json
 import unittest
 
@@ -12,6 +13,11 @@ from unittest.mock import patch
 from ansible.module_utils import basic
 from ansible.module_utils.common.text.converters import to_bytes
 
+try:
+    from ansible.module_utils.testing import patch_module_args as _patch_module_args
+except ImportError:
+    _patch_module_args = None
+
 
 def set_module_args(args):
     if '_ansible_remote_tmp' not in args:
@@ -23,6 +29,17 @@ def set_module_args(args):
     basic._ANSIBLE_ARGS = to_bytes(args)
 
 
+@contextlib.contextmanager
+def patch_module_args(args):
+    """ Context manager setting the module arguments, for ansible-core versions with and without serialization profiles """
+    if _patch_module_args is not None:
+        with _patch_module_args(args):
+            yield
+    else:
+        set_module_args(args)
+        yield
+
+
 class AnsibleExitJson(Exception):
     pass
 
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import threading
+
+import pytest
+
+pyvmomi = pytest.importorskip('pyVmomi')
+
+from ansible_collections.community.vmware.plugins.inventory import vmware_vm_inventory
+from ansible_collections.community.vmware.plugins.plugin_utils import inventory as inventory_utils
+from ansible_collections.community.vmware.tests.unit.mock.pyvmomi_stub import RecordingStub
+
+
+class OverlapStub(RecordingStub):
+    """ Recording stub whose calls of one method only return once a given number of them are in flight """
+
+    def __init__(self, method, parties):
+        super(OverlapStub, self).__init__()
+        self.method = method
+        # a serial caller breaks the barrier after the timeout instead of hanging the test
+        self.barrier = threading.Barrier(parties, timeout=10)
+
+    def InvokeMethod(self, mo, info, args):
+        if info.name == self.method:
+            self.barrier.wait()
+        return super(OverlapStub, self).InvokeMethod(mo, info, args)
+
+
+def record_vms(stub, count):
+    vim = pyvmomi.vim
+    for i in range(count):
+        stub.add(vim.VirtualMachine, 'vm-%d' % i, name='vm%d' % i)
+    return stub
+
+
+def get_inventory(stub):
+    pyv = inventory_utils.BaseVMwareInventory('vcenter', 'user', 'pass', 443, False, False, None)
+    pyv.content = stub.service_content
+    return pyv
+
+
+def test_iter_managed_objects_properties_pages():
+    """ Objects are retrieved page by page with RetrievePropertiesEx """
+    stub = record_vms(RecordingStub(), 25)
+    pyv = get_inventory(stub)
+
+    pages = list(pyv.iter_managed_objects_properties(pyvmomi.vim.VirtualMachine, properties=['name'], page_size=10))
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert [obj.propSet[0].val for page in pages for obj in page] == ['vm%d' % i for i in range(25)]
+    assert [call[1] for call in stub.calls if 'RetrieveProperties' in call[1]] == [
+        'RetrievePropertiesEx', 'ContinueRetrievePropertiesEx', 'ContinueRetrievePropertiesEx',
+    ]
+    assert len(pyv.get_managed_objects_properties(pyvmomi.vim.VirtualMachine, properties=['name'])) == 25
+
+
+def test_retrieve_properties_paged_cancel():
+    """ The server side result set is released when the caller stops early """
+    stub = record_vms(RecordingStub(), 25)
+    pyv = get_inventory(stub)
+
+    pages = pyv.iter_managed_objects_properties(pyvmomi.vim.VirtualMachine, properties=['name'], page_size=10)
+    assert len(next(pages)) == 10
+    pages.close()
+
+    assert stub.calls[-1][1] == 'CancelRetrievePropertiesEx'
+    assert not [key for key in stub.properties if key.startswith('token-')]
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_resources_max_workers(max_workers):
+    """ Containers from the resources option are looked up concurrently and merged in a fixed order """
+    vim = pyvmomi.vim
+    stub = record_vms(RecordingStub(), 5)
+    for i in range(8):
+        stub.add(vim.Datacenter, 'datacenter-%d' % i, name='DC%d' % i)
+    pyv = get_inventory(stub)
+    pyv.max_workers = max_workers
+
+    objects = pyv.get_managed_objects_properties(
+        vim.VirtualMachine, properties=['name'], resources=[{'datacenter': ['DC%d' % i for i in range(8)]}])
+
+    # the stub does not scope container views, every datacenter reports all VMs
+    assert [obj.propSet[0].val for obj in objects] == ['vm%d' % i for i in range(5)] * 8
+    assert len([call for call in stub.calls if call[1] == 'Destroy']) == 1
+    assert len([call for call in stub.calls if call[1] == 'RetrievePropertiesEx']) == (8 if max_workers > 1 else 1)
+
+
+def get_vm_inventory(stub):
+    pyv = vmware_vm_inventory.BaseVMwareInventory('vcenter', 'user', 'pass', 443, False, False, None, None)
+    pyv.content = stub.service_content
+    return pyv
+
+
+@pytest.mark.parametrize('get_pyv', [get_inventory, get_vm_inventory])
+@pytest.mark.parametrize('method, resources', [
+    # one retrieval per datacenter
+    ('RetrievePropertiesEx', [{'datacenter': ['DC0', 'DC1', 'DC2']}]),
+    # sibling filters
+    ('RetrieveContents', [{'datacenter': ['DC0']}, {'datacenter': ['DC1']}, {'datacenter': ['DC2']}]),
+])
+def test_resources_overlap(get_pyv, method, resources):
+    """ Sibling filters and the retrievals of the objects of every container run at the same time """
+    vim = pyvmomi.vim
+    stub = record_vms(OverlapStub(method, 3), 5)
+    for i in range(3):
+        stub.add(vim.Datacenter, 'datacenter-%d' % i, name='DC%d' % i)
+    pyv = get_pyv(stub)
+    pyv.max_workers = 4
+
+    objects = pyv.get_managed_objects_properties(vim.VirtualMachine, properties=['name'], resources=resources, strict=True)
+
+    assert [obj.propSet[0].val for obj in objects] == ['vm%d' % i for i in range(5)] * 3
+    assert not stub.barrier.broken
+
+
+def test_concurrent_map_nested():
+    """ Results come in input order and nested calls run in the thread of the outer call """
+    def work(item):
+        thread = threading.get_ident()
+        inner = list(inventory_utils.concurrent_map(lambda i: (item * 10 + i, threading.get_ident()), range(3), 4))
+        return [value for value, dummy in inner], set(ident for dummy, ident in inner) == {thread}, thread
+
+    results = list(inventory_utils.concurrent_map(work, range(6), 2))
+
+    assert [values for values, dummy, dummy in results] == [[i * 10, i * 10 + 1, i * 10 + 2] for i in range(6)]
+    assert all(same_thread for dummy, same_thread, dummy in results)
+    assert threading.get_ident() not in set(thread for dummy, dummy, thread in results)
+
+
+def legacy_parse_vim_property(vim_prop):
+    """ Property parser used before the per type lookup caches, kept as reference """
+    from pyVmomi import Iso8601
+    from pyVmomi.VmomiSupport import DataObject
+    prop_type = type(vim_prop).__name__
+    if prop_type.startswith(("vim", "vmodl", "Link")):
+        if isinstance(vim_prop, DataObject):
+            return dict((prop.name, legacy_parse_vim_property(getattr(vim_prop, prop.name)))
+                        for prop in vim_prop._GetPropertyList()
+                        if prop.name not in ["dynamicProperty", "dynamicType", "managedObjectType"])
+        if isinstance(vim_prop, list):
+            return [legacy_parse_vim_property(prop) for prop in vim_prop]
+        return vim_prop.__str__()
+    elif prop_type == "datetime":
+        return Iso8601.ISO8601Format(vim_prop)
+    elif prop_type == "long":
+        return int(vim_prop)
+    elif prop_type == "long[]":
+        return [int(x) for x in vim_prop]
+    elif isinstance(vim_prop, list):
+        return [legacy_parse_vim_property(x) for x in vim_prop]
+    elif prop_type in ["bool", "int", "NoneType", "dict"]:
+        return vim_prop
+    return str(vim_prop)
+
+
+def legacy_to_nested_dict(vm_properties):
+    host_properties = {}
+    for vm_prop_name, vm_prop_val in vm_properties.items():
+        prop_dict = legacy_parse_vim_property(vm_prop_val)
+        for k in reversed(vm_prop_name.split(".")):
+            prop_dict = {k: prop_dict}
+        host_properties = inventory_utils.in_place_merge(host_properties, prop_dict)
+    return host_properties
+
+
+def legacy_to_flatten_dict(d, parent_key="", sep="."):
+    items = []
+    for k, v in d.items():
+        new_key = parent_key + sep + k if parent_key else k
+        if v and isinstance(v, dict):
+            items.extend(legacy_to_flatten_dict(v, new_key, sep=sep).items())
+        else:
+            items.append((new_key, v))
+    return dict(items)
+
+
+def synthetic_vm_properties(i):
+    """ Properties of a virtual machine as retrieved by the VM inventory plugin """
+    import datetime
+    vim = pyvmomi.vim
+    devices = [
+        vim.vm.device.VirtualDisk(
+            key=2000 + d, capacityInKB=1024 * 1024, unitNumber=d,
+            deviceInfo=vim.Description(label='Hard disk %d' % d, summary='1 GB'),
+            backing=vim.vm.device.VirtualDisk.FlatVer2BackingInfo(fileName='[ds0] vm%d/vm%d_%d.vmdk' % (i, i, d),
+                                                                  diskMode='persistent', thinProvisioned=True),
+        ) for d in range(4)
+    ] + [
+        vim.vm.device.VirtualVmxnet3(
+            key=4000, macAddress='00:50:56:00:00:%02x' % (i % 256), addressType='assigned',
+            deviceInfo=vim.Description(label='Network adapter 1', summary='VM Network'),
+            backing=vim.vm.device.VirtualEthernetCard.NetworkBackingInfo(deviceName='VM Network'),
+        )
+    ]
+    return {
+        'name': 'vm%d' % i,
+        'config.cpuHotAddEnabled': True,
+        'config.name': 'vm%d' % i,
+        'config.uuid': 'uuid-%d' % i,
+        'config.hardware': vim.vm.VirtualHardware(numCPU=2, numCoresPerSocket=1, memoryMB=4096, device=devices),
+        'guest': vim.vm.GuestInfo(
+            toolsRunningStatus='guestToolsRunning', ipAddress='10.0.%d.%d' % (i // 256, i % 256),
+            net=[vim.vm.GuestInfo.NicInfo(deviceConfigId=4000, ipAddress=['10.0.%d.%d' % (i // 256, i % 256)])],
+        ),
+        'runtime': vim.vm.RuntimeInfo(
+            powerState='poweredOn', connectionState='connected', maxMemoryUsage=4096,
+            bootTime=datetime.datetime(2026, 1, 1, 12, 0, 0), host=vim.HostSystem('host-1'),
+        ),
+        'summary.runtime.powerState': vim.VirtualMachinePowerState.poweredOn,
+        'summary.storage.committed': pyvmomi.VmomiSupport.long(1024 ** 3),
+        'summary.config.name': 'vm%d' % i,
+    }
+
+
+def test_property_conversion():
+    """ Conversions match the reference implementation, including merges of nested properties """
+    for props in (synthetic_vm_properties(0), dict(reversed(list(synthetic_vm_properties(1).items())))):
+        nested = inventory_utils.to_nested_dict(props)
+        assert nested == legacy_to_nested_dict(props)
+        assert inventory_utils.to_flatten_dict(nested) == legacy_to_flatten_dict(nested)
+    assert nested['runtime']['bootTime'] == '2026-01-01T12:00:00Z'
+    assert nested['summary']['storage']['committed'] == 1024 ** 3
+    assert nested['config']['hardware']['device'][0]['backing']['fileName'] == '[ds0] vm1/vm1_0.vmdk'
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import copy
+
+from unittest import mock
+
+import pytest
+
+pyvmomi = pytest.importorskip('pyVmomi')
+
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+
+try:
+    from ansible.template import trust_as_template
+except ImportError:
+    # ansible-core before 2.19 renders any template
+    def trust_as_template(value):
+        return value
+
+from ansible_collections.community.vmware.plugins.inventory import vmware_vm_inventory
+from ansible_collections.community.vmware.tests.unit.mock.pyvmomi_stub import RecordingStub
+
+
+OPTIONS = dict(
+    properties=['name', 'config.uuid'],
+    subproperties=[],
+    hostnames=[trust_as_template('name')],
+    filters=[],
+    resources=[],
+    strict=True,
+    compose={'ansible_host': trust_as_template('name')},
+    groups={},
+    keyed_groups=[],
+    with_path=False,
+    with_sanitized_property_name=False,
+    with_nested_properties=True,
+    enable_backward_compatibility=False,
+    page_size=1000,
+)
+
+
+def record_vms(stub, count):
+    vim = pyvmomi.vim
+    for i in range(count):
+        stub.add(vim.VirtualMachine, 'vm-%d' % i, name='vm%d' % i,
+                 config=vim.vm.ConfigInfo(uuid='uuid-%d' % i),
+                 runtime=vim.vm.RuntimeInfo(connectionState='connected'))
+    return stub
+
+
+def get_plugin(stub, resumed=True):
+    """ Inventory plugin of a new run, connected to the stub """
+    stub.cookie = 'vmware_soap_session="52a1"'
+    stub.version = 'vim.version.version13'
+    plugin = vmware_vm_inventory.InventoryModule()
+    plugin.inventory = InventoryData()
+    plugin.templar = Templar(loader=DataLoader())
+    plugin.get_option = lambda option: copy.deepcopy(OPTIONS[option])
+    plugin.pyv = vmware_vm_inventory.BaseVMwareInventory(
+        'vcenter', 'user', 'pass', 443, False, False, None, None, keep_session=True)
+    plugin.pyv.si = mock.Mock(_stub=stub)
+    plugin.pyv.content = stub.service_content
+    plugin.pyv.resumed = resumed
+    return plugin
+
+
+def initial_load(stub):
+    hostvars, state = get_plugin(stub)._populate_from_source(incremental=True)
+    stub.reset()
+    return hostvars, state
+
+
+def refresh(stub, hostvars, state, resumed=True):
+    plugin = get_plugin(stub, resumed=resumed)
+    hostvars, state = plugin._refresh_from_updates(copy.deepcopy(hostvars), state)
+    return plugin, hostvars, state
+
+
+def test_initial_load():
+    """ The first run reads all virtual machines through a collector kept for the next runs """
+    stub = record_vms(RecordingStub(), 3)
+
+    plugin = get_plugin(stub)
+    hostvars, state = plugin._populate_from_source(incremental=True)
+
+    assert sorted(hostvars) == ['vm0', 'vm1', 'vm2']
+    assert hostvars['vm1']['config'] == {'uuid': 'uuid-1'}
+    assert sorted(plugin.inventory.hosts) == ['vm0', 'vm1', 'vm2']
+    assert state['hosts'] == {'vm-0': 'vm0', 'vm-1': 'vm1', 'vm-2': 'vm2'}
+    assert state['session'] == {'cookie': stub.cookie, 'version': stub.version}
+    assert state['collector'] in stub.properties
+    assert [call[1] for call in stub.calls] == [
+        'CreateContainerView', 'CreatePropertyCollector', 'CreateFilter', 'WaitForUpdatesEx',
+    ]
+
+
+def test_initial_load_paged():
+    """ The first run reads the virtual machines page by page """
+    stub = record_vms(RecordingStub(), 5)
+
+    plugin = get_plugin(stub)
+    plugin.get_option = lambda option: 2 if option == 'page_size' else copy.deepcopy(OPTIONS[option])
+    hostvars, state = plugin._populate_from_source(incremental=True)
+
+    assert sorted(hostvars) == ['vm0', 'vm1', 'vm2', 'vm3', 'vm4']
+    assert state['hosts'] == dict(('vm-%d' % i, 'vm%d' % i) for i in range(5))
+    assert [call[1] for call in stub.calls].count('WaitForUpdatesEx') == 3
+
+    stub.reset()
+    stub.properties['vm-3']['name'] = 'vm3-renamed'
+    plugin, hostvars, new_state = refresh(stub, hostvars, state)
+    assert sorted(hostvars) == ['vm0', 'vm1', 'vm2', 'vm3-renamed', 'vm4']
+    assert [call[1] for call in stub.calls] == ['WaitForUpdatesEx', 'RetrieveContents']
+
+
+def test_refresh_changed_vm():
+    """ A refresh fetches the virtual machines which changed only """
+    stub = record_vms(RecordingStub(), 3)
+    hostvars, state = initial_load(stub)
+
+    stub.properties['vm-1']['name'] = 'vm1-renamed'
+    plugin, hostvars, new_state = refresh(stub, hostvars, state)
+
+    assert sorted(hostvars) == ['vm0', 'vm1-renamed', 'vm2']
+    assert sorted(plugin.inventory.hosts) == ['vm0', 'vm1-renamed', 'vm2']
+    assert new_state['hosts'] == {'vm-0': 'vm0', 'vm-1': 'vm1-renamed', 'vm-2': 'vm2'}
+    assert new_state['collector'] == state['collector']
+    assert new_state['version'] != state['version']
+    assert [call[1] for call in stub.calls] == ['WaitForUpdatesEx', 'RetrieveContents']
+
+    # nothing changed since
+    stub.reset()
+    plugin, unchanged_hostvars, dummy = refresh(stub, hostvars, new_state)
+    assert unchanged_hostvars == hostvars
+    assert [call[1] for call in stub.calls] == ['WaitForUpdatesEx']
+
+
+def test_refresh_removed_vm():
+    """ A virtual machine which left the inventory is dropped from the cached hostvars """
+    stub = record_vms(RecordingStub(), 3)
+    hostvars, state = initial_load(stub)
+
+    stub.remove('vm-2')
+    plugin, hostvars, new_state = refresh(stub, hostvars, state)
+
+    assert sorted(hostvars) == ['vm0', 'vm1']
+    assert sorted(plugin.inventory.hosts) == ['vm0', 'vm1']
+    assert new_state['hosts'] == {'vm-0': 'vm0', 'vm-1': 'vm1'}
+    assert [call[1] for call in stub.calls] == ['WaitForUpdatesEx']
+
+
+@pytest.mark.parametrize('expired', ['collector', 'session'])
+def test_refresh_fallback(expired):
+    """ An expired collector or session falls back to fetching all virtual machines """
+    stub = record_vms(RecordingStub(), 3)
+    hostvars, state = initial_load(stub)
+
+    if expired == 'collector':
+        stub.properties.pop(state['collector'])
+    stub.properties['vm-0']['name'] = 'vm0-renamed'
+    plugin, hostvars, new_state = refresh(stub, hostvars, state, resumed=expired != 'session')
+
+    assert sorted(hostvars) == ['vm0-renamed', 'vm1', 'vm2']
+    assert sorted(plugin.inventory.hosts) == ['vm0-renamed', 'vm1', 'vm2']
+    assert new_state['collector'] != state['collector']
+    assert new_state['collector'] in stub.properties
+    assert 'CreatePropertyCollector' in [call[1] for call in stub.calls]
+
+
+def test_watch_destroys_collector_on_failure():
+    """ The new collector is destroyed whatever the failure """
+    stub = record_vms(RecordingStub(), 3)
+    plugin = get_plugin(stub)
+
+    def fail():
+        raise pyvmomi.vmodl.fault.SystemError(reason='boom')
+
+    stub.timeline = [fail]
+    with pytest.raises(pyvmomi.vmodl.fault.SystemError):
+        list(plugin.pyv.watch_managed_objects_properties(pyvmomi.vim.VirtualMachine, properties=['name']))
+
+    collectors = [call[0] for call in stub.calls if call[1] == 'CreatePropertyCollector']
+    assert stub.calls[-1][1] == 'Destroy'
+    assert not [key for key in stub.properties if key.startswith('session-collector')]
+    assert len(collectors) == 1
+
+
+def test_refresh_fallback_destroys_collector():
+    """ A collector which can not be resumed is destroyed before it is replaced """
+    stub = record_vms(RecordingStub(), 3)
+    hostvars, state = initial_load(stub)
+
+    def fail():
+        raise pyvmomi.vmodl.query.InvalidCollectorVersion()
+
+    stub.timeline = [fail]
+    plugin, hostvars, new_state = refresh(stub, hostvars, state)
+
+    assert sorted(hostvars) == ['vm0', 'vm1', 'vm2']
+    assert (state['collector'], 'Destroy') in stub.calls
+    assert state['collector'] not in stub.properties
+    assert new_state['collector'] in stub.properties
+
+
+def test_login_logs_out_replaced_session():
+    """ A session which can not be resumed is logged out once a new one is created """
+    pyv = vmware_vm_inventory.BaseVMwareInventory(
+        'vcenter', 'user', 'pass', 443, False, False, None, None, keep_session=True)
+    replaced = mock.Mock()
+    with mock.patch.object(pyv, 'check_requirements'), \
+            mock.patch.object(pyv, '_resume_session', return_value=None), \
+            mock.patch.object(pyv, '_login', return_value=(mock.Mock(), mock.Mock())), \
+            mock.patch.object(pyv, '_session_service_instance', return_value=replaced) as session_service_instance:
+        pyv.do_login(session={'cookie': 'vmware_soap_session="52a1"', 'version': 'vim.version.version13'})
+
+    assert not pyv.resumed
+    session_service_instance.assert_called_once_with({'cookie': 'vmware_soap_session="52a1"', 'version': 'vim.version.version13'})
+    replaced.content.sessionManager.Logout.assert_called_once_with()